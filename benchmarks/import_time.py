@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+Benchmark the time to import thermosteam and to create the first Chemical
+object in a new process (data tables are loaded on first lookup).
+
+Run with `python benchmarks/import_time.py [N]`, where N is the number of
+new processes to time (defaults to 5); the median times are reported.
+
+"""
+import sys
+import subprocess
+from statistics import median
+
+script = """
+import time
+start = time.perf_counter()
+import thermosteam
+imported = time.perf_counter()
+thermosteam.Chemical('Water')
+created = time.perf_counter()
+print(imported - start, created - imported)
+"""
+
+def time_import(N=5):
+    """Return median times [s] to import thermosteam and to create the first 
+    Chemical object in new processes."""
+    import_times = []
+    chemical_times = []
+    for i in range(N):
+        output = subprocess.run([sys.executable, '-c', script], check=True,
+                                capture_output=True, text=True).stdout
+        import_time, chemical_time = map(float, output.split())
+        import_times.append(import_time)
+        chemical_times.append(chemical_time)
+    return median(import_times), median(chemical_times)
+
+if __name__ == '__main__':
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    import_time, chemical_time = time_import(N)
+    print(f"import thermosteam: {import_time:.3f} s")
+    print(f"first Chemical('Water'): {chemical_time:.3f} s")
@@ -20,7 +20,7 @@ setup(
                       'colorpalette>=0.3.1', 'biosteam>=2.20.21',
                       'pandas>=0.25.2', 'matplotlib>=3.1.1',
                       'numpy>=1.18.1', 'xlrd==1.2.0',
-                      'openpyxl>=3.0.0', 'free_properties>=0.2.5',
+                      'openpyxl>=3.0.0',
                       'flexsolve==0.3.29', 'pyglet',
                       'numba>=0.50.0'],
     package_data={
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+P = 101325.
+
+def handles(chemical):
+    return (chemical.Psat, chemical.Hvap, chemical.sigma, chemical.epsilon,
+            chemical.Cn.s, chemical.Cn.l, chemical.Cn.g, chemical.V.l, 
+            chemical.V.g, chemical.kappa.l, chemical.kappa.g, chemical.mu.l, 
+            chemical.mu.g)
+
+def scalar_values(f, *args):
+    # Return values evaluated element-wise and whether they are defined
+    values = []
+    defined = []
+    for i in zip(*np.broadcast_arrays(*args)):
+        try: 
+            value = f(*[float(j) for j in i])
+            value = float(value)
+        except Exception: 
+            value = np.nan
+        values.append(value)
+        defined.append(np.isfinite(value))
+    return np.array(values), np.array(defined)
+
+def with_pressure(handle, f):
+    from thermosteam.base import TPDependentModelHandle
+    if isinstance(handle, TPDependentModelHandle): 
+        return lambda *args: f(*args, P)
+    else:
+        return f
+    
+def test_array_evaluation_matches_scalars():
+    import thermosteam as tmo
+    Ts = np.linspace(150., 1200., 43)
+    for ID in ('Water', 'Ethanol', 'Glycerol', 'CO2'):
+        chemical = tmo.Chemical(ID)
+        for handle in handles(chemical):
+            f = with_pressure(handle, handle)
+            values, defined = scalar_values(f, Ts)
+            if not defined.any(): continue
+            assert_allclose(f(Ts[defined]), values[defined], rtol=1e-12,
+                            err_msg=f"{ID} {handle}")
+
+def test_array_evaluation_with_floating_point_errors():
+    import thermosteam as tmo
+    @tmo.functor(var='Psat')
+    def Root_test(T, Tc):
+        return 1e5 * abs((Tc - T) ** 0.5)
+    f = Root_test.functor(Tc=500.)
+    Ts = np.array([300., 400., 600.])
+    expected = [1e5 * abs((500. - T) ** 0.5) for T in Ts.tolist()]
+    with np.errstate(invalid='raise'):
+        # Numpy raises an error at the last element, but Python does not
+        with pytest.raises(FloatingPointError): f.function(Ts, 500.)
+        assert_allclose(f(Ts), expected, rtol=1e-12)
+        assert_allclose(tmo.base.array_call(f, Ts), expected, rtol=1e-12)
+        # Arrays are still used when possible
+        assert_allclose(f(Ts[:2]), expected[:2], rtol=1e-12)
+        assert type(f).vectorized is True
+        chemical = tmo.Chemical('Water')
+        model = chemical.epsilon._models[0]
+        Ts = np.linspace(model.Tmin or 273.15, 1000., 50)
+        values, defined = scalar_values(chemical.epsilon, Ts)
+        assert defined.sum() > 20
+        assert_allclose(chemical.epsilon(Ts[defined]), values[defined], rtol=1e-12)
+    
+def test_array_integrals_and_derivatives_match_scalars():
+    import thermosteam as tmo
+    Ts = np.linspace(200., 900., 29)
+    Ta = 298.15
+    for ID in ('Water', 'Ethanol', 'Glycerol'):
+        chemical = tmo.Chemical(ID)
+        for handle in handles(chemical):
+            for name in ('integrate_by_T', 'integrate_by_T_over_T'):
+                f = with_pressure(handle, getattr(handle, name))
+                values, defined = scalar_values(f, Ta, Ts)
+                if not defined.any(): continue
+                assert_allclose(f(np.full(defined.sum(), Ta), Ts[defined]), 
+                                values[defined], rtol=1e-9, atol=1e-9,
+                                err_msg=f"{ID} {handle} {name}")
+            f = with_pressure(handle, handle.differentiate_by_T)
+            values, defined = scalar_values(f, Ts)
+            if not defined.any(): continue
+            assert_allclose(f(Ts[defined]), values[defined], rtol=1e-6, 
+                            atol=1e-12, err_msg=f"{ID} {handle} derivative")
+
+if __name__ == '__main__':
+    test_array_evaluation_matches_scalars()
+    test_array_evaluation_with_floating_point_errors()
+    test_array_integrals_and_derivatives_match_scalars()
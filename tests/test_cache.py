@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+
+def test_unbounded_capacity():
+    from thermosteam.utils import LRUCache
+    cache = LRUCache(capacity=None)
+    for i in range(200): cache[i] = i
+    assert len(cache) == 200
+    assert cache.stats.evictions == 0
+    cache.resize(10)
+    assert list(cache) == list(range(190, 200))
+    assert cache.stats.evictions == 190
+    cache.resize(None)
+    assert cache.capacity is None
+    for i in range(50): cache[i] = i
+    assert len(cache) == 60
+    assert cache.stats.evictions == 190
+    
+def test_invalid_limits():
+    from thermosteam.utils import LRUCache
+    cache = LRUCache(capacity=2)
+    cache['a'] = 1
+    for capacity in (-1, 2.5, '2'):
+        with pytest.raises((ValueError, TypeError)): cache.resize(capacity)
+        with pytest.raises((ValueError, TypeError)): LRUCache(capacity)
+    with pytest.raises(ValueError): cache.resize(max_bytes=-1)
+    assert cache.capacity == 2 and cache.max_bytes is None
+    assert list(cache) == ['a']
+    
+if __name__ == '__main__':
+    test_unbounded_capacity()
+    test_invalid_limits()
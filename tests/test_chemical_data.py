@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import os
+import sys
+import pytest
+import subprocess
+import numpy as np
+from numpy.testing import assert_allclose
+
+def test_row_data_loads_on_first_lookup():
+    import pandas as pd
+    from thermosteam.chemicals.data import RowData
+    df = pd.DataFrame([[1., 2.], [3., 4.]], index=['64-17-5', '7732-18-5'],
+                      columns=['A', 'B'])
+    calls = []
+    def load():
+        calls.append(None)
+        return df.index, df.values, df.columns
+    data = RowData(loader=load)
+    assert not calls
+    assert '64-17-5' in data
+    assert len(calls) == 1
+    assert data.get('7732-18-5', 'B') == 4.
+    assert_allclose(data['64-17-5'], [1., 2.])
+    assert '50-00-0' not in data
+    with pytest.raises(KeyError): data['50-00-0']
+    assert len(calls) == 1
+    data = RowData(loader=load)
+    assert_allclose(data['7732-18-5'], [3., 4.])
+    data = RowData(loader=load)
+    assert data.get('64-17-5', 'A') == 1.
+    assert len(calls) == 3
+
+def test_row_data_bisection_index():
+    from thermosteam.chemicals.data import RowData
+    keys = np.array([b'64-17-5', b'7732-18-5'])
+    data = RowData(keys, np.array([[1., 2.], [3., 4.]]), ['A', 'B'])
+    assert data.index == {'64-17-5': 0, '7732-18-5': 1}
+    assert data.get('7732-18-5', 'A') == 3.
+    assert_allclose(data['64-17-5'], [1., 2.])
+    assert '50-00-0' not in data and '7732-18-6' not in data
+    assert 'é' not in data
+    with pytest.raises(KeyError): data['50-00-0']
+
+def test_lazy_mapping_loads_on_first_lookup():
+    from thermosteam.chemicals.data import LazyMapping
+    calls = []
+    def load():
+        calls.append(None)
+        return {'64-17-5': 1, '7732-18-5': 2}
+    mapping = LazyMapping(load)
+    assert not calls
+    assert mapping['64-17-5'] == 1
+    assert mapping.get('50-00-0') is None
+    assert '7732-18-5' in mapping
+    assert sorted(mapping) == ['64-17-5', '7732-18-5']
+    assert len(mapping) == 2
+    assert len(calls) == 1
+
+def test_lazy_tables_match_eager_tables():
+    from chemicals import volume, phase_change, miscdata
+    from thermosteam.chemicals import data
+    lazy = data.rho_data_COSTALD
+    eager = data.RowData(volume.rho_data_COSTALD.index,
+                         volume.rho_data_COSTALD.values,
+                         volume.rho_data_COSTALD.columns)
+    assert lazy.index == eager.index and lazy.columns == eager.columns
+    for CAS in ('64-17-5', '7732-18-5', '71-43-2', '50-00-0'):
+        assert (CAS in lazy) == (CAS in eager)
+        if CAS not in eager: continue
+        assert list(lazy[CAS]) == list(eager[CAS])
+        assert_allclose(lazy.get(CAS, 'Vchar'), eager.get(CAS, 'Vchar'))
+    df = phase_change.phase_change_data_Perrys2_150
+    lazy = data.phase_change_data_Perrys2_150
+    eager = data.RowData(df.index, phase_change.phase_change_values_Perrys2_150)
+    for CAS in ('64-17-5', '7732-18-5', '71-43-2'):
+        assert_allclose(lazy[CAS], eager[CAS], equal_nan=True)
+    assert_allclose(lazy.values, eager.values, equal_nan=True)
+    assert data.VDI_saturation_dict.data is miscdata.VDI_saturation_dict
+
+def test_database_tables_match_eager_tables(tmp_path):
+    import thermosteam as tmo
+    from chemicals import volume
+    from thermosteam.chemicals import data
+    file = data.build_database(str(tmp_path / 'chemicals.bin'))
+    table = data.load_database_table('rho_data_COSTALD')
+    assert table is None # Database is only read if set in the settings
+    tmo.settings.chemical_database = file
+    try:
+        index, values, columns = data.load_database_table('rho_data_COSTALD')
+    finally:
+        tmo.settings.chemical_database = None
+    mapped = data.RowData(index, values, columns)
+    df = volume.rho_data_COSTALD
+    for CAS in ('64-17-5', '7732-18-5', '71-43-2'):
+        for column in ('omega_SRK', 'Vchar'):
+            assert_allclose(mapped.get(CAS, column), df.at[CAS, column])
+        assert np.isnan(mapped.get(CAS, 'Chemical')) # Non-numeric entries
+    assert '50-00-0' not in mapped
+
+def test_import_does_not_load_tables():
+    script = (
+        "from thermosteam.chemicals import data\n"
+        "tables = [i for i in vars(data).values()\n"
+        "          if isinstance(i, (data.RowData, data.LazyMapping))]\n"
+        "assert tables and all(i._loader for i in tables)\n"
+        "assert all(i._data is None for i in tables\n"
+        "           if isinstance(i, data.LazyMapping))\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    subprocess.run([sys.executable, '-c', script], check=True, env=env)
+
+def test_import_time_benchmark():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.join(root, 'benchmarks'))
+    try:
+        from import_time import time_import
+    finally:
+        sys.path.remove(os.path.join(root, 'benchmarks'))
+    import_time, chemical_time = time_import(1)
+    assert import_time > 0 and chemical_time > 0
+
+if __name__ == '__main__':
+    test_row_data_loads_on_first_lookup()
+    test_row_data_bisection_index()
+    test_lazy_mapping_loads_on_first_lookup()
+    test_lazy_tables_match_eager_tables()
+    import pathlib, tempfile
+    test_database_tables_match_eager_tables(pathlib.Path(tempfile.mkdtemp()))
+    test_import_does_not_load_tables()
+    test_import_time_benchmark()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+from numpy.testing import assert_allclose
+
+def test_memoized_subgroups_are_not_shared():
+    import thermosteam as tmo
+    chemicals = tmo.CompiledChemicals(['Water', 'Ethanol', 'Propane'], cache=True)
+    subgroup = chemicals.subgroup(['Propane', 'Water'])
+    subgroup.set_synonym('Water', 'H2O')
+    other = chemicals.subgroup(['Propane', 'Water'])
+    assert other is not subgroup
+    assert other.MW is subgroup.MW # Constant arrays are shared
+    assert not other.MW.flags.writeable
+    assert_allclose(other.MW, chemicals.MW[[2, 0]])
+    assert 'H2O' not in other.get_synonyms('Water')
+    with pytest.raises(AttributeError): other.H2O
+    with pytest.raises(Exception): other.index('H2O')
+    assert subgroup.index('H2O') == 1
+    assert 'H2O' not in chemicals.get_synonyms('Water')
+    # Synonyms set on the parent after memoization are kept
+    chemicals.subgroup(['Ethanol'])
+    chemicals.extended(['Methanol'])
+    chemicals.set_synonym('Ethanol', 'EtOH')
+    assert chemicals.subgroup(['Ethanol']).EtOH is chemicals.Ethanol
+    assert chemicals.extended(['Methanol']).EtOH is chemicals.Ethanol
+    
+def test_memoized_extensions_are_not_shared():
+    import thermosteam as tmo
+    chemicals = tmo.CompiledChemicals(['Water', 'Ethanol'], cache=True)
+    new = chemicals.extended(['Propane'])
+    new.set_synonym('Propane', 'C3H8')
+    other = chemicals.extended(['Propane'])
+    assert other is not new
+    assert other.tuple == new.tuple
+    assert other.MW is new.MW
+    assert 'C3H8' not in other.get_synonyms('Propane')
+    assert new.index('C3H8') == 2
+    
+def test_memoized_indices():
+    import thermosteam as tmo
+    chemicals = tmo.CompiledChemicals(['Water', 'Ethanol', 'Propane'], cache=True)
+    IDs = ('Propane', 'Water')
+    index = chemicals.get_index(IDs)
+    assert list(index) == [2, 0]
+    assert not index.flags.writeable
+    with pytest.raises(ValueError): index[0] = 1
+    assert chemicals.get_index(IDs) is index
+    
+    # Material indexers of the same chemicals and phases share index caches
+    tmo.settings.set_thermo(chemicals)
+    indexer = tmo.indexer.MaterialIndexer(l=[('Water', 1)], g=[('Ethanol', 1)])
+    other = tmo.indexer.MaterialIndexer(l=[('Propane', 1)], g=[('Water', 1)])
+    assert indexer._index_cache is other._index_cache
+    assert indexer._index_cache is chemicals._material_index_caches[('g', 'l')]
+    phase_index = indexer.get_index(('l', IDs))
+    assert other.get_index(('l', IDs)) is phase_index
+    assert phase_index[1] is index # Chemical indices are shared too
+    assert indexer.get_index(IDs).value is index
+    
+    # Copies of compiled chemicals do not share caches
+    subgroup = chemicals.subgroup(['Water', 'Propane'])
+    assert subgroup._material_index_caches is not chemicals._material_index_caches
+    assert subgroup._index_cache is not chemicals._index_cache
+    assert list(subgroup.get_index(IDs)) == [1, 0]
+    assert chemicals.get_index(IDs) is index
+    
+if __name__ == '__main__':
+    test_memoized_subgroups_are_not_shared()
+    test_memoized_extensions_are_not_shared()
+    test_memoized_indices()
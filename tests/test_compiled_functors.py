@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+def model_functors(chemical):
+    from thermosteam.base import TDependentModel
+    from thermosteam.base.functor import Functor
+    handles = (chemical.Psat, chemical.Hvap, chemical.Cn.l, chemical.Cn.g,
+               chemical.sigma, chemical.V.l, chemical.kappa.l, chemical.mu.l)
+    for handle in handles:
+        for model in handle._models:
+            if not isinstance(model, TDependentModel): continue
+            f = model.evaluate
+            if isinstance(f, Functor): yield model, f
+
+def original_value(f, T):
+    try: return f(T)
+    except Exception: return None
+
+def test_compiled_values_match_original_values():
+    import thermosteam as tmo
+    from thermosteam.base.functor import CompiledFunctor
+    families = set()
+    for ID in ('Water', 'Ethanol'):
+        chemical = tmo.Chemical(ID)
+        for model, f in model_functors(chemical):
+            compiled_f = f.compile()
+            if not isinstance(compiled_f, CompiledFunctor): continue
+            assert type(compiled_f).__name__ == type(f).__name__
+            families.add(type(f).__name__)
+            Tmin = max(model.Tmin, 200.)
+            Tmax = min(model.Tmax, 500.)
+            Ts = np.linspace(Tmin, Tmax, 5)
+            for T in Ts:
+                value = original_value(f, T)
+                if value is None: continue
+                assert_allclose(compiled_f(T), value, rtol=1e-12, 
+                                equal_nan=True, err_msg=repr(f))
+            assert_allclose(compiled_f(Ts), f(Ts), rtol=1e-12, equal_nan=True)
+    assert {'Antoine', 'Wagner_original', 'EQ101', 'EQ106', 'Zabransky_cubic',
+            'Poling', 'TRCCp', 'COSTALD', 'Somayajulu'}.issubset(families)
+
+def test_compiled_integral_functors():
+    import thermosteam as tmo
+    from thermosteam.base.functor import CompiledFunctor
+    coefficients = dict(a=7.7, b=4.6e-4, c=2.5e-6, d=-2e4)
+    for name in ('Perry_151_definite_integral', 
+                 'Perry_151_definite_integral_over_T'):
+        f = getattr(tmo.functors, name)(**coefficients)
+        compiled_f = f.compile()
+        assert isinstance(compiled_f, CompiledFunctor)
+        for Ta, Tb in [(298.15, 350.), (400., 300.), (300., 300.)]:
+            assert_allclose(compiled_f(Ta, Tb), f(Ta, Tb), rtol=1e-12, atol=1e-12)
+        Tb = np.array([350., 400.])
+        assert_allclose(compiled_f(298.15, Tb), f(298.15, Tb), rtol=1e-12)
+
+def test_compiled_functors_of_temperature_and_pressure():
+    import thermosteam as tmo
+    from thermosteam.base.functor import CompiledFunctor
+    @tmo.functor(var='V.l')
+    def Compressed_volume(T, P, a, b, c):
+        return a + b * T - c * P
+    f = Compressed_volume.functor(a=1e-5, b=1e-8, c=1e-15)
+    compiled_f = f.compile()
+    assert isinstance(compiled_f, CompiledFunctor)
+    assert compiled_f.compile() is compiled_f
+    assert_allclose(compiled_f(350., 1e6), f(350., 1e6), rtol=1e-15)
+    T = np.array([300., 350.])
+    P = np.array([1e5, 1e6])
+    assert_allclose(compiled_f(T, P), f(T, P), rtol=1e-15)
+
+def test_hooked_and_non_numeric_functors_are_not_compiled():
+    import thermosteam as tmo
+    from thermosteam.base.functor import CompiledFunctor
+    chemical = tmo.Chemical('Ethanol')
+    hooked = non_numeric = 0
+    for model, f in model_functors(chemical):
+        if f.hook:
+            assert f.compile() is f
+            hooked += 1
+        elif f.pack_parameters() is None:
+            assert f.compile() is f
+            non_numeric += 1
+    assert hooked and non_numeric
+    @tmo.functor(var='Psat')
+    def Labeled_Antoine(T, A, B, C, label):
+        return 10.0**(A - B / (T + C))
+    f = Labeled_Antoine.functor(A=10.116, B=1687.5, C=-42.98, label='water')
+    assert f.compile() is f
+    f = tmo.functors.Antoine(A=10.116, B=1687.5, C=-42.98)
+    f.hook = lambda T, data: 0.
+    assert f.compile() is f
+    N_compiled = chemical.V.l.compile_kernels()
+    for model in chemical.V.l._models:
+        f = model.evaluate
+        if getattr(f, 'hook', None): assert not isinstance(f, CompiledFunctor)
+    assert N_compiled and chemical.V.l.compile_kernels() == 0
+
+def test_compiled_functor_set_value():
+    import thermosteam as tmo
+    f = tmo.functors.Antoine(A=10.116, B=1687.5, C=-42.98)
+    compiled_f = f.compile()
+    compiled_f.set_value('B', 1700.)
+    f.set_value('B', 1700.)
+    assert compiled_f.B == 1700.
+    assert_allclose(compiled_f(373.15), f(373.15), rtol=1e-15)
+    compiled_f.set_value('D', 1.) # Not a parameter; ignored
+    assert_allclose(compiled_f(373.15), f(373.15), rtol=1e-15)
+    with pytest.raises(ValueError):
+        compiled_f.set_value('A', 'not a number')
+
+def test_compiled_functor_copy_and_pickle():
+    import pickle
+    import thermosteam as tmo
+    from thermosteam.base.functor import CompiledFunctor
+    from copy import copy
+    f = tmo.functors.Antoine(A=10.116, B=1687.5, C=-42.98)
+    compiled_f = f.compile()
+    other = copy(compiled_f)
+    assert type(other) is type(compiled_f)
+    other.set_value('A', 10.)
+    assert compiled_f.A == 10.116
+    assert_allclose(compiled_f(373.15), f(373.15), rtol=1e-15)
+    unpickled_f = pickle.loads(pickle.dumps(compiled_f))
+    assert type(unpickled_f) is type(f)
+    assert not isinstance(unpickled_f, CompiledFunctor)
+    assert 'parameters' not in unpickled_f.__dict__
+    assert_allclose(unpickled_f(373.15), f(373.15), rtol=1e-15)
+    chemical = tmo.Chemical('Water')
+    Psat = chemical.Psat(350.)
+    assert chemical.Psat.compile_kernels() > 0
+    chemical = pickle.loads(pickle.dumps(chemical))
+    assert_allclose(chemical.Psat(350.), Psat, rtol=1e-12)
+
+if __name__ == '__main__':
+    test_compiled_values_match_original_values()
+    test_compiled_integral_functors()
+    test_compiled_functors_of_temperature_and_pressure()
+    test_hooked_and_non_numeric_functors_are_not_compiled()
+    test_compiled_functor_set_value()
+    test_compiled_functor_copy_and_pickle()
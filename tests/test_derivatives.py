@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+def finite_difference(f, T):
+    # Fourth order central difference
+    h = 1e-4 * T
+    return (f(T - 2*h) - 8*f(T - h) + 8*f(T + h) - f(T + 2*h)) / (12 * h)
+
+def functor_subclasses(cls):
+    for i in cls.__subclasses__():
+        yield i
+        yield from functor_subclasses(i)
+
+def functors_with_derivatives():
+    import thermosteam as tmo
+    from thermosteam.base.functor import Functor
+    found = {}
+    for ID in ('Water', 'Ethanol', 'Methanol', 'Glycerol', 'CO2', 'Hexane',
+               'Toluene', 'Acetone', 'Methane', 'AceticAcid', 'Propane'):
+        chemical = tmo.Chemical(ID)
+        for handle in (chemical.Psat, chemical.Hvap, chemical.sigma, 
+                       chemical.Cn.s, chemical.Cn.l, chemical.Cn.g,
+                       chemical.V.s, chemical.V.l, chemical.kappa.l, 
+                       chemical.kappa.g, chemical.mu.l, chemical.mu.g):
+            for model in handle._models:
+                f = getattr(model, 'evaluate', None)
+                if isinstance(f, Functor) and f.derivative_by_T:
+                    found.setdefault(type(f), []).append((model, f))
+    return found
+
+def test_analytic_derivatives_match_finite_differences():
+    from inspect import signature
+    from thermosteam import functors
+    from thermosteam.base.functor import TFunctor
+    found = functors_with_derivatives()
+    # Registered functors are set in the functors module (compiled 
+    # subclasses are not)
+    registered = {i for i in functor_subclasses(TFunctor) 
+                  if i.derivative_by_T and getattr(functors, i.__name__, None) is i}
+    assert registered and registered.issubset(found), registered.difference(found)
+    for cls, functors in found.items():
+        # Hooks (e.g. unit conversions) are not part of registered derivatives
+        names = list(signature(cls.derivative_by_T).parameters)[1:]
+        tested = 0
+        for model, f in functors[:5]:
+            params = {i: f.__dict__[i] for i in names if i in f.__dict__}
+            function = lambda T: cls.function(T, **params)
+            Tmin = max(model.Tmin, 150.)
+            Tmax = min(model.Tmax, 1000.)
+            for T in np.linspace(Tmin, Tmax, 7)[1:-1].tolist():
+                try: expected = finite_difference(function, T)
+                except Exception: continue
+                if not np.isfinite(expected): continue
+                assert_allclose(cls.derivative_by_T(T, **params), expected, 
+                                rtol=1e-6, atol=1e-9 * abs(function(T)),
+                                err_msg=f"{cls.__name__} at {T} K")
+                if not f.hook: assert f.differentiate_by_T(T) == cls.derivative_by_T(T, **params)
+                tested += 1
+        assert tested, cls.__name__
+
+def test_array_derivatives_match_scalar_derivatives():
+    found = functors_with_derivatives()
+    for cls, functors in found.items():
+        model, f = functors[0]
+        if f.hook: continue
+        Ts = np.linspace(max(model.Tmin, 150.), min(model.Tmax, 1000.), 7)[1:-1]
+        expected = [f.differentiate_by_T(T) for T in Ts.tolist()]
+        assert_allclose(f.differentiate_by_T(Ts), expected, rtol=1e-12)
+
+def test_complex_step_fallback_for_hooked_functors():
+    import thermosteam as tmo
+    from math import exp
+    def dAntoine_dT(T, A, B, C):
+        return np.log(10.) * B / (T + C)**2 * 10.0**(A - B / (T + C))
+    @tmo.functor(var='Psat', derivative_by_T=dAntoine_dT)
+    def Hooked_Antoine(T, A, B, C):
+        return 10.0**(A - B / (T + C))
+    @tmo.functor(var='Psat', derivative_by_T=dAntoine_dT)
+    def Real_hooked_Antoine(T, A, B, C):
+        return 10.0**(A - B / (T + C))
+    params = dict(A=10.116, B=1687.5, C=-42.98)
+    T = 350.
+    expected = dAntoine_dT(T, **params)
+    f = Hooked_Antoine.functor(**params)
+    f.hook = lambda T, data: 10.0**(data['A'] - data['B'] / (T + data['C']))
+    assert Hooked_Antoine.functor.complex_step is None
+    assert_allclose(f.differentiate_by_T(T), expected, rtol=1e-12)
+    assert Hooked_Antoine.functor.complex_step is True
+    # Hooks that do not support complex numbers use central differences
+    f = Real_hooked_Antoine.functor(**params)
+    f.hook = lambda T, data: exp(np.log(10.) * (data['A'] - data['B'] / (T + data['C'])))
+    assert_allclose(f.differentiate_by_T(T), expected, rtol=1e-6)
+    assert Real_hooked_Antoine.functor.complex_step is False
+    assert_allclose(f.differentiate_by_T(np.array([T, T + 10.])), 
+                    [expected, dAntoine_dT(T + 10., **params)], rtol=1e-6)
+
+if __name__ == '__main__':
+    test_analytic_derivatives_match_finite_differences()
+    test_array_derivatives_match_scalar_derivatives()
+    test_complex_step_fallback_for_hooked_functors()
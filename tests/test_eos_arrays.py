@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+def eos_objects():
+    from thermosteam import eos
+    Tc, Pc, omega = 507.6, 3025000., 0.2975 # Hexane
+    yield eos.PR(Tc, Pc, omega, T=300., P=1e5)
+    yield eos.SRK(Tc, Pc, omega, T=300., P=1e5)
+    yield eos.RK(Tc, Pc, T=300., P=1e5)
+    yield eos.VDW(Tc, Pc, T=300., P=1e5)
+    yield eos.PRSV2(Tc, Pc, omega, T=300., P=1e5, kappa1=0.05, kappa2=0.8, kappa3=0.46)
+    yield eos.TWUPR(Tc, Pc, omega, T=300., P=1e5)
+    yield eos.TWUSRK(Tc, Pc, omega, T=300., P=1e5)
+
+def TP_grid():
+    # Includes liquids at low pressures, vapors, and single (supercritical) roots
+    Ts = np.array([180., 250., 300., 350., 400., 450., 500., 507., 550., 700.])
+    Ps = np.array([1., 1e2, 1e4, 1e5, 1e6, 3e6, 1e7, 5e7])
+    T, P = np.meshgrid(Ts, Ps)
+    return T.ravel(), P.ravel()
+
+def scalar_or_nan(f, *args):
+    try: return f(*args)
+    except Exception: return np.nan
+
+def test_volume_array_matches_volume():
+    T, P = TP_grid()
+    for eos in eos_objects():
+        defined = {}
+        for phase in ('l', 'g'):
+            expected = np.array([scalar_or_nan(eos.volume, *i, phase) for i in zip(T.tolist(), P.tolist())])
+            assert_allclose(eos.volume_array(T, P, phase), expected, rtol=1e-6, 
+                            equal_nan=True, err_msg=f"{type(eos).__name__} {phase}")
+            defined[phase] = np.isfinite(expected)
+        name = type(eos).__name__
+        assert defined['l'].sum() and defined['g'].sum(), name
+        assert (defined['l'] & defined['g']).any(), name # Two roots
+        assert (defined['l'] ^ defined['g']).any(), name # Single roots
+        liquid = defined['l'] & (P <= 1e2) & (T < 350.)
+        assert liquid.any() # Liquids at low pressures
+        
+def test_departures_array_matches_departures():
+    T, P = TP_grid()
+    for eos in eos_objects():
+        for phase in ('l', 'g'):
+            expected = [scalar_or_nan(eos.departures, *i, phase) for i in zip(T.tolist(), P.tolist())]
+            expected = np.array([(np.nan, np.nan) if i is np.nan else i for i in expected]).T
+            H_dep, S_dep = eos.departures_array(T, P, phase)
+            name = f"{type(eos).__name__} {phase}"
+            assert_allclose(H_dep, expected[0], rtol=1e-7, atol=1e-6, equal_nan=True, err_msg=name)
+            assert_allclose(S_dep, expected[1], rtol=1e-7, atol=1e-9, equal_nan=True, err_msg=name)
+
+def test_Psat_array_matches_Psat():
+    for eos in eos_objects():
+        Ts = np.linspace(0.2 * eos.Tc, eos.Tc, 50)
+        expected = [eos.Psat(T) for T in Ts.tolist()]
+        assert_allclose(eos.Psat_array(Ts), expected, rtol=1e-9, 
+                        err_msg=type(eos).__name__)
+
+if __name__ == '__main__':
+    test_volume_array_matches_volume()
+    test_departures_array_matches_departures()
+    test_Psat_array_matches_Psat()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+def test_saturation_table_accuracy():
+    from thermosteam.eos import PR, SRK, saturation_values
+    tol = 1e-6
+    for EOS in (PR, SRK):
+        eos = EOS(Tc=513.9, Pc=6148000, omega=0.645, T=300., P=1e5)
+        table = eos.tabulate_saturation(tol=tol)
+        # Polishing is only reliable where liquid fugacities are precise
+        for T in np.linspace(0.45 * eos.Tc, 0.99 * eos.Tc, 9):
+            assert_allclose(table.Psat(T), eos.Psat(T, polish=True), rtol=tol)
+        Ts = np.linspace(table.Tmin, table.Tmax, 301)
+        lnPsat, dlnPsat_dT, V_l, lnV_g = saturation_values(eos, Ts).T
+        assert_allclose(table.Psat(Ts), np.exp(lnPsat), rtol=tol)
+        assert_allclose(table.V_l_sat(Ts), V_l, rtol=tol)
+        assert_allclose(table.V_g_sat(Ts), np.exp(lnV_g), rtol=tol)
+        Ts = Ts[Ts < 0.99 * eos.Tc] # Derivatives diverge at the critical point
+        dT = 1e-3
+        dPsat_dT = (table.Psat(Ts + dT) - table.Psat(Ts - dT)) / (2. * dT)
+        assert_allclose(table.dPsat_dT(Ts), dPsat_dT, rtol=1e-4)
+        assert_allclose([table.Hvap(T) for T in Ts[::10]], table.Hvap(Ts[::10]), rtol=1e-12)
+
+def test_eos_methods_are_not_affected_by_tables():
+    from thermosteam.eos import PR
+    eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1e6)
+    values = [eos.Psat(300.), eos.dPsat_dT(300.), eos.V_l_sat(300.), eos.Hvap(300.)]
+    eos.tabulate_saturation()
+    assert values == [eos.Psat(300.), eos.dPsat_dT(300.), eos.V_l_sat(300.), eos.Hvap(300.)]
+
+def test_saturation_tables_are_reused():
+    import thermosteam as tmo
+    from thermosteam import eos
+    Ethanol = tmo.Chemical('Ethanol')
+    table = Ethanol.tabulate_saturation()
+    assert Ethanol.eos.to_TP(350., 2e5).saturation_table is table
+    assert Ethanol.eos_1atm.saturation_table is table
+    assert eos.PR(Tc=Ethanol.Tc, Pc=Ethanol.Pc, omega=Ethanol.omega, 
+                  T=400., P=1e5).tabulate_saturation() is table
+    Ethanol.reset(Ethanol.CAS)
+    assert Ethanol.eos.saturation_table is table
+    assert Ethanol.eos.to_TP(350., 2e5).saturation_table is table
+    # Models are only added once and have the lowest priority
+    Ethanol.tabulate_saturation()
+    for handle in (Ethanol.Psat, Ethanol.Hvap):
+        names = [i.name for i in handle]
+        assert names.count('EOS saturation table') == 1
+        assert names[-1] == 'EOS saturation table'
+    model = Ethanol.Psat['EOS saturation table']
+    assert model.evaluate(400.) == table.Psat(400.)
+    assert Ethanol.Hvap['EOS saturation table'].evaluate(400.) == table.Hvap(400.)
+
+def test_saturation_tables_on_disk(tmp_path, monkeypatch):
+    import thermosteam as tmo
+    from thermosteam import eos
+    calls = []
+    saturation_spline = eos.saturation_spline
+    def counted_saturation_spline(*args):
+        calls.append(None)
+        return saturation_spline(*args)
+    monkeypatch.setattr(eos, 'saturation_spline', counted_saturation_spline)
+    monkeypatch.setattr(eos, 'saturation_tables', {})
+    directory = tmo.settings.chemical_cache_directory
+    tmo.settings.chemical_cache_directory = str(tmp_path)
+    try:
+        model = eos.SRK(Tc=469.7, Pc=3370000, omega=0.251, T=300., P=1e5)
+        table = model.tabulate_saturation(300., 450., 1e-5)
+        assert len(calls) == 1
+        assert any(tmp_path.rglob('*'))
+        monkeypatch.setattr(eos, 'saturation_tables', {}) # As in a new process
+        loaded_table = model.to_TP(310., 1e5).tabulate_saturation(300., 450., 1e-5)
+        assert len(calls) == 1
+        assert loaded_table is not table
+        Ts = np.linspace(300., 450., 31)
+        assert_allclose(loaded_table.Psat(Ts), table.Psat(Ts), rtol=0., atol=0.)
+        assert_allclose(loaded_table.Hvap(Ts), table.Hvap(Ts), rtol=0., atol=0.)
+    finally:
+        tmo.settings.chemical_cache_directory = directory
+
+if __name__ == '__main__':
+    test_saturation_table_accuracy()
+    test_eos_methods_are_not_affected_by_tables()
+    test_saturation_tables_are_reused()
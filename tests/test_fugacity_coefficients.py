@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+def test_pure_component_fugacity_coefficients():
+    import thermosteam as tmo
+    from thermosteam.eos import PR, SRK
+    eq = tmo.equilibrium
+    conditions = {'CO2': [(300., 5e6), (250., 1e6), (400., 2e7)],
+                  'Methane': [(150., 5e5), (200., 3e6), (300., 1e7)],
+                  'Water': [(500., 1e6), (650., 1e5)]}
+    for ID, TPs in conditions.items():
+        chemical = tmo.Chemical(ID)
+        args = (chemical.Tc, chemical.Pc, chemical.omega)
+        for EOS, Phi in [(PR, eq.PRFugacityCoefficients), 
+                         (SRK, eq.SRKFugacityCoefficients)]:
+            phi = Phi([chemical])
+            for T, P in TPs:
+                eos = EOS(*args, T=T, P=P)
+                # Single supercritical roots may be labeled as liquid
+                expected = eos.phi_g if hasattr(eos, 'phi_g') else eos.phi_l
+                assert_allclose(phi([1.], T, P), [expected], rtol=1e-9)
+
+def test_interaction_parameter_updates():
+    import thermosteam as tmo
+    eq = tmo.equilibrium
+    class PRFugacityCoefficients(eq.PRFugacityCoefficients):
+        __slots__ = ()
+    chemicals = tmo.Chemicals(['CO2', 'H2'], cache=True)
+    y = [0.5, 0.5]
+    phi = PRFugacityCoefficients(chemicals)
+    ideal_mixing = phi(y, 300., 5e6)
+    # Changes to the class parameters apply to existing objects
+    PRFugacityCoefficients.interaction_parameters['CO2', 'H2'] = -0.1622
+    expected = eq.PRFugacityCoefficients(chemicals, kijs={('H2', 'CO2'): -0.1622})(y, 300., 5e6)
+    assert_allclose(phi(y, 300., 5e6), expected)
+    assert not np.allclose(expected, ideal_mixing)
+    PRFugacityCoefficients.interaction_parameters['CO2', 'H2'] = 0.
+    assert_allclose(phi(y, 300., 5e6), ideal_mixing)
+    del PRFugacityCoefficients.interaction_parameters['CO2', 'H2']
+    assert_allclose(phi(y, 300., 5e6), ideal_mixing)
+    # So do changes to the parameters of an object (which are copied)
+    kijs = {('CO2', 'H2'): -0.1622}
+    phi = PRFugacityCoefficients(chemicals, kijs)
+    kijs[('CO2', 'H2')] = 0.
+    assert_allclose(phi(y, 300., 5e6), expected)
+    phi.kijs['CO2', 'H2'] = 0.
+    assert_allclose(phi(y, 300., 5e6), ideal_mixing)
+    phi.kijs = kijs
+    assert_allclose(phi(y, 300., 5e6), ideal_mixing)
+    phi.kijs.update({('CO2', 'H2'): -0.1622})
+    assert_allclose(phi(y, 300., 5e6), expected)
+    # Without changes, parameters are not compared on each call
+    state = phi._kijs_state
+    phi(y, 300., 5e6)
+    assert phi._kijs_state is state
+
+def test_vle_with_cubic_eos_fugacity_coefficients():
+    import thermosteam as tmo
+    eq = tmo.equilibrium
+    for Phi in (eq.PRFugacityCoefficients, eq.SRKFugacityCoefficients):
+        thermo = tmo.Thermo(['CO2', 'Propane', 'Water'], 
+                            Gamma=eq.IdealActivityCoefficients,
+                            Phi=Phi, cache=True)
+        s = tmo.Stream(None, CO2=1, Propane=1, Water=1, thermo=thermo)
+        T, P = 300., 3e6
+        s.vle(T=T, P=P)
+        assert s.imol['g'].sum() > 0. and s.imol['l'].sum() > 0.
+        y = s.imol['g'] / s.imol['g'].sum()
+        x = s.imol['l'] / s.imol['l'].sum()
+        chemicals = thermo.chemicals
+        # Gas fugacities equal liquid fugacities (with ideal activities)
+        Psats = np.array([i.Psat(T) for i in chemicals])
+        phi = Phi(chemicals)(y, T, P)
+        assert_allclose(y * phi * P, x * Psats, rtol=1e-2)
+        # Results differ from those of ideal gases
+        ideal_thermo = tmo.Thermo(['CO2', 'Propane', 'Water'],
+                                  Gamma=eq.IdealActivityCoefficients, cache=True)
+        ideal = tmo.Stream(None, CO2=1, Propane=1, Water=1, thermo=ideal_thermo)
+        ideal.vle(T=T, P=P)
+        assert not np.allclose(ideal.imol['g'], s.imol['g'], rtol=1e-2)
+        
+if __name__ == '__main__':
+    test_pure_component_fugacity_coefficients()
+    test_interaction_parameter_updates()
+    test_vle_with_cubic_eos_fugacity_coefficients()
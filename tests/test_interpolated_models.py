@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+from scipy.interpolate import interp1d
+from scipy.integrate import quad
+
+def data(uniform):
+    if uniform:
+        Ts = np.linspace(300., 500., 21)
+    else:
+        Ts = 300. + 200. * np.linspace(0., 1., 21)**1.5
+    return Ts, 1e3 * np.exp(-800. / Ts) + 0.05 * Ts
+
+def interp1d_values(Ts, Ys, kind, T):
+    # Interpolation as previously done with interp1d (linear extrapolation)
+    extrapolator = interp1d(Ts, Ys, fill_value='extrapolate')
+    spline = interp1d(Ts, Ys, kind=kind) if len(Ts) > 5 else extrapolator
+    inside = (Ts[0] <= T) & (T <= Ts[-1])
+    return np.where(inside, spline(np.clip(T, Ts[0], Ts[-1])), extrapolator(T))
+
+def models():
+    from thermosteam.base import InterpolatedTDependentModel
+    for uniform in (True, False):
+        Ts, Ys = data(uniform)
+        for kind in ('zero', 'linear', 'quadratic', 'cubic'):
+            yield kind, Ts, Ys, InterpolatedTDependentModel(Ts, Ys, kind=kind)
+        yield 'linear', Ts[:5], Ys[:5], InterpolatedTDependentModel(Ts[:5], Ys[:5])
+
+def test_uniform_grid_detection():
+    from thermosteam.base import InterpolatedTDependentModel
+    Ts, Ys = data(True)
+    assert InterpolatedTDependentModel(Ts, Ys).dT == pytest.approx(10.)
+    assert InterpolatedTDependentModel(Ts[::-1], Ys[::-1]).dT == pytest.approx(10.)
+    Ts, Ys = data(False)
+    assert InterpolatedTDependentModel(Ts, Ys).dT is None
+
+def test_values_match_interp1d():
+    T = np.linspace(250., 550., 301)
+    for kind, Ts, Ys, model in models():
+        expected = interp1d_values(Ts, Ys, kind, T)
+        if kind == 'zero': 
+            # Piecewise constant values may differ at the data points only
+            at_data = np.isin(T, Ts)
+            assert_allclose(model.evaluate(T)[~at_data], expected[~at_data], rtol=1e-12)
+        else:
+            assert_allclose(model.evaluate(T), expected, rtol=1e-12)
+            assert_allclose(model.evaluate(Ts), Ys, rtol=1e-12)
+        assert_allclose([model.evaluate(i) for i in T.tolist()], model.evaluate(T), rtol=1e-14)
+
+def test_integrals_match_quadrature():
+    bounds = [(300., 500.), (310.5, 311.), (320.3, 480.7), (250., 320.), 
+              (480., 550.), (260., 540.), (540., 260.), (400., 400.)]
+    for kind, Ts, Ys, model in models():
+        for Ta, Tb in bounds:
+            breakpoints = Ts[(Ts > min(Ta, Tb)) & (Ts < max(Ta, Tb))]
+            for f, integrate in [(model.evaluate, model.integrate_by_T),
+                                 (lambda T: model.evaluate(T) / T, model.integrate_by_T_over_T)]:
+                expected = quad(f, Ta, Tb, points=breakpoints if breakpoints.size else None,
+                                epsabs=0., epsrel=1e-13, limit=200)[0]
+                assert_allclose(integrate(Ta, Tb), expected, rtol=1e-10, atol=1e-10,
+                                err_msg=f"{kind} from {Ta} to {Tb} K")
+                assert_allclose(integrate(np.array([Ta, Ta]), np.array([Tb, Tb])), 
+                                [expected, expected], rtol=1e-10, atol=1e-10)
+
+def test_derivatives_match_finite_differences():
+    h = 1e-4
+    # Temperatures away from the data points
+    T = np.array([250., 299., 305.3, 351.1, 402.7, 463.3, 498.9, 501., 550.])
+    for kind, Ts, Ys, model in models():
+        expected = (interp1d_values(Ts, Ys, kind, T + h) 
+                    - interp1d_values(Ts, Ys, kind, T - h)) / (2 * h)
+        assert_allclose(model.differentiate_by_T(T), expected, rtol=1e-6, atol=1e-9)
+        assert_allclose([model.differentiate_by_T(i) for i in T.tolist()],
+                        model.differentiate_by_T(T), rtol=1e-14)
+    
+def test_linear_extrapolation():
+    from thermosteam.base import InterpolatedTDependentModel
+    Ts, Ys = data(False)
+    model = InterpolatedTDependentModel(Ts, Ys)
+    slope = (Ys[-1] - Ys[-2]) / (Ts[-1] - Ts[-2])
+    assert_allclose(model.evaluate(600.), Ys[-1] + slope * (600. - Ts[-1]), rtol=1e-12)
+    assert_allclose(model.differentiate_by_T(600.), slope, rtol=1e-12)
+    slope = (Ys[1] - Ys[0]) / (Ts[1] - Ts[0])
+    assert_allclose(model.evaluate(200.), Ys[0] + slope * (200. - Ts[0]), rtol=1e-12)
+    assert_allclose(model.integrate_by_T(200., Ts[0]), 
+                    (Ts[0] - 200.) * (Ys[0] - 0.5 * slope * (Ts[0] - 200.)), rtol=1e-12)
+
+if __name__ == '__main__':
+    test_uniform_grid_detection()
+    test_values_match_interp1d()
+    test_integrals_match_quadrature()
+    test_derivatives_match_finite_differences()
+    test_linear_extrapolation()
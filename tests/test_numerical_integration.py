@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+from math import exp
+from numpy.testing import assert_allclose
+from scipy.integrate import quad
+
+def high_order_quadrature(f, Ta, Tb):
+    return quad(f, Ta, Tb, epsabs=0., epsrel=1e-13, limit=500)[0]
+
+def test_antiderivative_table():
+    from thermosteam.base import AntiderivativeTable
+    f = lambda T: 75. + 1e-3 * T + 2e6 * exp(-2000. / T) / T**2
+    table = AntiderivativeTable(f)
+    for Ta, Tb in [(298.15, 298.65), (298.15, 350.), (298.15, 1000.),
+                   (250., 280.), (700., 310.), (300., 300.)]:
+        assert_allclose(table.integrate(Ta, Tb),
+                        high_order_quadrature(f, Ta, Tb), rtol=1e-12, atol=1e-12)
+        assert_allclose(table.integrate_over_T(Ta, Tb),
+                        high_order_quadrature(lambda T: f(T) / T, Ta, Tb),
+                        rtol=1e-12, atol=1e-12)
+    table.clear()
+    assert_allclose(table.integrate(400., 320.),
+                    high_order_quadrature(f, 400., 320.), rtol=1e-12)
+
+def test_numerical_integrals_of_models():
+    import thermosteam as tmo
+    from thermosteam.base import AntiderivativeTable
+    for ID in ('Water', 'Ethanol'):
+        chemical = tmo.Chemical(ID)
+        model = chemical.Cn.l['Rowlinson and Poling (2001)']
+        assert isinstance(model.integrate_by_T.__self__, AntiderivativeTable)
+        for Ta, Tb in [(298.15, 350.), (298.15, 500.), (300., 300.5)]:
+            assert_allclose(model.integrate_by_T(Ta, Tb),
+                            high_order_quadrature(model.evaluate, Ta, Tb),
+                            rtol=1e-8)
+            assert_allclose(model.integrate_by_T_over_T(Ta, Tb),
+                            high_order_quadrature(lambda T: model.evaluate(T) / T, Ta, Tb),
+                            rtol=1e-8)
+
+def test_numerical_integrals_of_TP_models():
+    from thermosteam.base import TPDependentModel
+    f = lambda T, P: 30. + 1e-2 * T + 1e-6 * P + 1e-5 * T * T * exp(-T / 400.)
+    model = TPDependentModel(f, 200., 1000., name='Test', var='Cn.g')
+    P = 1e5
+    for Ta, Tb in [(298.15, 350.), (298.15, 900.)]:
+        assert_allclose(model.integrate_by_T(Ta, Tb, P),
+                        high_order_quadrature(lambda T: f(T, P), Ta, Tb),
+                        rtol=1e-12)
+        assert_allclose(model.integrate_by_T_over_T(Ta, Tb, P),
+                        high_order_quadrature(lambda T: f(T, P) / T, Ta, Tb),
+                        rtol=1e-12)
+
+def test_antiderivative_table_in_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from random import Random
+    from thermosteam.base import AntiderivativeTable
+    f = lambda T: 75. + 1e-3 * T + 2e6 * exp(-2000. / T) / T**2
+    random = Random(0)
+    bounds = [(random.uniform(200., 2000.), random.uniform(200., 2000.))
+              for i in range(2000)]
+    expected = [high_order_quadrature(f, Ta, Tb) for Ta, Tb in bounds[:50]]
+    for trial in range(5):
+        table = AntiderivativeTable(f)
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda args: table.integrate(*args), bounds))
+        assert_allclose(results[:50], expected, rtol=1e-11)
+        start, integrals, integrals_over_T = table.table
+        assert len(integrals) == len(integrals_over_T)
+        assert_allclose(results, [table.integrate(*i) for i in bounds], rtol=1e-11)
+
+def test_antiderivative_tables_by_pressure():
+    import pickle
+    from thermosteam.base import TPDependentModel, AntiderivativeTables
+    from thermosteam.base.thermo_model import AntiderivativeTable
+    f = lambda T, P: 30. + 1e-2 * T + 1e-6 * P + 1e-5 * T * T * exp(-T / 400.)
+    model = TPDependentModel(f, 200., 1000., name='Test', var='Cn.g')
+    tables = model.integrate_by_T.__self__
+    assert isinstance(tables, AntiderivativeTables)
+    model.integrate_by_T(298.15, 900., 1e5)
+    model.integrate_by_T_over_T(298.15, 900., 1e5)
+    table = tables.get_table(1e5)
+    start, integrals, _ = table.table
+    # Tables are reused at the same pressure (only endpoints are integrated)
+    model.integrate_by_T(300., 800., 1e5)
+    assert tables.get_table(1e5) is table
+    assert table.table[1] is integrals
+    assert_allclose(model.integrate_by_T(298.15, 900., 2e5),
+                    high_order_quadrature(lambda T: f(T, 2e5), 298.15, 900.),
+                    rtol=1e-12)
+    assert len(tables.tables) == 2
+    for i in range(2 * tables.cache_size): model.integrate_by_T(300., 400., i)
+    assert len(tables.tables) <= tables.cache_size
+    # Tables are cleared when parameters are set
+    model.set_value('dummy', 1.)
+    assert not tables.tables
+    table = AntiderivativeTable(exp, 0., 5., 7)
+    table.integrate(1., 2.)
+    other = pickle.loads(pickle.dumps(table))
+    assert other.table is None and other.dT == 5. and len(other.points[0]) == 7
+
+if __name__ == '__main__':
+    test_antiderivative_table()
+    test_numerical_integrals_of_models()
+    test_numerical_integrals_of_TP_models()
+    test_antiderivative_table_in_threads()
+    test_antiderivative_tables_by_pressure()
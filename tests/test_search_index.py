@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+
+def metadata_fields(obj):
+    if obj is None: return None
+    return (obj.pubchemid, obj.CAS, obj.formula, obj.MW, obj.smiles, obj.InChI,
+            obj.InChI_key, obj.iupac_name, obj.common_name)
+
+def search_fields(db, ID):
+    try: return metadata_fields(db.search(ID))
+    except LookupError: return None
+
+@pytest.fixture
+def small_database(tmp_path, monkeypatch):
+    from thermosteam.utils import LRUCache
+    from thermosteam.chemicals.identifiers import (
+        database_files, build_search_index, ChemicalMetadataDB
+    )
+    with open(database_files[0]) as f:
+        lines = f.readlines()[:100]
+    metadata_file = str(tmp_path / 'metadata.tsv')
+    with open(metadata_file, 'w') as f: f.writelines(lines)
+    # Searches are cached by all databases
+    monkeypatch.setattr(ChemicalMetadataDB, 'cache', LRUCache(capacity=1000))
+    files = (metadata_file,)
+    index_file = build_search_index(str(tmp_path / 'index.bin'), files)
+    return files, index_file
+
+def test_search_index_matches_search(small_database):
+    from thermosteam.chemicals.identifiers import ChemicalMetadataDB
+    files, index_file = small_database
+    db = ChemicalMetadataDB(files)
+    IDs = ['Water', 'water', 'Ethanol', 'AceticAcid', 'acetic_acid', 'Glycerol',
+           '64-17-5', '7732-18-5', 'C2H6O', 'CCO', 'pubchem=702', 
+           'InChI=1S/C2H6O/c1-2-3/h3H,2H2,1H3', 
+           'InChIKey=LFQSCWFLJHTTHZ-UHFFFAOYSA-N', 'Helium', 'NaCl', 
+           'NotAChemical', '50-00-0', 'Water']
+    expected = [search_fields(db, i) for i in IDs]
+    assert expected[0] and expected[2] and expected[-3] is None
+    db.cache.clear()
+    mapped_db = ChemicalMetadataDB(files)
+    mapped_db.set_search_index(index_file)
+    assert mapped_db.mapped_index is not None
+    assert [metadata_fields(i) for i in mapped_db.search_many(IDs)] == expected
+    assert [search_fields(mapped_db, i) for i in IDs] == expected
+    db.cache.clear()
+    assert [metadata_fields(i) for i in db.search_many(IDs)] == expected
+    db.cache.clear()
+    mapped_db = ChemicalMetadataDB(files)
+    mapped_db.set_search_index(index_file)
+    assert [search_fields(mapped_db, i) for i in IDs] == expected
+    assert not mapped_db.unloaded_files # No metadata files are loaded
+
+def test_mapped_index_matches_dictionaries(small_database):
+    from thermosteam.chemicals.identifiers import (
+        ChemicalMetadataDB, ChemicalSearchIndex, search_index_kinds
+    )
+    files, index_file = small_database
+    assert ChemicalSearchIndex.from_file(index_file) is None # Outdated for all files
+    search_index = ChemicalSearchIndex.from_file(index_file, files)
+    db = ChemicalMetadataDB(files)
+    db.load_all()
+    for kind in search_index_kinds:
+        index = getattr(db, kind + '_index')
+        mapped_index = getattr(search_index, kind)
+        keys = [i for i in index if i is not None]
+        assert len(mapped_index) == len(keys)
+        found = mapped_index.get_many(keys)
+        assert [metadata_fields(i) for i in found] == [metadata_fields(index[i]) for i in keys]
+        assert keys[0] in mapped_index
+        assert mapped_index[keys[0]] is found[0] # Rows are only parsed once
+    assert 'not a chemical' not in search_index.name
+    assert search_index.name.get('not a chemical') is None
+    with pytest.raises(KeyError): search_index.name['not a chemical']
+
+def test_search_many_only_skips_missing_chemicals(small_database):
+    from thermosteam.chemicals.identifiers import ChemicalMetadataDB
+    files, index_file = small_database
+    db = ChemicalMetadataDB(files)
+    assert db.search_many(['NotAChemical', 'Water'])[0] is None
+    with pytest.raises(ValueError): db.search_many(['Water', ''])
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import pickle
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from numpy.testing import assert_allclose
+
+def attach_in_worker(shared):
+    import thermosteam as tmo
+    chemicals = shared.attach()
+    # Attached arrays are views of the shared memory block
+    shared_block = chemicals.MW.base is not None and not chemicals.MW.flags.writeable
+    stream = tmo.Stream(None, Water=1, Ethanol=1, T=350, thermo=tmo.Thermo(chemicals))
+    return (chemicals.IDs, chemicals.MW.tolist(), shared_block,
+            shared.attach() is chemicals, stream.H)
+
+def test_shared_chemicals_in_process_pool():
+    import thermosteam as tmo
+    chemicals = tmo.CompiledChemicals(['Water', 'Ethanol', 'Glycerol'], cache=True)
+    shared = chemicals.share()
+    try:
+        data = pickle.dumps(shared)
+        assert len(data) < 0.05 * len(pickle.dumps(chemicals.tuple))
+        stream = tmo.Stream(None, Water=1, Ethanol=1, T=350, thermo=tmo.Thermo(chemicals))
+        # Spawned workers do not inherit any chemicals from this process
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(2, mp_context=context) as executor:
+            results = list(executor.map(attach_in_worker, [shared] * 4))
+        for IDs, MW, shared_block, memoized, H in results:
+            assert IDs == chemicals.IDs
+            assert_allclose(MW, chemicals.MW)
+            assert shared_block and memoized
+            assert_allclose(H, stream.H)
+    finally:
+        shared.unlink()
+
+def test_unresolved_shared_chemicals():
+    import thermosteam as tmo
+    Water = tmo.Chemical('Water').copy('Water')
+    Water.Tb = 380. # Differs from the cached chemical
+    chemicals = tmo.CompiledChemicals([Water, 'Ethanol'], cache=True)
+    shared = chemicals.share()
+    try:
+        with pytest.raises(LookupError):
+            pickle.loads(pickle.dumps(shared)).attach()
+        chemicals.register()
+        assert pickle.loads(pickle.dumps(shared)).attach().Water is Water
+    finally:
+        shared.unlink()
+
+def test_fingerprint_of_used_lazy_handles():
+    import thermosteam as tmo
+    Water = tmo.Chemical('Water')
+    fingerprint = Water.fingerprint
+    used_Water = tmo.Chemical('Water')
+    used_Water.mu('l', 300., 101325.)
+    used_Water.kappa('g', 400., 101325.)
+    used_Water.sigma(300.)
+    used_Water.epsilon(300.)
+    assert used_Water.fingerprint == fingerprint
+    object.__setattr__(used_Water, '_fingerprint', None) # Not memoized
+    assert used_Water.fingerprint == fingerprint
+    assert pickle.loads(pickle.dumps(used_Water)).fingerprint == fingerprint
+    used_Water.mu.l.add_model(1e-3, top_priority=True)
+    assert used_Water.fingerprint != fingerprint
+    # Chemicals with used handles are resolved by spawned workers
+    chemicals = tmo.CompiledChemicals(['Water', 'Ethanol'], cache=True)
+    stream = tmo.Stream(None, Water=1, Ethanol=1, T=350, thermo=tmo.Thermo(chemicals))
+    stream.mu; stream.kappa; stream.sigma
+    for chemical in chemicals: object.__setattr__(chemical, '_fingerprint', None)
+    shared = chemicals.share()
+    try:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            IDs, MW, shared_block, memoized, H = executor.submit(attach_in_worker, shared).result()
+        assert IDs == chemicals.IDs
+        assert_allclose(H, stream.H)
+    finally:
+        shared.unlink()
+
+def test_equilibrium_caches_keyed_by_fingerprint():
+    import thermosteam as tmo
+    from thermosteam.equilibrium import BubblePoint, DortmundActivityCoefficients
+    thermo = tmo.Thermo(['Water', 'Ethanol'], cache=False)
+    chemicals = thermo.chemicals.tuple
+    other = tmo.Thermo(['Water', 'Ethanol'], cache=False).chemicals.tuple
+    assert chemicals[0] is not other[0]
+    # Equal chemicals share cached data but are bound to their own objects
+    gamma = DortmundActivityCoefficients(chemicals)
+    assert DortmundActivityCoefficients(chemicals) is gamma
+    other_gamma = DortmundActivityCoefficients(other)
+    assert other_gamma.chemicals == other
+    assert other_gamma._chemgroups is gamma._chemgroups
+    bp = BubblePoint(chemicals, thermo)
+    other_bp = BubblePoint(other, thermo)
+    assert other_bp.chemicals == other
+    assert all([i is j.Psat for i, j in zip(other_bp.Psats, other)])
+    assert other_bp.Tmax == bp.Tmax
+    # Modified chemicals do not hit stale entries
+    water = chemicals[0]
+    water._Dortmund = other[1].Dortmund
+    modified_gamma = DortmundActivityCoefficients(chemicals)
+    assert modified_gamma is not gamma
+    assert (modified_gamma([0.5, 0.5], 350) != gamma([0.5, 0.5], 350)).any()
+    assert BubblePoint(chemicals, thermo).gamma is modified_gamma
+
+if __name__ == '__main__':
+    test_shared_chemicals_in_process_pool()
+    test_unresolved_shared_chemicals()
+    test_fingerprint_of_used_lazy_handles()
+    test_equilibrium_caches_keyed_by_fingerprint()
@@ -108,3 +108,140 @@ def test_multistream():
     with pytest.raises(AttributeError):
         stream.F_vol = 1.
     
+        
+def test_flow_data_views():
+    import thermosteam as tmo
+    tmo.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    stream = tmo.Stream(None, Water=2, Ethanol=1, T=300)
+    MW = stream.chemicals.MW
+    assert_allclose(stream.mass, stream.mol * MW)
+    assert_allclose(stream.imass['Ethanol', 'Water'], [MW[1], 2 * MW[0]])
+    stream.imass['Water'] = MW[0]
+    assert_allclose(stream.mol, [1., 1.])
+    stream.mass *= 2
+    assert_allclose(stream.mol, [2., 2.])
+    assert_allclose(stream.vol.sum(), stream.F_vol)
+    stream.ivol['Water'] = 1.
+    assert_allclose(stream.ivol['Water'], 1.)
+    
+    stream = tmo.MultiStream(None, l=[('Water', 1)], g=[('Ethanol', 1)], T=360)
+    assert_allclose(stream.imass['g', 'Ethanol'], MW[1])
+    stream.imass['l', 'Water'] = 2 * MW[0]
+    assert_allclose(stream.imol['l', 'Water'], 2.)
+    assert_allclose(stream.vol.sum(), stream.F_vol)
+    stream.ivol['g', 'Ethanol'] = 1.
+    assert_allclose(stream.ivol['g', 'Ethanol'], 1.)
+    
+    # Phase indexers are writable views of the molar data
+    liquid_mass = stream.imass.get_phase('l')
+    liquid_mass['Water'] = MW[0]
+    assert_allclose(stream.imol['l', 'Water'], 1.)
+    liquid_mass.data[:] = 0.
+    assert_allclose(stream.imol['l'], 0.)
+    gas_vol = stream.ivol.get_phase('g')
+    gas_vol['Ethanol'] = 2.
+    assert_allclose(stream.ivol['g', 'Ethanol'], 2.)
+    assert stream.imol['l', 'Water'] == 0. 
+    
+def test_stream_io():
+    import thermosteam as tmo
+    from thermosteam import stream_io
+    tmo.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    s1 = tmo.Stream(None, Water=2, Ethanol=1, T=300)
+    s2 = tmo.MultiStream(None, l=[('Water', 1)], g=[('Ethanol', 2)], T=360, P=2e5)
+    array = stream_io.streams_to_array([s1, s2], properties=[('F_mass', 'kg/s')])
+    assert_allclose(array['F_mass'], [s1.F_mass / 3600, s2.F_mass / 3600])
+    new_s1, new_s2 = stream_io.streams_from_array(array)
+    assert_allclose(new_s1.mol, s1.mol)
+    assert_allclose(new_s2.imol.data, s2.imol.data)
+    assert (new_s2.T, new_s2.P, new_s2.phases) == (s2.T, s2.P, s2.phases)
+    pytest.importorskip('pyarrow')
+    table = stream_io.streams_to_arrow([s1, s2])
+    new_s1, new_s2 = stream_io.streams_from_arrow(table)
+    assert_allclose(new_s1.mol, s1.mol)
+    assert_allclose(new_s2.imol.data, s2.imol.data)
+    assert new_s1.phase == s1.phase
+    
+def test_compact_pickle():
+    import pickle
+    import thermosteam as tmo
+    thermo = tmo.Thermo(['Water', 'Ethanol', 'Methanol'], cache=True)
+    stream = tmo.Stream(None, Water=2, Ethanol=1, T=300, thermo=thermo)
+    full_size = len(pickle.dumps(stream, protocol=5))
+    thermo.register()
+    buffers = []
+    data = pickle.dumps(stream, protocol=5, buffer_callback=buffers.append)
+    assert len(data) < 500 < full_size
+    new = pickle.loads(data, buffers=buffers)
+    assert new.thermo is thermo
+    assert_allclose(new.mol, stream.mol)
+    assert (new.T, new.P, new.phase) == (stream.T, stream.P, stream.phase)
+    stream = tmo.MultiStream(None, l=[('Water', 1)], g=[('Ethanol', 2)], T=360, thermo=thermo)
+    new = pickle.loads(pickle.dumps(stream, protocol=4))
+    assert_allclose(new.imol.data, stream.imol.data)
+    assert new.phases == stream.phases
+
+def test_pickle_does_not_recompute_fingerprints(monkeypatch):
+    import pickle
+    import thermosteam as tmo
+    thermo = tmo.Thermo(['Water', 'Ethanol', 'Propanol'], cache=True)
+    other = tmo.Thermo(['Water', 'Ethanol', 'Propanol'], cache=True)
+    other.register()
+    thermo.register() # Replaces equivalent package
+    assert thermo.isregistered() and not other.isregistered()
+    fingerprint = thermo.registered_fingerprint()
+    stream = tmo.Stream(None, Water=2, Ethanol=1, T=300, thermo=thermo)
+    def fingerprint_thermo(self): raise AssertionError('fingerprint was computed')
+    monkeypatch.setattr(tmo.Thermo, 'fingerprint', property(fingerprint_thermo))
+    data = pickle.dumps(stream)
+    assert fingerprint.encode() in data
+    assert pickle.loads(data).thermo is thermo
+    assert pickle.loads(pickle.dumps(thermo)) is thermo
+    assert len(pickle.dumps(other)) > len(data) # Not pickled by fingerprint
+    
+def test_lazy_handles_remain_unbuilt():
+    import pickle
+    import thermosteam as tmo
+    from thermosteam._chemical import Chemical, HandleData, _lazy_handles
+    thermo = tmo.Thermo(['Water', 'Ethanol'])
+    chemicals = thermo.chemicals
+    fingerprint = chemicals.fingerprint
+    stream = tmo.Stream(None, Water=2, Ethanol=1, T=300, thermo=thermo)
+    stream.H; stream.S; stream.Cn; stream.rho; stream.P_vapor
+    stream.mix_from([stream.copy(), stream.copy()])
+    stream.bubble_point_at_P(); stream.dew_point_at_T()
+    stream.vle(V=0.5, P=101325)
+    stream.vle(T=360, P=101325)
+    stream.H; stream.S
+    thermo.register()
+    pickle.loads(pickle.dumps(stream))
+    assert chemicals.fingerprint == fingerprint
+    for chemical in chemicals:
+        for name in _lazy_handles:
+            assert getattr(Chemical, name).get_raw(chemical).__class__ is HandleData
+    stream.vle(T=300, P=101325)
+    stream.mu
+    assert chemicals.Water.fingerprint == tmo.Chemical('Water').fingerprint
+
+def test_thread_pool_simulations():
+    import thermosteam as tmo
+    from concurrent.futures import ThreadPoolExecutor
+    packages = [['Water', 'Ethanol'], ['Water', 'Methanol'], ['Ethanol', 'Methanol']] * 4
+    def simulate(chemicals):
+        with tmo.settings.using(chemicals, cache=True):
+            results = []
+            for T in (340., 350., 360.):
+                stream = tmo.Stream('', **{i: 1. for i in chemicals}, T=T)
+                bp = stream.bubble_point_at_T()
+                stream.vle(T=T, P=0.5 * (bp.P + stream.dew_point_at_T().P))
+                results.append((stream.ID, bp.P, stream.imol['g'].copy()))
+            return results
+    serial = [simulate(i) for i in packages]
+    with ThreadPoolExecutor(4) as executor:
+        parallel = list(executor.map(simulate, packages))
+    IDs = [ID for i in parallel for ID, *_ in i]
+    assert len(set(IDs)) == len(IDs) # Default IDs are unique
+    for i, j in zip(serial, parallel):
+        for (_, Pi, gi), (_, Pj, gj) in zip(i, j):
+            assert_allclose(Pi, Pj, rtol=1e-9)
+            assert_allclose(gi, gj, rtol=1e-6, atol=1e-9)
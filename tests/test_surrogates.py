@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import numpy as np
+
+def pointwise_relative_error(surrogate, f, Ts, breakpoints):
+    # Points at boundaries of the original models are skipped (the active 
+    # model may change discontinuously there)
+    Ts = [T for T in Ts if not np.isclose(breakpoints, T).any()]
+    return max([abs(surrogate.evaluate(T) / f(T) - 1.) for T in Ts])
+
+def test_pointwise_error_of_surrogates():
+    import thermosteam as tmo
+    tol = 1e-6
+    Ethanol = tmo.Chemical('Ethanol')
+    Water = tmo.Chemical('Water')
+    for handle, Tmin, Tmax in [(Ethanol.Psat, 200., 500.),
+                               (Water.Psat, 280., 600.),
+                               (Water.Cn.l, 280., 500.),
+                               (Ethanol.Hvap, 200., 500.)]:
+        surrogate = handle.compile_surrogate(Tmin, Tmax, tol)
+        handle.remove(surrogate)
+        assert surrogate.error < tol
+        Ts = np.linspace(Tmin, Tmax, 2001)
+        assert pointwise_relative_error(surrogate, handle, Ts, surrogate.breakpoints) < tol
+
+def test_pointwise_error_of_TP_surrogates():
+    import thermosteam as tmo
+    tol = 1e-6
+    Water = tmo.Chemical('Water')
+    handle = Water.mu.l
+    surrogate = handle.compile_surrogate(280., 500., 1e5, 1e6, tol)
+    handle.remove(surrogate)
+    assert surrogate.error < tol
+    error = max([abs(surrogate.evaluate(T, P) / handle(T, P) - 1.)
+                 for T in np.linspace(280., 500., 201)
+                 for P in np.linspace(1e5, 1e6, 11)])
+    assert error < tol
+
+def test_compiled_surrogates_match_array_evaluation():
+    import thermosteam as tmo
+    Water = tmo.Chemical('Water')
+    surrogate = Water.Psat.compile_surrogate(280., 600.)
+    Water.Psat.remove(surrogate)
+    Ts = np.linspace(270., 610., 101) # Including extrapolation
+    np.testing.assert_allclose([surrogate.evaluate(T) for T in Ts], 
+                               surrogate.evaluate(Ts), rtol=1e-12)
+    surrogate = Water.kappa.g.compile_surrogate(280., 500., 1e4, 1e6)
+    Water.kappa.g.remove(surrogate)
+    for P in (5e3, 1e4, 3e5, 1e6, 2e6):
+        np.testing.assert_allclose([surrogate.evaluate(T, P) for T in Ts],
+                                   surrogate.evaluate(Ts, P), rtol=1e-12)
+
+def time_per_call(f, Ts, P):
+    from timeit import repeat
+    return min(repeat(lambda: [f(T, P) for T in Ts], number=3, repeat=7))
+
+def test_surrogates_are_faster():
+    import thermosteam as tmo
+    Water = tmo.Chemical('Water')
+    handle = Water.kappa.g # Evaluated through a hook of the original model
+    Ts = np.linspace(300., 450., 500).tolist()
+    P = 101325.
+    time = time_per_call(handle, Ts, P)
+    surrogate = handle.compile_surrogate(280., 500., 1e4, 1e6)
+    try:
+        handle(350., P) # Compile kernel
+        assert time_per_call(handle, Ts, P) < time
+    finally:
+        handle.remove(surrogate)
+
+if __name__ == '__main__':
+    test_pointwise_error_of_surrogates()
+    test_pointwise_error_of_TP_surrogates()
+    test_compiled_surrogates_match_array_evaluation()
+    test_surrogates_are_faster()
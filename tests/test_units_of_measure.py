@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+# 
+# This module is under the UIUC open-source license. See 
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+
+def test_offset_units():
+    from thermosteam.units_of_measure import (
+        ureg, convert, get_conversion_factor_and_offset
+    )
+    values = np.array([-40., 0., 25., 100., 1000.])
+    for from_units, to_units, expected_factor in [('degC', 'degF', 1.8), ('degF', 'degC', 5. / 9.),
+                                                  ('K', 'degF', 1.8), ('degF', 'K', 5. / 9.),
+                                                  ('degC', 'K', 1.), ('degR', 'degC', 5. / 9.)]:
+        factor, offset = get_conversion_factor_and_offset(from_units, to_units)
+        assert offset == ureg.convert(0., from_units, to_units)
+        assert_allclose(factor, expected_factor, rtol=1e-15)
+        expected = [ureg.convert(i, from_units, to_units) for i in values.tolist()]
+        assert_allclose(convert(values, from_units, to_units), expected, rtol=1e-14, atol=1e-12)
+        assert_allclose(convert(convert(values, from_units, to_units), to_units, from_units), 
+                        values, rtol=1e-14, atol=1e-12)
+    assert get_conversion_factor_and_offset('degF', 'K')[0] == 5. / 9.
+    
+def test_multiplicative_units():
+    from thermosteam.units_of_measure import (
+        ureg, convert, get_conversion_factor_and_offset
+    )
+    for from_units, to_units in [('kg/hr', 'g/s'), ('atm', 'Pa'), ('BTU/lb', 'kJ/kg'), 
+                                 ('kmol/hr', 'mol/s')]:
+        factor, offset = get_conversion_factor_and_offset(from_units, to_units)
+        assert offset == 0.
+        assert_allclose(factor, ureg.convert(1., from_units, to_units), rtol=1e-15)
+        assert_allclose(convert(2.5, from_units, to_units), ureg.convert(2.5, from_units, to_units), rtol=1e-15)
+    
+def test_conversion_cache():
+    from thermosteam.units_of_measure import get_conversion_factor_and_offset
+    from pint.errors import DimensionalityError
+    cache = get_conversion_factor_and_offset.__defaults__[0]
+    key = ('degF', 'degR')
+    cache.pop(key, None)
+    factor_and_offset = get_conversion_factor_and_offset(*key)
+    assert cache[key] is factor_and_offset
+    assert get_conversion_factor_and_offset(*key) is factor_and_offset
+    with pytest.raises(DimensionalityError):
+        get_conversion_factor_and_offset('kg/hr', 'degC')
+    assert ('kg/hr', 'degC') not in cache
+
+if __name__ == '__main__':
+    test_offset_units()
+    test_multiplicative_units()
+    test_conversion_cache()
@@ -29,6 +29,7 @@ from . import (indexer,
 )
 from ._stream import Stream
 from ._multi_stream import MultiStream
+from . import stream_io
 from .base import functor
 from flexsolve import speed_up
 
@@ -36,7 +37,7 @@ __all__ = ('Chemical', 'Chemicals', 'CompiledChemicals', 'Thermo', 'indexer',
            'Stream', 'MultiStream', 'ThermalCondition', 'mixture', 'ThermoData',
            'settings', 'functor', 'functors', 'chemicals', 'base', 'equilibrium',
            'units_of_measure', 'exceptions', 'functional', 'reaction',
-           'utils', 'separations', 'speed_up')
+           'utils', 'separations', 'stream_io', 'speed_up')
 
 # Set number of digits displayed
 import numpy as np
@@ -7,6 +7,8 @@
 # for license details.
 """
 """
+import io
+import pickle
 import thermosteam as tmo
 from warnings import warn
 from flexsolve import IQ_interpolation
@@ -54,11 +56,12 @@ from .equilibrium.unifac import (
     PSRKGroupCounts
 )
 from .base import (PhaseHandle, PhaseTHandle, PhaseTPHandle,
-                   ThermoModelHandle, TDependentModelHandle,
-                   TPDependentModelHandle, display_asfunctor)
+                   ThermoModelHandle, TDependentModelHandle, TDependentModel,
+                   TPDependentModelHandle, display_asfunctor,
+                   fingerprint_data)
 from .units_of_measure import chemical_units_of_measure
 from .eos import GCEOS_DUMMY, PR
-from .utils import copy_maybe
+from .utils import copy_maybe, load_cached, dump_cached, LRUCache
 from . import functional as fn 
 
 # from .solubility import SolubilityParameter
@@ -73,7 +76,14 @@ __all__ = ('Chemical',)
 
 def get_chemical_data(chemical):
     getfield = getattr
-    return {i:getfield(chemical, i) for i in chemical.__slots__}
+    data = {i:getfield(chemical, i) for i in chemical.__slots__
+            if i not in _lazy_handles}
+    for i in _lazy_handles: 
+        # Model handles that were never accessed (or were not modified 
+        # since being built) are pickled unbuilt
+        data[i] = raw_handle(chemical, i)
+    data['_handle_data'] = {}
+    return data
 
 def unpickle_chemical(chemical_data):
     chemical = object.__new__(Chemical)
@@ -83,8 +93,131 @@ def unpickle_chemical(chemical_data):
     return chemical
 
 
+# %% Disk cache
+
+class ReferencePickler(pickle.Pickler):
+    # Objects of the chemical (e.g., model handles) are pickled by name
+    def __init__(self, file, names):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.names = names
+    
+    def persistent_id(self, obj):
+        return self.names.get(id(obj))
+
+
+class ReferenceUnpickler(pickle.Unpickler):
+    # Objects of the chemical (e.g., model handles) are unpickled by name
+    def __init__(self, file, references):
+        super().__init__(file)
+        self.references = references
+    
+    def persistent_load(self, name):
+        return self.references[name]
+
+
+def chemical_references(chemical, handles):
+    references = {'chemical': chemical, 
+                  '_eos': chemical._eos,
+                  '_eos_1atm': chemical._eos_1atm}
+    for name, handle in handles.items():
+        if handle.__class__ is HandleData: continue
+        references[name] = handle
+        if isinstance(handle, PhaseHandle):
+            for phase in ('s', 'l', 'g'):
+                references[name + '.' + phase] = getattr(handle, phase)
+    return references
+
+def handle_skeleton(handle):
+    if handle.__class__ is HandleData: 
+        return None
+    elif isinstance(handle, PhaseHandle):
+        return (type(handle), handle.var, 
+                *[(type(i), i._var) for i in (handle.s, handle.l, handle.g)])
+    else:
+        return (type(handle), handle._var)
+    
+def handle_from_skeleton(skeleton):
+    cls, var, *phases = skeleton
+    if phases:
+        return cls(var, *[phase_cls(phase_var) for phase_cls, phase_var in phases])
+    else:
+        return cls(var)
+
+def get_chemical_record(chemical):
+    """Return a record of the constants and model parameters of a chemical
+    (references to its model handles and equations of state are kept by name)."""
+    getfield = getattr
+    cls = type(chemical)
+    handles = {i: raw_handle(chemical, i) if i in _lazy_handles 
+               else getfield(chemical, i) for i in _model_and_phase_handles}
+    models = {i: j if j.__class__ is HandleData else handle_models(j)
+              for i, j in handles.items()}
+    names = {id(j): i for i, j in chemical_references(chemical, handles).items()}
+    file = io.BytesIO()
+    ReferencePickler(file, names).dump(models)
+    return {'cls': cls,
+            'ID': chemical._ID,
+            'locked_state': chemical._locked_state,
+            'phase_ref': chemical._phase_ref,
+            'eos': type(chemical._eos),
+            'constants': {i: getfield(chemical, i) for i in _names + _data + _groups},
+            'handles': {i: handle_skeleton(j) for i, j in handles.items()},
+            'models': file.getvalue()}
+
+def chemical_from_record(record):
+    """Return a chemical from a record of its constants and model parameters."""
+    chemical = object.__new__(record['cls'])
+    setfield = setattr
+    chemical._ID = record['ID']
+    chemical._locked_state = record['locked_state']
+    chemical._phase_ref = record['phase_ref']
+    chemical._handle_data = {}
+    for field, value in record['constants'].items(): setfield(chemical, field, value)
+    chemical._init_eos(record['eos'], chemical._Tc, chemical._Pc, chemical._omega)
+    handles = {i: None if j is None else handle_from_skeleton(j)
+               for i, j in record['handles'].items()}
+    references = chemical_references(chemical, {i: j for i, j in handles.items() if j is not None})
+    models = ReferenceUnpickler(io.BytesIO(record['models']), references).load()
+    for name, handle in handles.items():
+        data = models[name]
+        if handle is None:
+            handle = data
+        elif isinstance(handle, PhaseHandle):
+            for phase, phase_models in zip((handle.s, handle.l, handle.g), data):
+                phase._models.extend(phase_models)
+        else:
+            handle._models.extend(data)
+        setfield(chemical, name, handle)
+    chemical._init_energies(chemical._Cn, chemical._Hvap, chemical._Psat, 
+                            chemical._Hfus, chemical._Tm, chemical._Tb, 
+                            chemical._eos, chemical._eos_1atm, chemical._phase_ref)
+    chemical._label_handles()
+    return chemical
+
+
 # %% Representation
     
+def handle_models(handle):
+    if isinstance(handle, PhaseHandle):
+        return tuple([tuple(i._models) for i in (handle.s, handle.l, handle.g)])
+    else:
+        return tuple(handle._models)
+
+def raw_handle(chemical, name):
+    # Return the HandleData of a lazy model handle if it was not built yet or 
+    # was not modified since it was built; otherwise, return the handle
+    handle = getattr(chemical.__class__, name).get_raw(chemical)
+    if handle.__class__ is HandleData: return handle
+    built = chemical._handle_data.get(name)
+    if built:
+        data, built_handle, models = built
+        if built_handle is handle and handle_models(handle) == models: return data
+    return handle
+
+def raw_handle_models(chemical, name):
+    handle = raw_handle(chemical, name)
+    return handle if handle.__class__ is HandleData else handle_models(handle)
+
 def chemical_identity(chemical, pretty=False):
     typeheader = f"{type(chemical).__name__}:"
     full_ID = f"{typeheader} {chemical.ID} (phase_ref={repr(chemical.phase_ref)})"
@@ -93,7 +226,85 @@ def chemical_identity(chemical, pretty=False):
     return full_ID + state
 
 
+# %% Lazy model handles
+
+class HandleData(tuple):
+    """Create a HandleData object that holds the builder and the data of a 
+    model handle that has not been built yet."""
+    __slots__ = ()
+    
+    def __new__(cls, builder, *data):
+        return super().__new__(cls, (builder, *data))
+    
+    def __reduce__(self):
+        return self.__class__, tuple(self)
+    
+    def build(self, chemical):
+        builder, *data = self
+        return builder(chemical, *data)
+
+
+class LazyHandle:
+    """Create a LazyHandle object that wraps the slot descriptor of a model 
+    handle so that the handle is built from its HandleData on first access."""
+    __slots__ = ('member',)
+    
+    def __init__(self, member):
+        self.member = member
+    
+    def get_raw(self, chemical):
+        """Return model handle or HandleData object (if not built yet)."""
+        return self.member.__get__(chemical)
+    
+    def __get__(self, chemical, cls=None):
+        if chemical is None: return self
+        handle = self.member.__get__(chemical, cls)
+        if handle.__class__ is HandleData:
+            data = handle
+            handle = data.build(chemical)
+            self.member.__set__(chemical, handle)
+            label_handle(handle, chemical)
+            # The data still identifies the handle until it is modified
+            chemical._handle_data[self.member.__name__] = (data, handle, handle_models(handle))
+        return handle
+    
+    def __set__(self, chemical, handle):
+        self.member.__set__(chemical, handle)
+        
+    def __delete__(self, chemical):
+        self.member.__delete__(chemical)
+        
+def label_handle(handle, chemical):
+    if isinstance(handle, PhaseHandle):
+        handle.s._chemical = \
+        handle.l._chemical = \
+        handle.g._chemical = chemical
+    elif isinstance(handle, ThermoModelHandle):
+        handle._chemical = chemical
+
+def build_viscosity_handle(chemical, ldata, gdata):
+    return viscosity_handle(None, ldata, gdata)
+
+def build_thermal_conductivity_handle(chemical, ldata, gdata):
+    mu = chemical._mu
+    return thermal_conductivity_handle(None, ldata, (*gdata, mu.g))
+
+def build_surface_tension_handle(chemical, data):
+    return surface_tension_handle(data)
+
+def build_permitivity_handle(chemical, data):
+    return permitivity_handle(data)
+
 # %% Initialize EOS
+
+def add_saturation_models(chemical, table):
+    # Add saturation properties interpolated from the EOS as the lowest 
+    # priority models of vapor pressure and heat of vaporization
+    name = 'EOS saturation table'
+    for handle, f in ((chemical._Psat, table.Psat), (chemical._Hvap, table.Hvap)):
+        models = handle._models
+        for model in [i for i in models if i.name == name]: models.remove(model)
+        handle.add_model(TDependentModel(f, table.Tmin, table.Tmax, name=name, var=handle._var))
                          
 def create_eos(eos, Tc, Pc, omega):
     try: return eos(T=298.15, P=101325., Tc=Tc, Pc=Pc, omega=omega)
@@ -170,6 +381,8 @@ _model_and_phase_properties = ('Psat', 'Hvap', 'sigma', 'epsilon',
 
 _handles = _model_and_phase_handles + _energy_handles
 
+_lazy_handles = ('_mu', '_kappa', '_sigma', '_epsilon')
+
 _data = ('_MW', '_Tm', '_Tb', '_Tt', '_Tc', '_Pt', '_Pc', '_Vc',
          '_Hf', '_LHV', '_HHV', '_Hfus', '_omega', '_dipole',
          '_similarity_variable', '_iscyclic_aliphatic', '_combustion')
@@ -513,7 +726,7 @@ class Chemical:
     __slots__ = ('_ID', '_locked_state', 
                  '_phase_ref', '_eos', '_eos_1atm',
                  *_names, *_groups, 
-                 *_handles, *_data)
+                 *_handles, *_data, '_handle_data', '_fingerprint')
     
     #: [float] Reference temperature in Kelvin
     T_ref = 298.15
@@ -523,8 +736,10 @@ class Chemical:
     H_ref = 0.
     #: [float] Reference entropy in J/mol
     S_ref = 0.
-    #: dict[str, Chemical] Cached chemicals
-    chemical_cache = {}
+    #: LRUCache[str, Chemical] Cached chemicals (least recently used 
+    #: chemicals are evicted first; use `resize` to change the capacity 
+    #: or memory budget and `stats` for hits, misses, and evictions)
+    chemical_cache = LRUCache(capacity=100)
     #: [bool] Wheather or not to search cache by default
     cache = False
     
@@ -537,50 +752,63 @@ class Chemical:
                 sigma=None, kappa=None, epsilon=None, Psat=None,
                 Hvap=None, **data):
         chemical_cache = cls.chemical_cache
-        if (cache or cls.cache) and ID in chemical_cache:
-            if any([search_ID, eos, phase_ref, CAS, default, phase, 
-                    V, Cn, mu, Cp, rho, sigma, kappa, epsilon, Psat, Hvap, data]):
-                warn('cached chemical returned; additional parameters disregarded')
-            return chemical_cache[ID]
-        search_ID = search_ID or ID
-        if not eos: eos = PR
-        if phase: 
-            phase = phase[0].lower()
-            assert phase in ('s', 'l', 'g'), "phase must be either 's', 'l', or 'g'"
-        if search_db:
-            metadata = pubchem_db.search(search_ID)
-            data['metadata'] = metadata
-            self = cls.new(ID, metadata.CASs, eos, phase_ref, phase,
-                           **data)
-        else:
-            self = cls.blank(ID, CAS, phase_ref, phase=phase, **data)
-        if phase:
-            if mu: self.mu.add_model(mu, top_priority=True)
-            if Cn: self.Cn.add_model(Cn, top_priority=True)
-            if kappa: self.kappa.add_model(kappa, top_priority=True)
-            if Cp: self.Cn.add_model(Cp * self.MW, top_priority=True)
-            if rho: self.V.add_model(fn.rho_to_V(rho, self.MW), top_priority=True)
-            if V: self.V.add_model(V, top_priority=True)
+        if cache or cls.cache:
+            chemical = chemical_cache.get(ID)
+            if chemical is not None:
+                if any([search_ID, eos, phase_ref, CAS, default, phase, 
+                        V, Cn, mu, Cp, rho, sigma, kappa, epsilon, Psat, Hvap, data]):
+                    warn('cached chemical returned; additional parameters disregarded')
+                return chemical
+        directory = tmo.settings.chemical_cache_directory
+        if directory and search_db and not any([CAS, V, Cn, mu, Cp, rho, sigma, 
+                                                kappa, epsilon, Psat, Hvap, data]):
+            disk_key = (ID, search_ID, eos and f"{eos.__module__}.{eos.__qualname__}",
+                        phase_ref, phase, bool(default))
+            record = load_cached(directory, 'chemicals', disk_key)
+            try: self = chemical_from_record(record) if record else None
+            except Exception: self = None # Outdated or corrupted records are recreated
         else:
-            multi_phase_items = (('mu', mu),
-                                 ('Cn', Cn),
-                                 ('kappa', kappa), 
-                                 ('Cp', Cp),
-                                 ('rho', rho),
-                                 ('V', V))
-            for i,j in multi_phase_items:
-                if j: raise ValueError(f'must specify phase to set {i} model')
-        if sigma: self.sigma.add_model(sigma, top_priority=True)
-        if epsilon: self.epsilon.add_model(epsilon, top_priority=True)
-        if Psat: self.Psat.add_model(Psat, top_priority=True)
-        if Hvap: self.Hvap.add_model(Hvap, top_priority=True)
-        if default: self.default()
-        if cache:
-            chemical_cache[ID] = self
-            if len(chemical_cache) > 100:
-                for i in chemical_cache:
-                    del chemical_cache[i]
-                    break
+            disk_key = self = None
+        if self is None:
+            search_ID = search_ID or ID
+            if not eos: eos = PR
+            if phase: 
+                phase = phase[0].lower()
+                assert phase in ('s', 'l', 'g'), "phase must be either 's', 'l', or 'g'"
+            if search_db:
+                metadata = pubchem_db.search(search_ID)
+                data['metadata'] = metadata
+                self = cls.new(ID, metadata.CASs, eos, phase_ref, phase,
+                               **data)
+            else:
+                self = cls.blank(ID, CAS, phase_ref, phase=phase, **data)
+            if phase:
+                if mu: self.mu.add_model(mu, top_priority=True)
+                if Cn: self.Cn.add_model(Cn, top_priority=True)
+                if kappa: self.kappa.add_model(kappa, top_priority=True)
+                if Cp: self.Cn.add_model(Cp * self.MW, top_priority=True)
+                if rho: self.V.add_model(fn.rho_to_V(rho, self.MW), top_priority=True)
+                if V: self.V.add_model(V, top_priority=True)
+            else:
+                multi_phase_items = (('mu', mu),
+                                     ('Cn', Cn),
+                                     ('kappa', kappa), 
+                                     ('Cp', Cp),
+                                     ('rho', rho),
+                                     ('V', V))
+                for i,j in multi_phase_items:
+                    if j: raise ValueError(f'must specify phase to set {i} model')
+            if sigma: self.sigma.add_model(sigma, top_priority=True)
+            if epsilon: self.epsilon.add_model(epsilon, top_priority=True)
+            if Psat: self.Psat.add_model(Psat, top_priority=True)
+            if Hvap: self.Hvap.add_model(Hvap, top_priority=True)
+            if default: self.default()
+            if disk_key: 
+                try: record = get_chemical_record(self)
+                except Exception: pass # Models that cannot be pickled are not cached
+                else: dump_cached(directory, 'chemicals', disk_key, record)
+        # Chemicals cached concurrently by other threads take precedence
+        if cache: self = chemical_cache.setdefault(ID, self)
         return self
 
     @classmethod
@@ -650,6 +878,7 @@ class Chemical:
         """
         self = super().__new__(cls)
         self._eos = self._eos_1atm = None
+        self._handle_data = {}
         self._UNIFAC = UNIFACGroupCounts()
         self._Dortmund = DortmundGroupCounts()
         self._PSRK = PSRKGroupCounts()
@@ -729,6 +958,7 @@ class Chemical:
             setfield(new, field, copy_maybe(value))
         new._ID = ID
         new._CAS = CAS or ID
+        new._handle_data = {}
         new._locked_state = new._locked_state
         new._init_energies(new.Cn, new.Hvap, new.Psat, new.Hfus, new.Tm,
                            new.Tb, new.eos, new.eos_1atm, new.phase_ref)
@@ -738,19 +968,80 @@ class Chemical:
     __copy__ = copy
 
     def _label_handles(self):
-        handles = (self._Psat, self._Hvap, self._sigma, self._epsilon,
-                   self._V, self._Cn, self._mu, self._kappa)
-        isa = isinstance
-        for handle in handles:
-            if isa(handle, PhaseHandle):
-                handle.s._chemical = \
-                handle.l._chemical = \
-                handle.g._chemical = self
-            else:
-                handle._chemical = self
+        # Unbuilt handles are labeled once built
+        cls = self.__class__
+        for name in _model_and_phase_handles:
+            label_handle(getattr(cls, name).get_raw(self) if name in _lazy_handles
+                         else getattr(self, name), self)
 
     def __reduce__(self):
-        return unpickle_chemical, (get_chemical_data(self),)
+        # The state is set after the chemical is memoized so that
+        # references to the chemical (e.g. by model handles) are not copies
+        return object.__new__, (self.__class__,), get_chemical_data(self)
+    
+    def __setstate__(self, chemical_data):
+        setfield = setattr
+        for field, value in chemical_data.items():
+            setfield(self, field, value)
+    
+    def __setattr__(self, name, value):
+        setfield = object.__setattr__
+        setfield(self, name, value)
+        if name != '_fingerprint': setfield(self, '_fingerprint', None)
+    
+    def _reset_fingerprint(self, handle):
+        # Called when a model handle of the chemical is modified; built lazy 
+        # handles are no longer identified by their data once modified
+        object.__setattr__(self, '_fingerprint', None)
+        handle_data = self._handle_data
+        for name, (data, built_handle, models) in tuple(handle_data.items()):
+            if (built_handle is handle 
+                or isinstance(built_handle, PhaseHandle)
+                and any([i is handle for i in (built_handle.s, built_handle.l, built_handle.g)])):
+                del handle_data[name]
+    
+    @property
+    def fingerprint(self):
+        """
+        [str] Deterministic identifier of chemical data (the same across 
+        processes and runs). It is computed from the names, group counts, 
+        constants, equation of state, and the parameters of all property 
+        models (free energies are derived from these). The fingerprint is 
+        memoized until an attribute of the chemical is set or a model handle 
+        is modified through its methods (e.g., `add_model`, `set_value`). 
+        Parameters mutated directly on a model or functor are not tracked, 
+        so set them through `set_value` instead.
+        
+        Examples
+        --------
+        >>> from thermosteam import Chemical
+        >>> Water = Chemical('Water')
+        >>> fingerprint = Water.fingerprint
+        >>> Chemical('Water').fingerprint == fingerprint
+        True
+        >>> Water.Psat.add_model(1000., top_priority=True)
+        1000.0
+        >>> Water.fingerprint == fingerprint
+        False
+        
+        """
+        fingerprint = getattr(self, '_fingerprint', None)
+        if fingerprint is None:
+            getfield = getattr
+            fingerprint = fingerprint_data(
+                type(self), self._ID, self._locked_state, self._phase_ref,
+                type(self._eos), 
+                [getfield(self, i) for i in _names],
+                [getfield(self, i) for i in _groups],
+                [getfield(self, i) for i in _data],
+                [handle_models(getfield(self, i)) for i in _model_and_phase_handles
+                 if i not in _lazy_handles],
+                # Lazy handles are encoded by their data (whether built or 
+                # not) unless modified after being built
+                [raw_handle_models(self, i) for i in _lazy_handles]
+            )
+            object.__setattr__(self, '_fingerprint', fingerprint)
+        return fingerprint
     
     @property
     def phase_ref(self):
@@ -866,6 +1157,49 @@ class Chemical:
         """[object] Instance for solving equations of state at 1 atm."""
         return self._eos_1atm
     
+    def tabulate_saturation(self, Tmin=None, Tmax=None, tol=1e-6):
+        """
+        Precompute a table of saturation properties of the equation of state
+        (see `GCEOS.tabulate_saturation`) for both `eos` and `eos_1atm`, and 
+        add the interpolated vapor pressure and heat of vaporization as the 
+        lowest priority models of `Psat` and `Hvap` (which are used where no
+        other model applies). The table is kept when the equation of state
+        is rebuilt (e.g., by `reset`), and is only computed once for 
+        equations of state with the same parameters.
+        
+        Parameters
+        ----------
+        Tmin : float, optional
+            Minimum temperature [K]. Defaults to 0.32 Tc.
+        Tmax : float, optional
+            Maximum temperature [K]. Defaults to 0.999 Tc.
+        tol : float, optional
+            Relative tolerance of interpolated values. Defaults to 1e-6.
+        
+        Examples
+        --------
+        >>> from thermosteam import Chemical
+        >>> Ethanol = Chemical('Ethanol')
+        >>> table = Ethanol.tabulate_saturation()
+        >>> table
+        <SaturationTable: 164.48 to 513.49 K, tol=1e-06>
+        >>> Ethanol.eos_1atm.saturation_table is table
+        True
+        >>> Ethanol.Psat['EOS saturation table']
+        <TDependentModel(T) -> Psat [Pa]>
+        >>> Ethanol.reset(Ethanol.CAS)
+        >>> Ethanol.eos.saturation_table is table
+        True
+        
+        """
+        eos = self._eos
+        if isinstance(eos, GCEOS_DUMMY):
+            raise RuntimeError(f"{self} has no equation of state")
+        table = eos.tabulate_saturation(Tmin, Tmax, tol)
+        self._eos_1atm.saturation_table = table
+        add_saturation_models(self, table)
+        return table
+    
     ### Phase/model handles ###
     
     @property
@@ -1357,8 +1691,15 @@ class Chemical:
         self._combustion = combustion
 
     def _init_eos(self, eos, Tc, Pc, omega):
-        self._eos = create_eos(eos, Tc, Pc, omega)
-        self._eos_1atm = self._eos.to_TP(298.15, 101325)
+        table = getattr(getattr(self, '_eos', None), 'saturation_table', None)
+        self._eos = eos = create_eos(eos, Tc, Pc, omega)
+        if table and not isinstance(eos, GCEOS_DUMMY):
+            # Saturation tables are kept when the EOS is rebuilt
+            if table.Tmin < table.Tmax < eos.Tc:
+                eos.tabulate_saturation(table.Tmin, table.Tmax, table.tol)
+            else:
+                eos.tabulate_saturation(tol=table.tol)
+        self._eos_1atm = eos.to_TP(298.15, 101325)
 
     def _init_handles(self, CAS, MW, Tm, Tb, Tc, Pc, Zc, Vc, omega,
                       dipole, similarity_variable, iscyclic_aliphatic, eos,
@@ -1384,23 +1725,31 @@ class Chemical:
         data = (CAS, Tb, Tc, Pc, omega, similarity_variable, Psat, V)
         self._Hvap = heat_of_vaporization_handle(data)
         
+        # Saturation properties of the EOS (if tabulated)
+        table = getattr(self._eos, 'saturation_table', None)
+        if table: add_saturation_models(self, table)
+        
+        # The following handles are only built on first access (data is 
+        # stored until then)
+        self._handle_data = {}
+        
         # Viscosity
         ldata = (CAS, MW, Tm, Tc, Pc, Vc, omega, Psat, V.l)
         gdata = (CAS, MW, Tc, Pc, Zc, dipole)
-        self._mu = mu = viscosity_handle(None, ldata, gdata)
+        self._mu = HandleData(build_viscosity_handle, ldata, gdata)
         
-        # Conductivity
+        # Conductivity (viscosity of the gas is appended when built)
         ldata = (CAS, MW, Tm, Tb, Tc, Pc, omega, V.l)
-        gdata = (CAS, MW, Tb, Tc, Pc, Vc, Zc, omega, dipole, V.g, Cn.g, mu.g)
-        self._kappa = thermal_conductivity_handle(None, ldata, gdata)
+        gdata = (CAS, MW, Tb, Tc, Pc, Vc, Zc, omega, dipole, V.g, Cn.g)
+        self._kappa = HandleData(build_thermal_conductivity_handle, ldata, gdata)
         
         # Surface tension
         data = (CAS, MW, Tb, Tc, Pc, Vc, Zc,
                 omega, self.Stiel_Polar)
-        self._sigma = surface_tension_handle(data)
+        self._sigma = HandleData(build_surface_tension_handle, data)
         
         # Other
-        self._epsilon = permitivity_handle((CAS, V.l,))
+        self._epsilon = HandleData(build_permitivity_handle, (CAS, V.l,))
         self._label_handles()
         
         # self.delta = SolubilityParameter(self)
@@ -1842,6 +2191,9 @@ class Chemical:
     def __repr__(self):
         return f"Chemical('{self}')"
     
+for i in _lazy_handles: setattr(Chemical, i, LazyHandle(Chemical.__dict__[i]))
+del i
+    
 def lock_phase(chemical, phase):
     getfield = getattr
     setfield = object.__setattr__
@@ -11,10 +11,12 @@ from . import utils
 from .exceptions import UndefinedChemical
 from ._chemical import Chemical
 from .indexer import ChemicalIndexer
+from chemicals.identifiers import pubchem_db
 import thermosteam as tmo
 import numpy as np
+import hashlib
 
-__all__ = ('Chemicals', 'CompiledChemicals')
+__all__ = ('Chemicals', 'CompiledChemicals', 'SharedChemicals')
 setattr = object.__setattr__
 
 # %% Functions
@@ -23,11 +25,45 @@ def must_compile(*args, **kwargs): # pragma: no cover
     raise TypeError("method valid only for compiled chemicals; "
                     "run <Chemicals>.compile() to compile")
 
+def search_metadata(chemicals):
+    # Resolve all identifiers in one batched lookup (only worthwhile 
+    # through a prebuilt search index); results are cached for later searches
+    if pubchem_db.mapped_index:
+        isa = isinstance
+        pubchem_db.search_many([i for i in chemicals if isa(i, str)])
+
 def chemical_data_array(chemicals, attr):
     getfield = getattr
     data = np.asarray([getfield(i, attr) for i in chemicals], dtype=float)
     data.setflags(0)
     return data
+
+def gather_data_array(data, index):
+    data = data[index]
+    data.setflags(0)
+    return data
+
+def concatenate_data_arrays(*data):
+    data = np.concatenate(data)
+    data.setflags(0)
+    return data
+
+def check_chemicals(chemicals):
+    free_energies = ('H', 'S', 'H_excess', 'S_excess')
+    for chemical in chemicals:
+        if chemical.get_missing_properties(free_energies):
+            chemical.reset_free_energies()
+        key_properties = chemical.get_key_property_names()
+        missing_properties = chemical.get_missing_properties(key_properties)
+        if not missing_properties: continue
+        missing = utils.repr_listed_values(missing_properties)
+        raise RuntimeError(
+            f"{chemical} is missing key thermodynamic properties ({missing}); "
+            "use the `<Chemical>.get_missing_properties()` to check "
+            "all missing properties")
+
+#: tuple[str] Names of constant arrays of compiled chemicals.
+_data_arrays = ('MW', 'Hf', 'LHV', 'HHV')
     
 
 # %% Chemicals
@@ -118,6 +154,8 @@ class Chemicals:
         self = super().__new__(cls)
         isa = isinstance
         setfield = setattr
+        chemicals = tuple(chemicals)
+        search_metadata(chemicals)
         for chem in chemicals:
             if isa(chem, Chemical):
                 setfield(self, chem.ID, chem)
@@ -300,9 +338,12 @@ class CompiledChemicals(Chemicals):
     
     """  
     _cache = {}
+    _registry = {}
     
     def __new__(cls, chemicals, cache=None):
         isa = isinstance
+        chemicals = tuple(chemicals)
+        search_metadata(chemicals)
         chemicals = tuple([chem if isa(chem, Chemical) else Chemical(chem, cache)
                            for chem in chemicals])        
         cache = cls._cache
@@ -314,20 +355,80 @@ class CompiledChemicals(Chemicals):
             for chem in chemicals:
                 setfield(self, chem.ID, chem)
             self._compile()
-            cache[chemicals] = self
+            # Objects created concurrently by other threads take precedence
+            self = cache.setdefault(chemicals, self)
         return self
     
     def __dir__(self):
-        return ('append', 'array', 'compile', 'extend', 
+        return ('append', 'array', 'compile', 'extend', 'extended', 'fingerprint',
                 'get_combustion_reactions', 'get_index',
-                'get_lle_indices', 'get_synonyms',
+                'get_lle_indices', 'get_registered', 'get_synonyms',
                 'get_vle_indices', 'iarray', 'ikwarray',
-                'index', 'indices', 'kwarray', 'refresh_constants', 
-                'set_synonym', 'subgroup') + self.IDs
+                'index', 'indices', 'isregistered', 'kwarray', 
+                'refresh_constants', 'register', 'set_synonym',
+                'share', 'subgroup') + self.IDs
     
     def __reduce__(self):
         return CompiledChemicals, (self.tuple,)
     
+    def __reduce_ex__(self, protocol):
+        if self.isregistered():
+            return CompiledChemicals.get_registered, (self.fingerprint,)
+        else:
+            return self.__reduce__()
+    
+    @property
+    def fingerprint(self):
+        """
+        [str] Deterministic identifier of chemicals (the same across 
+        processes and runs). It is computed from the fingerprints of all 
+        chemicals (which are memoized until modified), so it changes when 
+        any chemical constant or model does.
+        
+        Examples
+        --------
+        >>> from thermosteam import CompiledChemicals
+        >>> chemicals = CompiledChemicals(['Water', 'Ethanol'])
+        >>> fingerprint = chemicals.fingerprint
+        >>> chemicals.Water.Tb = 373.
+        >>> chemicals.fingerprint == fingerprint
+        False
+        
+        """
+        data = '\n'.join([i.fingerprint for i in self.tuple])
+        return hashlib.sha1(data.encode()).hexdigest()
+    
+    def register(self):
+        """
+        Register chemicals under their fingerprint. Registered chemicals are
+        pickled by fingerprint only and unpickled as the chemicals registered
+        in the receiving process (which must register them as well).
+        
+        Examples
+        --------
+        >>> import pickle
+        >>> from thermosteam import CompiledChemicals
+        >>> chemicals = CompiledChemicals(['Water', 'Ethanol'], cache=True)
+        >>> chemicals.register()
+        >>> pickle.loads(pickle.dumps(chemicals)) is chemicals
+        True
+        
+        """
+        self._registry[self.fingerprint] = self
+    
+    def isregistered(self):
+        """Return whether chemicals are registered."""
+        return self._registry.get(self.fingerprint) is self
+    
+    @classmethod
+    def get_registered(cls, fingerprint):
+        """Return the CompiledChemicals object registered under the given fingerprint."""
+        try:
+            return cls._registry[fingerprint]
+        except KeyError:
+            raise LookupError(f"no chemicals registered under fingerprint {repr(fingerprint)}; "
+                               "use <CompiledChemicals>.register() in this process first")
+    
     def compile(self):
         """Do nothing, CompiledChemicals objects are already compiled.""" 
     
@@ -363,38 +464,32 @@ class CompiledChemicals(Chemicals):
         reactions = [i.get_combustion_reaction(self) for i in self]
         return tmo.reaction.ParallelReaction([i for i in reactions if i is not None])
 
-    def _compile(self):
+    def _compile(self, data=None, index=None):
+        # Constant arrays (`data`) and the `index` of all identifiers may be 
+        # given by derived chemicals (in which case chemicals are not checked)
         dct = self.__dict__
         tuple_ = tuple
         chemicals = tuple_(dct.values())
-        free_energies = ('H', 'S', 'H_excess', 'S_excess')
-        for chemical in chemicals:
-            if chemical.get_missing_properties(free_energies):
-                chemical.reset_free_energies()
-            key_properties = chemical.get_key_property_names()
-            missing_properties = chemical.get_missing_properties(key_properties)
-            if not missing_properties: continue
-            missing = utils.repr_listed_values(missing_properties)
-            raise RuntimeError(
-                f"{chemical} is missing key thermodynamic properties ({missing}); "
-                "use the `<Chemical>.get_missing_properties()` to check "
-                "all missing properties")
+        if data is None:
+            check_chemicals(chemicals)
+            data = {i: chemical_data_array(chemicals, i) for i in _data_arrays}
         IDs = tuple_([i.ID for i in chemicals])
         CAS = tuple_([i.CAS for i in chemicals])
         size = len(IDs)
-        index = tuple_(range(size))
-        for i in chemicals: dct[i.CAS] = i
+        if index is None:
+            index = tuple_(range(size))
+            index = dict((*zip(CAS, index), *zip(IDs, index)))
+        for i, j in index.items(): dct[i] = chemicals[j]
         dct['tuple'] = chemicals
         dct['size'] = size
         dct['IDs'] = IDs
-        dct['CASs'] = tuple_([i.CAS for i in chemicals])
-        dct['MW'] = chemical_data_array(chemicals, 'MW')
-        dct['Hf'] = chemical_data_array(chemicals, 'Hf')
-        dct['LHV'] = chemical_data_array(chemicals, 'LHV')
-        dct['HHV'] = chemical_data_array(chemicals, 'HHV')
-        dct['_index'] = index = dict((*zip(CAS, index),
-                                      *zip(IDs, index)))
+        dct['CASs'] = CAS
+        dct.update(data)
+        dct['_index'] = index
         dct['_index_cache'] = {}
+        dct['_material_index_caches'] = {}
+        dct['_subgroup_cache'] = {}
+        dct['_extended_cache'] = {}
         vle_chemicals = []
         lle_chemicals = []
         heavy_chemicals = []
@@ -567,7 +662,11 @@ class CompiledChemicals(Chemicals):
     
     def subgroup(self, IDs):
         """
-        Create a new subgroup of chemicals.
+        Create a new subgroup of chemicals. Subgroups are derived without 
+        recompiling: constant arrays are gathered from these chemicals and 
+        synonyms are kept. Subgroups are memoized by identifiers, but each 
+        call returns a lightweight copy (sharing read-only arrays), so 
+        synonyms set on one subgroup are not seen by other callers.
         
         Parameters
         ----------
@@ -577,19 +676,164 @@ class CompiledChemicals(Chemicals):
         Examples
         --------
         >>> chemicals = CompiledChemicals(['Water', 'Ethanol', 'Propane'], cache=True)
-        >>> chemicals.subgroup(['Propane', 'Water'])
+        >>> subgroup = chemicals.subgroup(['Propane', 'Water'])
+        >>> subgroup
         CompiledChemicals([Propane, Water])
+        >>> subgroup.MW
+        array([44.096, 18.015])
+        >>> other = chemicals.subgroup(['Propane', 'Water'])
+        >>> other is subgroup, other.MW is subgroup.MW
+        (False, True)
         
         """
-        chemicals = self[IDs]
-        new = Chemicals(chemicals)
-        new.compile()
-        for i in new.IDs:
-            for j in self.get_synonyms(i):
-                try: new.set_synonym(i, j)
-                except: pass
+        IDs = tuple(IDs)
+        parent_index = self._index
+        cache = self._subgroup_cache
+        if IDs in cache: 
+            new, positions = cache[IDs]
+        else:
+            self[IDs] # Raises error if any chemical is not defined
+            index = list(dict.fromkeys([parent_index[i] for i in IDs]))
+            positions = {j: i for i, j in enumerate(index)}
+            new = self._derive(
+                [self.tuple[i] for i in index],
+                {i: gather_data_array(getattr(self, i), index) for i in _data_arrays},
+                {i: positions[j] for i, j in parent_index.items() if j in positions}
+            )
+            new, positions = cache.setdefault(IDs, (new, positions))
+            utils.trim_cache(cache)
+        # Synonyms may have been set since the subgroup was memoized
+        return new._copy(
+            {i: positions[j] for i, j in parent_index.items() if j in positions}
+        )
+    
+    def extended(self, chemicals, cache=None):
+        """
+        Create new chemicals with additional chemicals. Only the additional 
+        chemicals are checked and compiled; constant arrays and synonyms 
+        are shared from these chemicals. Results are memoized by the
+        additional chemicals, but each call returns a lightweight copy 
+        (sharing read-only arrays), so synonyms set on one result are not
+        seen by other callers.
+        
+        Parameters
+        ----------
+        chemicals : Iterable[str or Chemical]
+            Additional chemicals.
+        cache : bool, optional
+            Wether or not to use cached chemicals.
+              
+        Examples
+        --------
+        >>> chemicals = CompiledChemicals(['Water', 'Ethanol'], cache=True)
+        >>> chemicals.set_synonym('Water', 'H2O')
+        >>> new = chemicals.extended(['Propane'])
+        >>> new
+        CompiledChemicals([Water, Ethanol, Propane])
+        >>> new.H2O is new.Water
+        True
+        >>> new.MW
+        array([18.015, 46.068, 44.096])
+        >>> chemicals.extended(['Propane']).MW is new.MW
+        True
+        
+        Chemicals may not share IDs or CAS numbers:
+        
+        >>> Water = chemicals.Water.copy('Water_2', CAS=chemicals.Water.CAS)
+        >>> chemicals.extended([Water])
+        Traceback (most recent call last):
+        ValueError: CAS number 7732-18-5 of Water_2 already defined in chemicals
+        
+        """
+        chemicals = tuple(chemicals)
+        key = (chemicals, cache)
+        extended_cache = self._extended_cache
+        if key in extended_cache: 
+            new = extended_cache[key]
+            return new._copy({**self._index, **new._extended_index})
+        isa = isinstance
+        chemicals = [i if isa(i, Chemical) else Chemical(i, cache) for i in chemicals]
+        dct = self.__dict__
+        index = self._index
+        IDs = set()
+        CASs = set()
+        for i in chemicals:
+            ID = i.ID
+            CAS = i.CAS
+            if ID in dct or ID in index or ID in IDs: 
+                raise ValueError(f"{ID} already defined in chemicals")
+            if CAS != ID and (CAS in index or CAS in CASs):
+                raise ValueError(f"CAS number {CAS} of {ID} already defined in chemicals")
+            IDs.add(ID)
+            CASs.add(CAS)
+        check_chemicals(chemicals)
+        size = self.size
+        positions = range(size, size + len(chemicals))
+        extended_index = dict((*zip([i.CAS for i in chemicals], positions),
+                               *zip([i.ID for i in chemicals], positions)))
+        getfield = getattr
+        new = self._derive(
+            [*self.tuple, *chemicals],
+            {i: concatenate_data_arrays(getfield(self, i), chemical_data_array(chemicals, i))
+             for i in _data_arrays},
+            {**index, **extended_index}
+        )
+        new.__dict__['_extended_index'] = extended_index
+        new = extended_cache.setdefault(key, new)
+        utils.trim_cache(extended_cache)
+        return new._copy({**index, **new._extended_index})
+    
+    def share(self):
+        """
+        Publish constant arrays (including the formula array and phase 
+        masks) into a shared memory block and return a SharedChemicals 
+        object. Other processes (e.g. workers of a process pool) attach
+        to the same memory when receiving the SharedChemicals object.
+        
+        Examples
+        --------
+        >>> import pickle
+        >>> chemicals = CompiledChemicals(['Water', 'Ethanol'], cache=True)
+        >>> shared = chemicals.share()
+        >>> attached = pickle.loads(pickle.dumps(shared)).attach() # As in a worker process
+        >>> attached
+        CompiledChemicals([Water, Ethanol])
+        >>> attached.MW
+        array([18.015, 46.068])
+        >>> shared.unlink()
+        
+        """
+        arrays = {i: getattr(self, i) for i in _data_arrays}
+        arrays['_has_vle'] = self._has_vle
+        arrays['_has_lle'] = self._has_lle
+        arrays['_formula_array'] = self.formula_array
+        return SharedChemicals(self.fingerprint, self.IDs, 
+                               tuple([i.fingerprint for i in self.tuple]),
+                               self._index, utils.SharedArrays(arrays))
+    
+    def _copy(self, index):
+        # Share chemicals and read-only arrays, but not the index of 
+        # synonyms nor any index caches
+        new = object.__new__(type(self))
+        dct = new.__dict__
+        dct.update(self.__dict__)
+        chemicals = self.tuple
+        for i, j in index.items(): dct[i] = chemicals[j]
+        dct['_index'] = index
+        dct['_index_cache'] = {}
+        dct['_material_index_caches'] = {}
+        dct['_subgroup_cache'] = {}
+        dct['_extended_cache'] = {}
         return new
     
+    @classmethod
+    def _derive(cls, chemicals, data, index):
+        self = object.__new__(cls)
+        setfield = setattr
+        for chem in chemicals: setfield(self, chem.ID, chem)
+        self._compile(data, index)
+        return self
+    
     def get_synonyms(self, ID):
         """
         Get all synonyms of a chemical.
@@ -922,7 +1166,10 @@ class CompiledChemicals(Chemicals):
 
         Notes
         -----
-        CAS numbers are also supported.
+        CAS numbers are also supported. Resolved indices are memoized by
+        key (up to 100 keys), so repeated lookups cost a single dictionary 
+        hit. Indices of multiple chemicals are returned as a read-only 
+        integer array.
 
         Examples
         --------
@@ -932,7 +1179,7 @@ class CompiledChemicals(Chemicals):
         >>> chemicals = CompiledChemicals(['Water', 'Ethanol'], cache=True)
         >>> IDs = ('Water', 'Ethanol')
         >>> chemicals.get_index(IDs)
-        [0, 1]
+        array([0, 1])
         
         Get a single index with a string:
         
@@ -965,7 +1212,9 @@ class CompiledChemicals(Chemicals):
         if isinstance(IDs, str):
             return self.index(IDs)
         elif isinstance(IDs, tuple):
-            return self.indices(IDs)
+            index = np.array(self.indices(IDs), dtype=int)
+            index.setflags(0)
+            return index
         elif IDs is ...:
             return slice(None)
         else: # pragma: no cover
@@ -1018,4 +1267,95 @@ class CompiledChemicals(Chemicals):
         return [i for i, j in enumerate(self._has_lle & nonzeros) if j]
     
     def __repr__(self):
-        return f"{type(self).__name__}([{', '.join(self.IDs)}])"
\ No newline at end of file
+        return f"{type(self).__name__}([{', '.join(self.IDs)}])"
+
+
+class SharedChemicals:
+    """
+    Create a SharedChemicals object that refers to compiled chemicals along 
+    with their constant arrays in shared memory (as returned by 
+    `<CompiledChemicals>.share()`). Only the fingerprints and IDs of the 
+    chemicals, their index, and the name of the shared memory block are 
+    pickled, so worker processes attach to the constant arrays without 
+    copying, pickling, or recompiling chemicals.
+    
+    Parameters
+    ----------
+    fingerprint : str
+        Fingerprint of compiled chemicals.
+    IDs : tuple[str]
+        IDs of all chemicals.
+    fingerprints : tuple[str]
+        Fingerprints of all chemicals.
+    index : dict[str, int]
+        Index of chemicals by identifier (including synonyms).
+    arrays : SharedArrays
+        Constant arrays in shared memory.
+    
+    Notes
+    -----
+    On attach, chemicals are resolved from the chemicals registered under 
+    the fingerprint (see `<CompiledChemicals>.register()`) or, if not 
+    registered, from cached chemicals with the same IDs and fingerprints 
+    (which are then compiled once and registered).
+    
+    """
+    __slots__ = ('fingerprint', 'IDs', 'fingerprints', 'index', 'arrays')
+    
+    #: dict[tuple[str, str], CompiledChemicals] Chemicals attached by 
+    #: fingerprint and name of shared memory block.
+    _attached = {}
+    
+    def __init__(self, fingerprint, IDs, fingerprints, index, arrays):
+        self.fingerprint = fingerprint
+        self.IDs = IDs
+        self.fingerprints = fingerprints
+        self.index = index
+        self.arrays = arrays
+    
+    def __reduce__(self):
+        return SharedChemicals, (self.fingerprint, self.IDs, self.fingerprints, 
+                                 self.index, self.arrays)
+    
+    def _resolve(self):
+        # Return registered chemicals or resolve chemicals from cache
+        fingerprint = self.fingerprint
+        registered = CompiledChemicals._registry.get(fingerprint)
+        if registered is not None: return registered
+        chemicals = [Chemical(i, cache=True) for i in self.IDs]
+        for chemical, fingerprint in zip(chemicals, self.fingerprints):
+            if chemical.fingerprint != fingerprint:
+                raise LookupError(f"{chemical} does not match the shared chemical; "
+                                   "use <CompiledChemicals>.register() in this process first")
+        arrays = self.arrays
+        registered = CompiledChemicals._derive(
+            chemicals, {i: arrays[i] for i in _data_arrays}, dict(self.index)
+        )
+        registered.__dict__['_shared_arrays'] = arrays # Keep shared memory block attached
+        registered.register()
+        return registered
+    
+    def attach(self):
+        """Return a CompiledChemicals object that uses the shared constant arrays."""
+        arrays = self.arrays
+        key = (self.fingerprint, arrays.name)
+        attached = self._attached
+        if key in attached: return attached[key]
+        compiled = object.__new__(CompiledChemicals)
+        dct = compiled.__dict__
+        dct.update(self._resolve().__dict__)
+        for i in _data_arrays: dct[i] = arrays[i]
+        for i in ('_has_vle', '_has_lle', '_formula_array'): dct[i] = arrays[i]
+        for i in ('_index_cache', '_material_index_caches', 
+                  '_subgroup_cache', '_extended_cache'): dct[i] = {}
+        dct['_shared_arrays'] = arrays # Keep shared memory block attached
+        compiled = attached.setdefault(key, compiled)
+        utils.trim_cache(attached)
+        return compiled
+    
+    def unlink(self):
+        """Release the shared memory block (from the publishing process)."""
+        self.arrays.unlink()
+    
+    def __repr__(self):
+        return f"{type(self).__name__}([{', '.join(self.IDs)}])"
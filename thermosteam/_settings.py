@@ -8,9 +8,16 @@
 """
 """
 import thermosteam as tmo
+import os
+from contextvars import ContextVar
+from contextlib import contextmanager
 
 __all__ = ('settings',)
 
+#: Thermo object of the current context (None when not in a 
+#: `settings.using` block, in which case the default Thermo object is used).
+active_thermo = ContextVar('active_thermo', default=None)
+
 def raise_no_thermo_error():
     raise RuntimeError("no available 'Thermo' object; "
                        "use settings.set_thermo")
@@ -19,11 +26,17 @@ class Settings:
     __slots__ = ('_thermo',
                  '_phase_names',
                  '_debug',
+                 '_chemical_cache_directory',
+                 '_chemical_database',
+                 '_chemical_search_index',
     )
     
     def __init__(self):
         self._thermo = None
         self._debug = False
+        self._chemical_cache_directory = None
+        self._chemical_database = None
+        self._chemical_search_index = None
         self._phase_names = {'s': 'Solid',
                              'l': 'Liquid',
                              'g': 'Gas',
@@ -38,6 +51,81 @@ class Settings:
     def debug(self, debug):
         self._debug = bool(debug)
     
+    @property
+    def chemical_cache_directory(self):
+        """
+        [str or None] Directory to cache Chemical objects on disk. Defaults 
+        to None (no disk cache). 
+        
+        Once set, chemicals created by ID (without additional data or models)
+        are loaded from the directory if available, or are saved to it 
+        after creation. Only constants and model parameters are saved (model
+        handles and free energies are rebuilt on load). Cached chemicals are 
+        stored in a subdirectory named after the installed version of 
+        thermosteam and the chemicals library (including the size and 
+        modification time of their source and data files), so 
+        outdated chemicals are never loaded. Files are written atomically, 
+        so many processes may share the same directory. Only use trusted 
+        directories, as cached chemicals are loaded with pickle.
+        
+        Examples
+        --------
+        >>> import tempfile
+        >>> import thermosteam as tmo
+        >>> tmo.settings.chemical_cache_directory = tempfile.mkdtemp()
+        >>> Water = tmo.Chemical('Water') # Created and saved to directory
+        >>> Water_cached = tmo.Chemical('Water') # Loaded from directory
+        >>> Water_cached.fingerprint == Water.fingerprint
+        True
+        >>> tmo.settings.chemical_cache_directory = None
+        
+        """
+        return self._chemical_cache_directory
+    @chemical_cache_directory.setter
+    def chemical_cache_directory(self, directory):
+        self._chemical_cache_directory = None if directory is None else os.fspath(directory)
+    
+    @property
+    def chemical_database(self):
+        """
+        [str or None] Binary database file of chemical constants and 
+        correlation coefficients (as built by 
+        :func:`~thermosteam.chemicals.data.build_database`). Defaults to 
+        None (tables are loaded from the chemicals library).
+        
+        Tables are memory mapped from the file on their first lookup, so 
+        all processes using the same file share its memory. Set the 
+        database before creating chemicals; tables that were already loaded
+        are not reloaded. Files built with other versions of the chemicals 
+        library are ignored.
+        
+        """
+        return self._chemical_database
+    @chemical_database.setter
+    def chemical_database(self, file):
+        self._chemical_database = None if file is None else os.fspath(file)
+    
+    @property
+    def chemical_search_index(self):
+        """
+        [str or None] Search index file of chemical metadata (as built by
+        :func:`~thermosteam.chemicals.identifiers.build_search_index`) used 
+        to find chemicals by name, CAS, formula, and other identifiers. 
+        Defaults to None (metadata files are loaded as needed).
+        
+        The index is memory mapped, so all processes using the same file 
+        share its memory, and no metadata files are loaded. Files built with 
+        other versions of the chemicals library are ignored.
+        
+        """
+        return self._chemical_search_index
+    @chemical_search_index.setter
+    def chemical_search_index(self, file):
+        from .chemicals.identifiers import pubchem_db
+        file = None if file is None else os.fspath(file)
+        pubchem_db.set_search_index(file)
+        self._chemical_search_index = file
+    
     @property
     def phase_names(self):
         """[dict] All phase definitions."""
@@ -60,9 +148,7 @@ class Settings:
         if isinstance(chemicals, tmo.Chemicals):
             chemicals.compile()
         elif not chemicals:
-            thermo = settings._thermo
-            if not thermo: raise_no_thermo_error()
-            chemicals = thermo.chemicals
+            chemicals = self.get_thermo().chemicals
         else:
             raise ValueError("chemicals must be a 'Chemicals' object")
         return chemicals
@@ -73,21 +159,21 @@ class Settings:
         If `mixture` is a Mixture object, return the same object.
         """
         if not mixture:
-            thermo = settings.thermo
-            if not thermo: raise_no_thermo_error()
-            mixture = thermo.mixture
+            mixture = self.get_thermo().mixture
         return mixture
     
     def get_thermo(self):
-        """Return a default Thermo object."""
-        thermo = self._thermo
+        """Return the active Thermo object (the Thermo object of the current
+        `using` block, if any, or the default Thermo object)."""
+        thermo = active_thermo.get() or self._thermo
         if not thermo: raise_no_thermo_error()
         return thermo
     
     def set_thermo(self, thermo, cache=None):
         """
         Set the default Thermo object. If `thermo` is not a Thermo object,
-        an attempt is made to convert it to one.
+        an attempt is made to convert it to one. Within a `using` block,
+        only the Thermo object of the block is replaced.
         
         Parameters
         ----------
@@ -99,7 +185,61 @@ class Settings:
         """
         if not isinstance(thermo, tmo.Thermo):
             thermo = tmo.Thermo(thermo, cache=cache)
-        self._thermo = thermo
+        if active_thermo.get():
+            active_thermo.set(thermo)
+        else:
+            self._thermo = thermo
+    
+    @contextmanager
+    def using(self, thermo, cache=None):
+        """
+        Return a context manager that activates a Thermo object within the 
+        current context (i.e. the current thread or asyncio task) without 
+        changing the default Thermo object. If `thermo` is not a Thermo 
+        object, an attempt is made to convert it to one.
+        
+        Parameters
+        ----------
+        thermo : Thermo or Iterable[Chemical or str]
+            A Thermo object or iterable of chemicals or chemical IDs.
+        cache : bool, optional
+            Wether or not to use cached chemicals.
+        
+        Notes
+        -----
+        New threads (including workers of a thread pool) do not inherit the
+        Thermo object of the submitting thread, so independent simulations 
+        should activate their own Thermo object within the submitted task.
+        Asyncio tasks inherit the Thermo object active at their creation.
+        Objects that hold a Thermo object (e.g. streams) keep using it 
+        outside of the block.
+        
+        Caches shared by threads (e.g. cached chemicals, property packages, 
+        and equilibrium objects) are safe to use concurrently, and default 
+        IDs remain unique. Streams given explicit IDs are registered in a 
+        shared registry, so concurrent simulations should not reuse IDs.
+        
+        Examples
+        --------
+        Run simulations with different property packages in a thread pool:
+        
+        >>> import thermosteam as tmo
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> def simulate(chemicals):
+        ...     with tmo.settings.using(chemicals, cache=True):
+        ...         stream = tmo.Stream(**{chemicals[0]: 1.})
+        ...         return stream.chemicals.IDs
+        >>> with ThreadPoolExecutor(2) as executor:
+        ...     IDs = list(executor.map(simulate, [['Water'], ['Ethanol', 'Water']]))
+        >>> IDs
+        [('Water',), ('Ethanol', 'Water')]
+        
+        """
+        if not isinstance(thermo, tmo.Thermo):
+            thermo = tmo.Thermo(thermo, cache=cache)
+        token = active_thermo.set(thermo)
+        try: yield thermo
+        finally: active_thermo.reset(token)
     
     def get_chemicals(self):
         """Return a default Chemicals object."""
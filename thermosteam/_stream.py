@@ -8,6 +8,7 @@
 """
 """
 import numpy as np
+import pickle
 import thermosteam as tmo
 from . import indexer
 from . import equilibrium as eq
@@ -25,6 +26,25 @@ mol_units = indexer.ChemicalMolarFlowIndexer.units
 mass_units = indexer.ChemicalMassFlowIndexer.units
 vol_units = indexer.ChemicalVolumetricFlowIndexer.units
 
+def unpickle_stream(cls, fingerprint, ID, phase, T, P, price, flow):
+    thermo = tmo.Thermo.get_registered(fingerprint)
+    chemicals = thermo.chemicals
+    data = np.frombuffer(flow, float)
+    if not data.flags.writeable: data = data.copy()
+    stream = cls.__new__(cls)
+    stream._sink = stream._source = None
+    stream._thermo = thermo
+    stream._thermal_condition = tmo.ThermalCondition(T, P)
+    if isinstance(phase, tuple):
+        data = data.reshape([len(phase), chemicals.size])
+        stream._imol = indexer.MolarFlowIndexer.from_data(data, phase, chemicals, False)
+    else:
+        stream._imol = indexer.ChemicalMolarFlowIndexer.from_data(data, phase, chemicals, False)
+    stream._price = price
+    stream._ID = ID
+    stream._init_cache()
+    return stream
+
 # %%
 
 @utils.thermo_user
@@ -91,19 +111,20 @@ class Stream:
     >>> s1.mol # Molar flow rates [kmol/hr]
     array([1.11 , 0.217])
     
-    Mass and volumetric flow rates are available as property arrays:
+    Mass and volumetric flow rates are available as vectorized views of 
+    the molar flow rates:
         
     >>> s1.mass
-    property_array([<Water: 20 kg/hr>, <Ethanol: 10 kg/hr>])
+    MassFlowData([20., 10.])
     >>> s1.vol
-    property_array([<Water: 0.02006 m^3/hr>, <Ethanol: 0.012722 m^3/hr>])
+    VolumetricFlowData([0.02 , 0.013])
     
-    These arrays work just like ordinary arrays, but the data is linked to the molar flows:
+    These views work just like ordinary arrays, but the data is linked to the molar flows:
     
     >>> # Mass flows are always up to date with molar flows
     >>> s1.mol[0] = 1
     >>> s1.mass[0]
-    <Water: 18.015 kg/hr>
+    18.015
     >>> # Changing mass flows changes molar flows
     >>> s1.mass[0] *= 2
     >>> s1.mol[0]
@@ -590,7 +611,7 @@ class Stream:
     
     @property
     def mass(self):
-        """[property_array] Mass flow rates in kg/hr."""
+        """[MassFlowData] Mass flow rates in kg/hr."""
         return self.imass._data
     @mass.setter
     def mass(self, value):
@@ -600,7 +621,7 @@ class Stream:
     
     @property
     def vol(self):
-        """[property_array] Volumetric flow rates in m3/hr."""
+        """[VolumetricFlowData] Volumetric flow rates in m3/hr."""
         return self.ivol._data
     @vol.setter
     def vol(self, value):
@@ -1144,6 +1165,17 @@ class Stream:
             else:
                 mol[index] = 0
     
+    def __reduce_ex__(self, protocol):
+        thermo = self._thermo
+        fingerprint = thermo.registered_fingerprint()
+        if fingerprint is None: return super().__reduce_ex__(protocol)
+        imol = self._imol
+        phase = imol._phases if isinstance(imol, indexer.MaterialIndexer) else imol.phase
+        flow = np.ascontiguousarray(imol._data)
+        if protocol >= 5: flow = pickle.PickleBuffer(flow)
+        return unpickle_stream, (self.__class__, fingerprint, self._ID, phase,
+                                 *self._thermal_condition, self._price, flow)
+    
     def copy(self, ID=None):
         """
         Return a copy of the stream.
@@ -12,6 +12,7 @@ from ._chemical import Chemical
 from ._chemicals import Chemicals
 from .mixture import Mixture, ideal_mixture
 from .utils import read_only, cucumber
+import hashlib
 
 __all__ = ('Thermo',)
 
@@ -128,6 +129,8 @@ class Thermo:
     
     """
     __slots__ = ('chemicals', 'mixture', 'Gamma', 'Phi', 'PCF') 
+    _registry = {}
+    _registered_fingerprints = {} # id(thermo) -> fingerprint
     
     def __init__(self, chemicals, mixture=None,
                  Gamma=eq.DortmundActivityCoefficients,
@@ -155,6 +158,107 @@ class Thermo:
         setattr(self, 'Phi', Phi)
         setattr(self, 'PCF', PCF)
     
+    def __reduce_ex__(self, protocol):
+        fingerprint = self.registered_fingerprint()
+        if fingerprint is None:
+            return self.__reduce__()
+        else:
+            return Thermo.get_registered, (fingerprint,)
+    
+    @property
+    def fingerprint(self):
+        """
+        [str] Deterministic identifier of property package (the same across 
+        processes and runs). It is computed from the fingerprint of the
+        chemicals, the mixture rule, the Gamma, Phi, and PCF classes, and 
+        the binary interaction parameters of the Phi class (if any).
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> thermo = tmo.Thermo(['Water', 'Ethanol'], cache=True)
+        >>> ideal = thermo.ideal()
+        >>> thermo.fingerprint == ideal.fingerprint
+        False
+        >>> thermo.fingerprint == tmo.Thermo(['Water', 'Ethanol'], cache=True).fingerprint
+        True
+        
+        """
+        mixture = self.mixture
+        lines = [self.chemicals.fingerprint,
+                 f"{type(mixture).__qualname__}:{mixture.rule}",
+                 *[f"{i.__module__}.{i.__qualname__}" 
+                   for i in (self.Gamma, self.Phi, self.PCF)]]
+        kijs = getattr(self.Phi, 'interaction_parameters', None)
+        if kijs:
+            IDs = set(self.chemicals.IDs)
+            kijs = sorted([(i, float(j)) for i, j in kijs.items() if IDs.issuperset(i)])
+            if kijs: lines.append(repr(kijs))
+        data = '\n'.join(lines)
+        return hashlib.sha1(data.encode()).hexdigest()
+    
+    def register(self):
+        """
+        Register property package (and its chemicals) under its fingerprint.
+        Registered property packages are pickled by fingerprint only, and so
+        are Stream and MultiStream objects that use them (along with their
+        thermal condition and flow rate data). Each process that unpickles 
+        these objects must register an equivalent property package first.
+        The fingerprint is computed once on registration; register again after
+        changing the chemicals or interaction parameters.
+        
+        Examples
+        --------
+        >>> import pickle
+        >>> import thermosteam as tmo
+        >>> thermo = tmo.Thermo(['Water', 'Ethanol'], cache=True)
+        >>> thermo.register()
+        >>> pickle.loads(pickle.dumps(thermo)) is thermo
+        True
+        
+        """
+        self.chemicals.register()
+        fingerprint = self.fingerprint
+        registry = self._registry
+        registered_fingerprints = self._registered_fingerprints
+        other = registry.get(fingerprint)
+        if other is not None: del registered_fingerprints[id(other)]
+        old_fingerprint = registered_fingerprints.get(id(self))
+        if old_fingerprint is not None: del registry[old_fingerprint]
+        registry[fingerprint] = self
+        registered_fingerprints[id(self)] = fingerprint
+    
+    def registered_fingerprint(self):
+        """
+        Return the fingerprint the property package was registered under 
+        or None if it is not registered. Registration is checked by identity, 
+        so the fingerprint is not computed again.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> thermo = tmo.Thermo(['Water', 'Ethanol'], cache=True)
+        >>> thermo.register()
+        >>> thermo.registered_fingerprint() == thermo.fingerprint
+        True
+        >>> tmo.Thermo(['Water', 'Ethanol'], cache=True).registered_fingerprint()
+        
+        """
+        return self._registered_fingerprints.get(id(self))
+    
+    def isregistered(self):
+        """Return whether property package is registered."""
+        return id(self) in self._registered_fingerprints
+    
+    @classmethod
+    def get_registered(cls, fingerprint):
+        """Return the Thermo object registered under the given fingerprint."""
+        try:
+            return cls._registry[fingerprint]
+        except KeyError:
+            raise LookupError(f"no property package registered under fingerprint {repr(fingerprint)}; "
+                               "use <Thermo>.register() in this process first")
+    
     def ideal(self):
         """Ideal thermodynamic property package."""
         cls = self.__class__
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import hashlib
+import numpy as np
+from types import FunctionType, BuiltinFunctionType, MethodType, CodeType
+from .functor import Functor
+from .thermo_model import ThermoModel
+from .thermo_model_handle import ThermoModelHandle
+from .phase_handle import PhaseHandle
+
+__all__ = ('fingerprint_data',)
+
+# %% Utilities
+
+def qualified_name(obj):
+    return f"{getattr(obj, '__module__', None)}.{getattr(obj, '__qualname__', type(obj).__name__)}"
+
+def get_slots(cls, cache={}):
+    if cls in cache: return cache[cls]
+    slots = []
+    for base in reversed(cls.__mro__):
+        for i in base.__dict__.get('__slots__', ()):
+            if i not in ('__dict__', '__weakref__'): slots.append(i)
+    cache[cls] = slots
+    return slots
+
+def is_importable(f):
+    return f.__closure__ is None and '<' not in f.__qualname__
+
+def encode_code(code, write, active):
+    write(code.co_code)
+    for i in code.co_consts:
+        if isinstance(i, CodeType):
+            encode_code(i, write, active)
+        else:
+            encode(i, write, active)
+        write(',')
+
+def cell_contents(cell):
+    try: return cell.cell_contents
+    except ValueError: return None # Empty cell
+
+def encode(obj, write, active):
+    isa = isinstance
+    if obj is None or isa(obj, (bool, int, str)):
+        write(repr(obj))
+    elif isa(obj, (float, np.floating)):
+        write(repr(float(obj)))
+    elif isa(obj, np.integer):
+        write(repr(int(obj)))
+    elif isa(obj, (type, BuiltinFunctionType)) or (isa(obj, FunctionType) 
+                                                   and is_importable(obj)):
+        write(qualified_name(obj))
+    elif isa(obj, MethodType):
+        write(qualified_name(obj.__func__))
+    elif isa(obj, ThermoModelHandle):
+        # Handles referenced by models are encoded by their parent chemical
+        write(f"<{type(obj).__name__}: {obj._var}>")
+    elif isa(obj, PhaseHandle):
+        write(f"<{type(obj).__name__}: {obj.var}>")
+    elif hasattr(obj, 'fingerprint') and hasattr(obj, 'CAS'):
+        # Chemicals referenced by models are only encoded by ID
+        write(f"<{type(obj).__name__}: {obj.ID}>")
+    else:
+        key = id(obj)
+        if key in active:
+            write('<cycle>')
+            return
+        active.add(key)
+        if isa(obj, np.ndarray):
+            write(f"ndarray{obj.dtype.str}{obj.shape}")
+            if obj.dtype.hasobject:
+                for i in obj.flat: encode(i, write, active)
+            else:
+                write(np.ascontiguousarray(obj).tobytes())
+        elif isa(obj, (tuple, list)):
+            write('(')
+            for i in obj:
+                encode(i, write, active)
+                write(',')
+            write(')')
+        elif isa(obj, dict):
+            write('{')
+            for i in sorted(obj, key=repr):
+                encode(i, write, active)
+                write(':')
+                encode(obj[i], write, active)
+                write(',')
+            write('}')
+        elif isa(obj, (set, frozenset)):
+            write('{')
+            for i in sorted(obj, key=repr):
+                encode(i, write, active)
+                write(',')
+            write('}')
+        elif isa(obj, FunctionType):
+            # Closures and lambdas cannot be recovered by name alone
+            write(qualified_name(obj))
+            encode_code(obj.__code__, write, active)
+            encode(obj.__defaults__, write, active)
+            if obj.__closure__:
+                encode([cell_contents(i) for i in obj.__closure__], write, active)
+        elif isa(obj, Functor):
+            write(qualified_name(type(obj)))
+            encode(obj.__dict__, write, active)
+        elif isa(obj, ThermoModel) or not hasattr(obj, '__dict__'):
+            write(qualified_name(type(obj)))
+            write('(')
+            for i in get_slots(type(obj)):
+                write(i)
+                write('=')
+                encode(getattr(obj, i, None), write, active)
+                write(',')
+            write(')')
+        else:
+            write(qualified_name(type(obj)))
+            encode(obj.__dict__, write, active)
+        active.remove(key)
+
+def fingerprint_data(*data):
+    """
+    Return a deterministic SHA-1 hexdigest of given data (the same across
+    processes and runs).
+
+    Notes
+    -----
+    Numbers, strings, arrays, and containers are encoded by value. Classes
+    and module-level functions are encoded by their qualified name, while
+    closures and lambdas are also encoded by their code, defaults, and 
+    captured values. Functors and
+    thermodynamic models are encoded by their class and parameters,
+    while handles and chemicals referenced by other objects are only
+    encoded by name.
+
+    Examples
+    --------
+    >>> from thermosteam.base import fingerprint_data
+    >>> fingerprint_data(1., 'Water') == fingerprint_data(1., 'Water')
+    True
+    >>> fingerprint_data(1., 'Water') == fingerprint_data(2., 'Water')
+    False
+
+    """
+    hasher = hashlib.sha1()
+    update = hasher.update
+    parts = []
+    write = parts.append
+    encode(data, write, set())
+    text = []
+    for i in parts:
+        if i.__class__ is bytes:
+            if text: 
+                update(''.join(text).encode())
+                text.clear()
+            update(i)
+        else:
+            text.append(i)
+    if text: update(''.join(text).encode())
+    return hasher.hexdigest()
@@ -10,12 +10,23 @@
 from ..units_of_measure import chemical_units_of_measure
 from .. import utils
 from .. import functors
-from inspect import signature
+from ..exceptions import DomainError
+from inspect import signature, Parameter
+from numpy import ndarray
+from warnings import catch_warnings, simplefilter
+import numpy as np
+import numba
+try:
+    from numpy.exceptions import ComplexWarning
+except ImportError: # pragma: no cover
+    from numpy import ComplexWarning
 
 __all__ = ("functor", "Functor",  "TFunctor", 
-           "TPFunctor", "TIntegralFunctor", 'display_asfunctor', 
+           "TPFunctor", "TIntegralFunctor", "CompiledFunctor",
+           'display_asfunctor', 
            'functor_lookalike', 'functor_matching_params', 
-           'parse_var', 'get_units', 'var_with_units')
+           'parse_var', 'get_units', 'var_with_units', 'array_call',
+           'differentiate')
 
 REGISTERED_ARGS = set()
 REGISTERED_FUNCTORS = []
@@ -71,10 +82,131 @@ def var_with_units(var, units=None):
     if units: var += f' [{units}]'
     return var
 
+def map_elements(f, *args):
+    # Evaluate a function of scalars element-wise (elements are converted 
+    # to Python scalars, which follow math rather than numpy error rules)
+    arrays = np.broadcast_arrays(*args)
+    values = [f(*i) for i in zip(*[i.ravel().tolist() for i in arrays])]
+    return np.array(values).reshape(arrays[0].shape)
+
+def call_with_arrays(f, args):
+    # Return values of the function evaluated with arrays or None if the 
+    # function does not support arrays (e.g. math functions raise a TypeError 
+    # and conditionals raise a ValueError)
+    try:
+        values = f(*args)
+    except DomainError:
+        raise
+    except (TypeError, ValueError):
+        return None
+    shape = np.broadcast_shapes(*[np.shape(i) for i in args])
+    try:
+        return np.array(np.broadcast_to(values, shape))
+    except ValueError:
+        return None
+
+def try_array_call(f, args):
+    # Return values of the function evaluated with arrays or None if the 
+    # function does not support arrays or numpy raises a FloatingPointError
+    # (e.g. invalid values at some elements out of range, which are 
+    # evaluated element-wise just like scalars)
+    try:
+        return call_with_arrays(f, args)
+    except FloatingPointError:
+        return None
+
+def array_call(f, *args):
+    """
+    Return the values of a function evaluated at arrays of arguments. If the
+    function does not support arrays, it is evaluated element-wise.
+    
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from math import exp
+    >>> from thermosteam.base import array_call
+    >>> array_call(lambda T: exp(-1000. / T), np.array([300., 400.]))
+    array([0.036, 0.082])
+    
+    """
+    values = try_array_call(f, args)
+    return map_elements(f, *args) if values is None else values
+
+def complex_step(f, x, h=1e-20):
+    # Return the derivative by the complex-step method or None if the 
+    # function does not support complex numbers (e.g. math functions 
+    # raise a TypeError, comparisons raise a TypeError or ValueError, and
+    # casting complex numpy values to real raises a ComplexWarning)
+    try:
+        with catch_warnings():
+            simplefilter('error', ComplexWarning)
+            value = f(x + h*1j if x.__class__ is ndarray else complex(x, h))
+    except DomainError:
+        raise
+    except (TypeError, ValueError, ComplexWarning):
+        return None
+    return value.imag / h if np.iscomplexobj(value) else None
+
+def central_difference(f, x, dx=None):
+    if dx is None: dx = 6e-6 * (abs(x) + 1.)
+    return (f(x + dx) - f(x - dx)) / (2. * dx)
+
+def differentiate(f, x, dx=None):
+    """
+    Return the derivative of a function at `x`. The complex-step method is
+    used if the function supports complex numbers and no step size is given;
+    otherwise, central differences are used.
+    
+    Examples
+    --------
+    >>> from math import exp
+    >>> from thermosteam.base import differentiate
+    >>> differentiate(lambda T: T**3, 2.)
+    12.0
+    >>> round(differentiate(lambda T: exp(-1000. / T), 300.), 9)
+    0.000396378
+    
+    """
+    if dx is None:
+        derivative = complex_step(f, x)
+        if derivative is not None: return derivative
+    return central_difference(f, x, dx)
+
+
+# %% Compiled kernels
+
+def numba_counterparts(f):
+    # Yield numba-compatible versions of the function (functions of the 
+    # chemicals library may depend on other functions, which are only 
+    # compatible through the chemicals.numba module)
+    yield numba.njit(f)
+    if f.__module__.startswith('chemicals.'):
+        try: import chemicals.numba as chemicals_numba
+        except Exception: return
+        f = getattr(chemicals_numba, f.__name__, None)
+        if f is not None: yield f
+
+def compile_kernel(f, args, params):
+    # Return a numba-compiled function which takes the arguments (e.g. T and P)
+    # followed by a float64 array of parameters, or None if the function is 
+    # not numba-compatible
+    arguments = ', '.join(args)
+    parameters = ', '.join([f'parameters[{i}]' for i in range(len(params))])
+    source = (f"def kernel({arguments}, parameters):\n"
+              f"    return f({arguments}, {parameters})")
+    kernel_signature = numba.float64(*[numba.float64 for i in args], numba.float64[::1])
+    with catch_warnings():
+        simplefilter('ignore')
+        for f in numba_counterparts(f):
+            namespace = {'f': f}
+            exec(source, namespace)
+            try: return numba.njit(kernel_signature)(namespace['kernel'])
+            except Exception: pass
+
 
 # %% Decorator
   
-def functor(f=None, var=None, units=None):
+def functor(f=None, var=None, units=None, derivative_by_T=None, derivative_by_P=None):
     """
     Decorate a function of temperature, or both temperature and pressure 
     to have an attribute, `functor`, that serves to create its functor counterpart.
@@ -88,6 +220,12 @@ def functor(f=None, var=None, units=None):
         Name of variable returned (useful for bookkeeping).
     units : dict, optional
         Units of measure for functor signature.
+    derivative_by_T : function(T, *args) or function(T, P, *args), optional
+        Analytic derivative of the function with respect to temperature.
+        Functors differentiate by the complex-step method if not given.
+    derivative_by_P : function(T, P, *args), optional
+        Analytic derivative of the function with respect to pressure.
+        Functors differentiate by the complex-step method if not given.
     
     Returns
     -------
@@ -122,11 +260,31 @@ def functor(f=None, var=None, units=None):
     >>> f(T=373.15)
     101157.148
     
+    Functors also accept arrays (functions which do not support arrays
+    are evaluated element-wise):
+    
+    >>> import numpy as np
+    >>> f(np.array([353.15, 373.15]))
+    array([ 47362.558, 101157.148])
+    
     All functors are saved in the `functors` module:
     
     >>> tmo.functors.Antoine
     <class 'thermosteam.functors.Antoine'>
     
+    Functors differentiate by the complex-step method, or by the analytic
+    derivative if registered:
+    
+    >>> from math import log
+    >>> def dAntoine_dT(T, a, b, c):
+    ...     return 10.0**(a - b / (T + c)) * b * log(10.) / (T + c)**2
+    >>> @tmo.functor(var='Psat', derivative_by_T=dAntoine_dT)
+    ... def Antoine(T, a, b, c):
+    ...     return 10.0**(a - b / (T + c))
+    >>> f = Antoine.functor(a=10.116, b=1687.5, c=-42.98)
+    >>> round(f.differentiate_by_T(373.15), 1)
+    3605.6
+    
     """
     if f:
         params = tuple(signature(f).parameters)
@@ -136,12 +294,14 @@ def functor(f=None, var=None, units=None):
                'params': params,
                'units': units,
                'var': var}
+        if derivative_by_T: dct['derivative_by_T'] = staticmethod(derivative_by_T)
+        if derivative_by_P: dct['derivative_by_P'] = staticmethod(derivative_by_P)
         name = f.__name__
         f.functor = cls = type(name, (base,), dct)
         cls.__module__ = functors.__name__
         setattr(functors, name, cls)
     else:
-        return lambda f: functor(f, var, units)
+        return lambda f: functor(f, var, units, derivative_by_T, derivative_by_P)
     return f
 
 
@@ -150,6 +310,18 @@ def functor(f=None, var=None, units=None):
 class Functor:
     __slots__ = ('__dict__',)
     hook = None
+    
+    #: [bool or None] Whether the function of the functor supports arrays 
+    #: (None if not yet known).
+    vectorized = None
+    
+    #: [function or None] Analytic derivatives of the function with respect
+    #: to temperature and pressure (None if not registered).
+    derivative_by_T = derivative_by_P = None
+    
+    #: [bool or None] Whether the function of the functor supports complex
+    #: numbers for complex-step differentiation (None if not yet known).
+    complex_step = None
 
     def __init_subclass__(cls, args=None):
         if args:
@@ -170,12 +342,109 @@ class Functor:
     def set_value(self, var, value):
         if var in self.__dict__: self.__dict__[var] = value
     
+    def _call_with_arrays(self, *args):
+        # Evaluate with arrays if supported (as learned from the first call
+        # with many elements), or element-wise otherwise
+        cls = self.__class__
+        if cls.vectorized is not False:
+            try:
+                values = call_with_arrays(self._evaluate, args)
+            except FloatingPointError:
+                pass # Arrays may be supported, but not at some elements
+            else:
+                if values is not None:
+                    if values.size > 1: cls.vectorized = True
+                    return values
+                cls.vectorized = False
+        return map_elements(self._evaluate, *args)
+    
+    def _differentiate(self, f, x):
+        # Differentiate by the complex-step method if supported (as learned
+        # from the first call with a scalar), or by central differences
+        cls = self.__class__
+        if cls.complex_step is not False:
+            derivative = complex_step(f, x)
+            if derivative is not None: 
+                if x.__class__ is not ndarray: cls.complex_step = True
+                return derivative
+            if x.__class__ is not ndarray: cls.complex_step = False
+        if x.__class__ is ndarray:
+            values = try_array_call(lambda x: central_difference(f, x), (x,))
+            return map_elements(lambda x: self._differentiate(f, x), x) if values is None else values
+        return central_difference(f, x)
+    
     def copy(self):
         cls = self.__class__
         new = cls.__new__(cls)
         new.__dict__ = self.__dict__.copy()
         return new
     
+    @classmethod
+    def compile_kernel(cls):
+        """
+        Return a numba-compiled kernel of the function which takes the 
+        arguments of the functor (e.g. T and P) followed by a float64 array 
+        of parameters (as given by `pack_parameters`), or None if the 
+        function is not numba-compatible. Kernels are compiled once per
+        functor class and may be called from other numba-compiled functions.
+        
+        """
+        kernel = cls.__dict__.get('_kernel')
+        if kernel is None:
+            cls._kernel = kernel = compile_kernel(cls.function, cls._args, cls.params) or False
+        return kernel or None
+    
+    def pack_parameters(self):
+        """
+        Return the parameters of the function as a float64 array, or None 
+        if not all parameters are numbers.
+        
+        """
+        data = self.__dict__
+        defaults = signature(self.function).parameters
+        values = []
+        for name in self.params:
+            value = data[name] if name in data else defaults[name].default
+            if value is Parameter.empty or not isinstance(value, (int, float, np.number)): return None
+            values.append(value)
+        return np.array(values, dtype=float)
+    
+    def compile(self):
+        """
+        Return a copy of the functor which is evaluated by its numba-compiled
+        kernel (without unpacking keyword arguments), or the same functor if 
+        it has a hook or if its function or parameters are not 
+        numba-compatible.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> f = tmo.functors.Antoine(A=10.116, B=1687.5, C=-42.98)
+        >>> compiled_f = f.compile()
+        >>> compiled_f.parameters
+        array([  10.116, 1687.5  ,  -42.98 ,   10.   ])
+        >>> round(compiled_f(373.15), 2) == round(f(373.15), 2)
+        True
+        
+        """
+        if self.hook: return self
+        parameters = self.pack_parameters()
+        if parameters is None: return self
+        cls = self.__class__
+        compiled_class = cls.__dict__.get('_compiled_class')
+        if compiled_class is None:
+            kernel = cls.compile_kernel()
+            if kernel is None: 
+                cls._compiled_class = False
+                return self
+            cls._compiled_class = compiled_class = compiled_functor_class(cls, kernel)
+        elif not compiled_class:
+            return self
+        new = compiled_class.__new__(compiled_class)
+        new.__dict__ = self.__dict__.copy()
+        new.parameters = parameters
+        return new
+    
     @classmethod
     def from_other(cls, other):
         self = cls.__new__(cls)
@@ -231,22 +500,120 @@ class TFunctor(Functor, args=('T',)):
     __slots__ = ()
     kind = "functor of temperature (T; in K)"
     def __call__(self, T, P=None):
+        if T.__class__ is ndarray: return self._call_with_arrays(T)
+        return self.hook(T, self.__dict__) if self.hook else self.function(T, **self.__dict__)
+    
+    def _evaluate(self, T):
         return self.hook(T, self.__dict__) if self.hook else self.function(T, **self.__dict__)
+    
+    def differentiate_by_T(self, T, P=None):
+        if self.derivative_by_T and not self.hook: 
+            if T.__class__ is ndarray: 
+                return array_call(lambda T: self.derivative_by_T(T, **self.__dict__), T)
+            return self.derivative_by_T(T, **self.__dict__)
+        return self._differentiate(self._evaluate, T)
+    
+    def differentiate_by_P(self, T, P=None):
+        return 0.
 
 class TPFunctor(Functor, args=('T', 'P')):
     __slots__ = ()
     kind = "functor of temperature (T; in K) and pressure (P; in Pa)"
     def __call__(self, T, P):
+        if T.__class__ is ndarray or P.__class__ is ndarray: return self._call_with_arrays(T, P)
+        return self.hook(T, P, self.__dict__) if self.hook else self.function(T, P, **self.__dict__)
+    
+    def _evaluate(self, T, P):
         return self.hook(T, P, self.__dict__) if self.hook else self.function(T, P, **self.__dict__)
+    
+    def differentiate_by_T(self, T, P):
+        if T.__class__ is ndarray or P.__class__ is ndarray: 
+            return map_elements(self.differentiate_by_T, T, P)
+        if self.derivative_by_T and not self.hook: 
+            return self.derivative_by_T(T, P, **self.__dict__)
+        return self._differentiate(lambda T: self._evaluate(T, P), T)
+    
+    def differentiate_by_P(self, T, P):
+        if T.__class__ is ndarray or P.__class__ is ndarray: 
+            return map_elements(self.differentiate_by_P, T, P)
+        if self.derivative_by_P and not self.hook: 
+            return self.derivative_by_P(T, P, **self.__dict__)
+        return self._differentiate(lambda P: self._evaluate(T, P), P)
 
 class TIntegralFunctor(Functor, args=('Ta', 'Tb')):
     __slots__ = ()
     kind = "temperature integral functor (Ta to Tb; in K)"
     def __call__(self, Ta, Tb, P=None):
+        if Ta.__class__ is ndarray or Tb.__class__ is ndarray: return self._call_with_arrays(Ta, Tb)
+        return self.hook(Ta, Tb, self.__dict__) if self.hook else self.function(Ta, Tb, **self.__dict__)
+    
+    def _evaluate(self, Ta, Tb):
         return self.hook(Ta, Tb, self.__dict__) if self.hook else self.function(Ta, Tb, **self.__dict__)
 
 
+# %% Compiled functors
 
+class CompiledFunctor:
+    """
+    Abstract class for functors evaluated by a numba-compiled kernel with a 
+    packed float64 array of parameters (see `Functor.compile`). Compiled 
+    functors are otherwise the same as their original functors (and are 
+    pickled as such).
     
+    """
+    __slots__ = ()
+    
+    def compile(self):
+        return self
+    
+    def set_value(self, var, value):
+        super().set_value(var, value)
+        parameters = self.pack_parameters()
+        if parameters is None: 
+            raise ValueError(f"{var!r} must be a number to evaluate compiled functor")
+        self.parameters = parameters
     
-    
\ No newline at end of file
+    def copy(self):
+        new = super().copy()
+        new.parameters = self.parameters.copy()
+        return new
+    __copy__ = copy
+    
+    def __reduce__(self):
+        return self._uncompiled_class.from_kwargs, (self.__dict__.copy(),)
+
+class CompiledTFunctor(CompiledFunctor):
+    __slots__ = ()
+    def __call__(self, T, P=None):
+        if T.__class__ is ndarray: return self._call_with_arrays(T)
+        return self._entry_point(T, self.parameters)
+
+class CompiledTPFunctor(CompiledFunctor):
+    __slots__ = ()
+    def __call__(self, T, P):
+        if T.__class__ is ndarray or P.__class__ is ndarray: return self._call_with_arrays(T, P)
+        return self._entry_point(T, P, self.parameters)
+
+class CompiledTIntegralFunctor(CompiledFunctor):
+    __slots__ = ()
+    def __call__(self, Ta, Tb, P=None):
+        if Ta.__class__ is ndarray or Tb.__class__ is ndarray: return self._call_with_arrays(Ta, Tb)
+        return self._entry_point(Ta, Tb, self.parameters)
+
+COMPILED_FUNCTORS = {TFunctor: CompiledTFunctor,
+                     TPFunctor: CompiledTPFunctor,
+                     TIntegralFunctor: CompiledTIntegralFunctor}
+
+def compiled_functor_class(cls, kernel):
+    # Compiled functors are named (and fingerprinted) as the original functors;
+    # the entry point of the kernel is called directly to skip type dispatch
+    entry_point = kernel.overloads[kernel.signatures[0]].entry_point
+    for base in cls.__mro__:
+        if base in COMPILED_FUNCTORS: break
+    dct = {'__slots__': ('parameters',),
+           '__module__': cls.__module__,
+           '__qualname__': cls.__qualname__,
+           'kernel': staticmethod(kernel),
+           '_entry_point': staticmethod(entry_point),
+           '_uncompiled_class': cls}
+    return type(cls.__name__, (COMPILED_FUNCTORS[base], cls), dct)
@@ -7,20 +7,28 @@
 # for license details.
 """
 """
-from math import log
+from math import log, log1p, factorial, floor
 from .functor import TFunctor, TPFunctor, Functor, \
-                     display_asfunctor, functor_matching_params, functor_name
+                     display_asfunctor, functor_matching_params, functor_name, \
+                     array_call, differentiate, central_difference
 from ..units_of_measure import chemical_units_of_measure, definitions, format_plot_units, convert
 from numpy import inf as infinity
 from inspect import signature
+from bisect import bisect_right
+from warnings import warn
+from threading import Lock
 import numpy as np
+import numba
+from numpy.polynomial import chebyshev
 import matplotlib.pyplot as plt
-from scipy.interpolate import interp1d
+from scipy.interpolate import make_interp_spline
 
 __all__ = ('thermo_model', 'create_axis_labels', 
            'ThermoModel', 'TDependentModel', 'TPDependentModel', 
            'ConstantThermoModel', 'ConstantTDependentModel',
-           'ConstantTPDependentModel', 'InterpolatedTDependentModel')
+           'ConstantTPDependentModel', 'InterpolatedTDependentModel',
+           'ChebyshevTDependentModel', 'ChebyshevTPDependentModel',
+           'AntiderivativeTable', 'AntiderivativeTables')
 
 REGISTERED_MODELS = []
 
@@ -72,6 +80,562 @@ def create_axis_labels(Xvar, X_units, Yvar, Y_units):
     plt.ylabel(Yvar_description)
 
 
+# %% Piecewise Chebyshev series
+
+def chebval(x, c):
+    # Clenshaw recurrence (faster than numpy for scalars)
+    b1 = b2 = 0.
+    x2 = 2. * x
+    for i in c[:0:-1]: b1, b2 = i + x2 * b1 - b2, b1
+    return c[0] + x * b1 - b2
+
+def locate(breakpoints, x):
+    # Return the index of the interval containing x and the local coordinate
+    index = min(max(bisect_right(breakpoints, x) - 1, 0), len(breakpoints) - 2)
+    a = breakpoints[index]
+    b = breakpoints[index + 1]
+    return index, (2. * x - a - b) / (b - a)
+
+def chebval_piecewise(breakpoints, coefficients, x):
+    # Evaluate a piecewise Chebyshev series at an array
+    index = np.searchsorted(breakpoints, x, 'right') - 1
+    index = np.clip(index, 0, len(breakpoints) - 2)
+    breakpoints = np.asarray(breakpoints)
+    a = breakpoints[index]
+    b = breakpoints[index + 1]
+    x = (2. * x - a - b) / (b - a)
+    values = np.empty(x.shape)
+    for i in np.unique(index):
+        mask = index == i
+        values[mask] = chebyshev.chebval(x[mask], coefficients[i])
+    return values
+
+def chebval2d_piecewise(T_breakpoints, P_breakpoints, coefficients, T, P):
+    # Evaluate a piecewise Chebyshev series in temperature and pressure at arrays
+    T, P = np.broadcast_arrays(T, P)
+    index = []
+    local = []
+    for breakpoints, x in ((T_breakpoints, T), (P_breakpoints, P)):
+        i = np.clip(np.searchsorted(breakpoints, x, 'right') - 1, 0, len(breakpoints) - 2)
+        breakpoints = np.asarray(breakpoints)
+        a = breakpoints[i]
+        b = breakpoints[i + 1]
+        index.append(i)
+        local.append((2. * x - a - b) / (b - a))
+    i, j = index
+    x, y = local
+    values = np.empty(x.shape)
+    for m, n in set(zip(i.flat, j.flat)):
+        mask = (i == m) & (j == n)
+        values[mask] = chebyshev.chebval2d(x[mask], y[mask], np.transpose(coefficients[m][n]))
+    return values
+
+def pack_chebyshev(breakpoints, coefficients):
+    # Return a float64 array with the number of intervals, the breakpoints, 
+    # the offsets of the coefficients of each interval, and the coefficients
+    N = len(coefficients)
+    offsets = [2 * N + 3]
+    for c in coefficients: offsets.append(offsets[-1] + len(c))
+    return np.array([N, *breakpoints, *offsets, *[i for c in coefficients for i in c]], dtype=float)
+
+def pack_chebyshev_2d(T_breakpoints, P_breakpoints, coefficients):
+    # Return a float64 array with the number of intervals in temperature and
+    # pressure, the breakpoints, the offsets of the coefficients of each 
+    # interval, and for each interval the number of series in pressure and
+    # terms in temperature followed by the coefficients (row-major)
+    NT = len(T_breakpoints) - 1
+    NP = len(P_breakpoints) - 1
+    offsets = [NT + NP + 4 + NT * NP]
+    blocks = []
+    for row in coefficients:
+        for C in row:
+            C = np.asarray(C, dtype=float)
+            blocks.append([*C.shape, *C.flat])
+            offsets.append(offsets[-1] + len(blocks[-1]))
+    return np.array([NT, NP, *T_breakpoints, *P_breakpoints, *offsets[:-1],
+                     *[i for block in blocks for i in block]], dtype=float)
+
+def chebval_packed(x, data):
+    # Evaluate a piecewise Chebyshev series packed by `pack_chebyshev` 
+    # (compiled by numba)
+    N = int(data[0])
+    i = np.searchsorted(data[1:N + 2], x, 'right') - 1
+    if i < 0: i = 0
+    elif i > N - 1: i = N - 1
+    a = data[i + 1]
+    b = data[i + 2]
+    x = (2. * x - a - b) / (b - a)
+    start = int(data[N + 2 + i])
+    end = int(data[N + 3 + i])
+    b1 = b2 = 0.
+    x2 = 2. * x
+    for k in range(end - 1, start, -1): b1, b2 = data[k] + x2 * b1 - b2, b1
+    return data[start] + x * b1 - b2
+
+def chebval2d_packed(x, y, data):
+    # Evaluate a piecewise Chebyshev series in two variables packed by 
+    # `pack_chebyshev_2d` (compiled by numba)
+    NT = int(data[0])
+    NP = int(data[1])
+    i = np.searchsorted(data[2:NT + 3], x, 'right') - 1
+    if i < 0: i = 0
+    elif i > NT - 1: i = NT - 1
+    j = np.searchsorted(data[NT + 3:NT + NP + 4], y, 'right') - 1
+    if j < 0: j = 0
+    elif j > NP - 1: j = NP - 1
+    a = data[i + 2]
+    b = data[i + 3]
+    x = (2. * x - a - b) / (b - a)
+    a = data[NT + 3 + j]
+    b = data[NT + 4 + j]
+    y = (2. * y - a - b) / (b - a)
+    start = int(data[NT + NP + 4 + i * NP + j])
+    rows = int(data[start])
+    columns = int(data[start + 1])
+    start += 2
+    x2 = 2. * x
+    y2 = 2. * y
+    c1 = c2 = 0.
+    for m in range(rows - 1, -1, -1):
+        # Value of the series in x for the m-th polynomial in y
+        offset = start + m * columns
+        b1 = b2 = 0.
+        for k in range(columns - 1, 0, -1): b1, b2 = data[offset + k] + x2 * b1 - b2, b1
+        c = data[offset] + x * b1 - b2
+        if m: c1, c2 = c + y2 * c1 - c2, c1
+        else: return c + y * c1 - c2
+    return 0.
+
+def compile_entry_point(f, signature):
+    # Return the entry point of a numba-compiled function (which skips type
+    # dispatch)
+    kernel = numba.njit(signature)(f)
+    return kernel.overloads[kernel.signatures[0]].entry_point
+
+def chebyshev_nodes(N):
+    # Chebyshev nodes of the first kind (which exclude boundaries) in ascending order
+    return np.cos(np.pi * (np.arange(N, 0, -1) - 0.5) / N)
+
+def scale_of(values, axis, floor=1e-9):
+    # Pointwise scale of values for relative errors; the floor (a fraction of 
+    # the largest magnitude) prevents dividing by values that cross zero
+    magnitude = np.abs(values)
+    largest = magnitude.max(axis, keepdims=True)
+    largest = np.where(largest > 0., largest, 1.)
+    return np.maximum(magnitude, floor * largest)
+
+def trim_chebyshev(c, atol):
+    # Remove trailing coefficients (along the first axis) which add up to 
+    # less than the tolerance
+    magnitude = np.abs(c).reshape([len(c), -1]).sum(1)
+    dropped = np.cumsum(magnitude[::-1])[::-1]
+    N = len(c)
+    while N > 1 and dropped[N - 1] < atol: N -= 1
+    return c[:N]
+
+def fit_chebyshev(f, a, b, tol, N):
+    # Return coefficients of f(T) and f(T)/T and the maximum relative error
+    x = chebyshev_nodes(N)
+    x_test = 0.5 * (x[1:] + x[:-1])
+    T, T_test = [0.5 * (a + b) + 0.5 * (b - a) * i for i in (x, x_test)]
+    y = np.array([f(i) for i in T])
+    y = np.array([y, y / T]).transpose()
+    y_test = np.array([f(i) for i in T_test])
+    y_test = np.array([y_test, y_test / T_test]).transpose()
+    c = chebyshev.chebfit(x, y, N - 1)
+    error = (np.abs(chebyshev.chebval(x_test, c).transpose() - y_test) / scale_of(y_test, 0)).max()
+    atol = 0.1 * tol * scale_of(y, 0).min(0)
+    return [trim_chebyshev(c[:, i], atol[i]) for i in (0, 1)], error
+
+def fit_chebyshev_2d(f, a, b, c, d, tol, NT, NP):
+    # Return coefficients of f(T, P) and f(T, P)/T and the maximum relative 
+    # errors at midpoints in temperature and pressure
+    x = chebyshev_nodes(NT)
+    y = chebyshev_nodes(NP)
+    x_test = 0.5 * (x[1:] + x[:-1])
+    y_test = 0.5 * (y[1:] + y[:-1])
+    T, T_test = [0.5 * (a + b) + 0.5 * (b - a) * i for i in (x, x_test)]
+    P, P_test = [0.5 * (c + d) + 0.5 * (d - c) * i for i in (y, y_test)]
+    def values(Ts, Ps):
+        values = np.array([[f(T, P) for P in Ps] for T in Ts])
+        return np.array([values, values / Ts[:, None]])
+    Y = values(T, P)
+    C = np.array([chebyshev.chebfit(y, chebyshev.chebfit(x, i, NT - 1).transpose(), NP - 1).transpose()
+                  for i in Y])
+    Y_test = values(T_test, P)
+    error_T = np.abs([chebyshev.chebgrid2d(x_test, y, i) for i in C] - Y_test) / scale_of(Y_test, (1, 2))
+    Y_test = values(T, P_test)
+    error_P = np.abs([chebyshev.chebgrid2d(x, y_test, i) for i in C] - Y_test) / scale_of(Y_test, (1, 2))
+    atol = 0.05 * tol * scale_of(Y, (1, 2)).min((1, 2))
+    C = [trim_chebyshev(trim_chebyshev(C[i], atol[i]).transpose(), atol[i]) 
+         for i in (0, 1)] # Series in temperature for each polynomial in pressure
+    return C, error_T.max(), error_P.max()
+
+def breakpoints_of(models, lb, ub, Tmin='Tmin', Tmax='Tmax'):
+    # Boundaries of models within the range (where the active model may change)
+    breakpoints = {lb, ub}
+    for model in models:
+        for bound in (getattr(model, Tmin, None), getattr(model, Tmax, None)):
+            if bound is not None and lb < bound < ub: breakpoints.add(bound)
+    return sorted(breakpoints)
+
+def not_converged(tol, error):
+    warn(f"surrogate could not reach a tolerance of {tol:.3g}; "
+         f"maximum relative error is {error:.3g}", RuntimeWarning)
+
+def fit_piecewise_chebyshev(f, breakpoints, tol, N=16, N_max=256):
+    pending = list(zip(breakpoints[:-1], breakpoints[1:]))
+    intervals = []
+    max_error = 0.
+    while pending:
+        a, b = pending.pop()
+        c, error = fit_chebyshev(f, a, b, tol, N)
+        if error > tol and len(intervals) + len(pending) < N_max - 1:
+            m = 0.5 * (a + b)
+            pending.append((a, m))
+            pending.append((m, b))
+        else:
+            intervals.append((a, b, c))
+            if error > max_error: max_error = error
+    if max_error > tol: not_converged(tol, max_error)
+    intervals.sort(key=lambda i: i[0])
+    breakpoints = [i[0] for i in intervals] + [intervals[-1][1]]
+    return breakpoints, [i[2] for i in intervals], max_error
+
+def fit_piecewise_chebyshev_2d(f, T_breakpoints, P_breakpoints, tol, NT=12, NP=8, N_max=64):
+    Ts = T_breakpoints
+    Ps = P_breakpoints
+    cache = {}
+    while True:
+        split_T = set()
+        split_P = set()
+        max_error = 0.
+        for i in range(len(Ts) - 1):
+            for j in range(len(Ps) - 1):
+                key = (Ts[i], Ts[i + 1], Ps[j], Ps[j + 1])
+                if key in cache:
+                    C, error_T, error_P = cache[key]
+                else:
+                    cache[key] = C, error_T, error_P = fit_chebyshev_2d(f, *key, tol, NT, NP)
+                if error_T > tol: split_T.add(i)
+                if error_P > tol: split_P.add(j)
+                max_error = max(max_error, error_T, error_P)
+        if not (split_T or split_P): break
+        if len(Ts) + len(split_T) > N_max + 1 or len(Ps) + len(split_P) > N_max + 1:
+            not_converged(tol, max_error)
+            break
+        Ts = refine_breakpoints(Ts, split_T)
+        Ps = refine_breakpoints(Ps, split_P)
+    coefficients = [[cache[Ts[i], Ts[i + 1], Ps[j], Ps[j + 1]][0] for j in range(len(Ps) - 1)]
+                    for i in range(len(Ts) - 1)]
+    return Ts, Ps, coefficients, max_error
+
+def refine_breakpoints(breakpoints, indices):
+    refined = []
+    for i, a in enumerate(breakpoints[:-1]):
+        refined.append(a)
+        if i in indices: refined.append(0.5 * (a + breakpoints[i + 1]))
+    refined.append(breakpoints[-1])
+    return refined
+
+def integrate_chebyshev(breakpoints, coefficients, Ta, Tb):
+    # Exact integral of a piecewise Chebyshev series; `coefficients` is a 
+    # function of the interval index
+    if Ta > Tb: return -integrate_chebyshev(breakpoints, coefficients, Tb, Ta)
+    start, _ = locate(breakpoints, Ta)
+    end, _ = locate(breakpoints, Tb)
+    integral = 0.
+    for i in range(start, end + 1):
+        a = breakpoints[i]
+        b = breakpoints[i + 1]
+        lb = Ta if i == start else a
+        ub = Tb if i == end else b
+        c = chebyshev.chebint(coefficients(i))
+        integral += 0.5 * (b - a) * (chebval((2. * ub - a - b) / (b - a), c)
+                                     - chebval((2. * lb - a - b) / (b - a), c))
+    return integral
+
+def differentiate_chebyshev(breakpoints, coefficients, T):
+    # Exact derivative of a piecewise Chebyshev series; `coefficients` is a 
+    # function of the interval index
+    i, x = locate(breakpoints, T)
+    return chebval(x, chebyshev.chebder(coefficients(i))) * 2. / (breakpoints[i + 1] - breakpoints[i])
+
+
+# %% Piecewise polynomial interpolation
+
+# Note: Coefficients of polynomials are in ascending powers of x = T - a, 
+# where `a` is the lower bound of the interval. Functions also accept 2d 
+# arrays of coefficients (with a column per element of x) to evaluate arrays.
+
+spline_degrees = {'zero': 0, 'slinear': 1, 'linear': 1, 'quadratic': 2, 'cubic': 3}
+
+def polyval(c, x):
+    y = 0.
+    for i in reversed(c): y = y * x + i
+    return y
+
+def polyval_derivative(c, x):
+    y = 0.
+    for i in range(len(c) - 1, 0, -1): y = y * x + i * c[i]
+    return y
+
+def integrate_polynomial(c, x):
+    # Integral from 0 to x
+    y = 0.
+    for i in range(len(c) - 1, -1, -1): y = (y + c[i] / (i + 1)) * x
+    return y
+
+def integrate_polynomial_over_T(c, a, x):
+    # Integral of the polynomial divided by T = x + a from 0 to x; the
+    # polynomial is divided by T (the remainder is its value at T = 0)
+    remainder = c[-1]
+    quotient = []
+    for i in c[-2::-1]:
+        quotient.append(remainder)
+        remainder = i - a * remainder
+    quotient.reverse()
+    logarithm = np.log1p(x / a) if x.__class__ is np.ndarray else log1p(x / a)
+    return integrate_polynomial(quotient, x) + remainder * logarithm
+
+def spline_coefficients(Ts, Ys, k):
+    # Return the breakpoints of an interpolating spline and the coefficients 
+    # of each interval between them (i.e. derivatives at the lower bound 
+    # divided by their factorial). Breakpoints include the data points and
+    # the knots of the spline (which differ for splines of even degree)
+    spline = make_interp_spline(Ts, Ys, k)
+    breakpoints = np.unique(np.concatenate([Ts, spline.t]))
+    lbs = breakpoints[:-1]
+    return breakpoints, np.array([spline(lbs, nu=i) / factorial(i) for i in range(k + 1)]).T
+
+def uniform_spacing(Ts):
+    # Return the spacing of a uniform grid (or None if not uniform)
+    dTs = np.diff(Ts)
+    dT = (Ts[-1] - Ts[0]) / dTs.size
+    return dT if np.allclose(dTs, dT, rtol=1e-9, atol=0.) else None
+
+
+# %% Numerical integration
+
+def gauss_legendre_points(N):
+    nodes, weights = np.polynomial.legendre.leggauss(N)
+    return nodes.tolist(), weights.tolist()
+
+def gauss_legendre(f, a, b, points):
+    # Return integrals of f and f/T from a to b by Gauss-Legendre quadrature
+    nodes, weights = points
+    half = 0.5 * (b - a)
+    middle = 0.5 * (b + a)
+    integral = integral_over_T = 0.
+    for x, w in zip(nodes, weights):
+        T = middle + half * x
+        y = w * f(T)
+        integral += y
+        integral_over_T += y / T
+    return half * integral, half * integral_over_T
+
+
+class AntiderivativeTable:
+    """
+    Create an AntiderivativeTable object that integrates a function of 
+    temperature by Gauss-Legendre quadrature over panels of fixed width.
+    Integrals of the function (and of the function over temperature) are 
+    tabulated at the edges of the panels as needed, so integrals between any
+    temperatures only require a table lookup and quadrature over a short 
+    panel at each end (quadratures of recent endpoints are cached).
+    
+    Parameters
+    ----------
+    f : function(T)
+        Function to integrate.
+    T0 : float, optional
+        Temperature at an edge of the panels [K]. Defaults to 0 K.
+    dT : float, optional
+        Width of the panels [K]. Defaults to 10 K.
+    N : int, optional
+        Number of Gauss-Legendre points per panel. Defaults to 5.
+    
+    Notes
+    -----
+    Tables may be shared by threads. Tables are extended under a lock and 
+    published as new lists, so lookups never see partially extended tables.
+    
+    Examples
+    --------
+    >>> from math import exp
+    >>> from thermosteam.base import AntiderivativeTable
+    >>> table = AntiderivativeTable(lambda T: exp(-500. / T))
+    >>> round(table.integrate(300., 1000.), 9) # Exact: 309.147896274
+    309.147896274
+    
+    """
+    __slots__ = ('function', 'T0', 'dT', 'points', 'table', 'cache', '_lock')
+    
+    #: [int] Maximum number of cached quadratures of endpoints.
+    cache_size = 256
+    
+    def __init__(self, f, T0=0., dT=10., N=5):
+        self.function = f
+        self.T0 = T0
+        self.dT = dT
+        self.points = gauss_legendre_points(N)
+        self._lock = Lock()
+        self.clear()
+    
+    def __reduce__(self):
+        return type(self), (self.function, self.T0, self.dT, len(self.points[0]))
+    
+    def clear(self):
+        """Clear all tabulated integrals."""
+        with self._lock:
+            # First edge and integrals from the first edge at each edge
+            self.table = None
+            self.cache = {}
+    
+    def _edge(self, k):
+        return self.T0 + k * self.dT
+    
+    def _tabulate(self, k):
+        # Return a table including the k-th edge. The first edge is fixed 
+        # by the first call and tables are never modified once published
+        with self._lock:
+            table = self.table
+            if table is None:
+                self.table = table = (k, [0.], [0.])
+                return table
+            start, integrals, integrals_over_T = table
+            end = start + len(integrals) - 1
+            if start <= k <= end: return table # Tabulated by another thread
+            f = self.function
+            points = self.points
+            edge = self._edge
+            if k > end:
+                integrals = integrals.copy()
+                integrals_over_T = integrals_over_T.copy()
+                for i in range(end, k):
+                    y, y_over_T = gauss_legendre(f, edge(i), edge(i + 1), points)
+                    integrals.append(integrals[-1] + y)
+                    integrals_over_T.append(integrals_over_T[-1] + y_over_T)
+            else:
+                lower_integrals = []
+                lower_integrals_over_T = []
+                y = integrals[0]
+                y_over_T = integrals_over_T[0]
+                for i in range(start - 1, k - 1, -1):
+                    dy, dy_over_T = gauss_legendre(f, edge(i), edge(i + 1), points)
+                    y -= dy
+                    y_over_T -= dy_over_T
+                    lower_integrals.append(y)
+                    lower_integrals_over_T.append(y_over_T)
+                lower_integrals.reverse()
+                lower_integrals_over_T.reverse()
+                integrals = lower_integrals + integrals
+                integrals_over_T = lower_integrals_over_T + integrals_over_T
+                start = k
+            self.table = table = (start, integrals, integrals_over_T)
+            return table
+    
+    def antiderivatives(self, T):
+        """
+        Return the integrals of the function and of the function over 
+        temperature from the first tabulated edge to T.
+        
+        """
+        cache = self.cache
+        endpoint = cache.get(T)
+        if endpoint is None:
+            k = floor((T - self.T0) / self.dT)
+            endpoint = (k, *gauss_legendre(self.function, self._edge(k), T, self.points))
+            if len(cache) >= self.cache_size: self.cache = cache = {}
+            cache[T] = endpoint
+        k, y, y_over_T = endpoint
+        table = self.table
+        if table is None or not 0 <= k - table[0] < len(table[1]): 
+            table = self._tabulate(k)
+        start, integrals, integrals_over_T = table
+        index = k - start
+        return integrals[index] + y, integrals_over_T[index] + y_over_T
+    
+    def integrate(self, Ta, Tb, P=None):
+        """Return the integral of the function from Ta to Tb."""
+        return self.antiderivatives(Tb)[0] - self.antiderivatives(Ta)[0]
+    
+    def integrate_over_T(self, Ta, Tb, P=None):
+        """Return the integral of the function over temperature from Ta to Tb."""
+        return self.antiderivatives(Tb)[1] - self.antiderivatives(Ta)[1]
+    
+    def __repr__(self):
+        return f"<{type(self).__name__}: dT={self.dT:g} K, N={len(self.points[0])}>"
+
+
+class AntiderivativeTables:
+    """
+    Create an AntiderivativeTables object that integrates a function of 
+    temperature and pressure by temperature with an AntiderivativeTable 
+    for each pressure (tables of recent pressures are cached).
+    
+    Parameters
+    ----------
+    f : function(T, P)
+        Function to integrate.
+    T0 : float, optional
+        Temperature at an edge of the panels [K]. Defaults to 0 K.
+    dT : float, optional
+        Width of the panels [K]. Defaults to 10 K.
+    N : int, optional
+        Number of Gauss-Legendre points per panel. Defaults to 5.
+    
+    Examples
+    --------
+    >>> from thermosteam.base import AntiderivativeTables
+    >>> tables = AntiderivativeTables(lambda T, P: 1e-5 * P + T)
+    >>> round(tables.integrate(300., 400., 101325.), 6) # Exact: 35101.325
+    35101.325
+    
+    """
+    __slots__ = ('function', 'T0', 'dT', 'N', 'tables')
+    
+    #: [int] Maximum number of cached tables.
+    cache_size = 16
+    
+    def __init__(self, f, T0=0., dT=10., N=5):
+        self.function = f
+        self.T0 = T0
+        self.dT = dT
+        self.N = N
+        self.clear()
+    
+    def __reduce__(self):
+        return type(self), (self.function, self.T0, self.dT, self.N)
+    
+    def clear(self):
+        """Clear all tables."""
+        self.tables = {}
+    
+    def get_table(self, P):
+        """Return the AntiderivativeTable object at given pressure."""
+        tables = self.tables
+        table = tables.get(P)
+        if table is None:
+            f = self.function
+            table = AntiderivativeTable(lambda T: f(T, P), self.T0, self.dT, self.N)
+            if len(tables) >= self.cache_size: self.tables = tables = {}
+            table = tables.setdefault(P, table)
+        return table
+    
+    def integrate(self, Ta, Tb, P):
+        """Return the integral of the function by temperature from Ta to Tb."""
+        return self.get_table(P).integrate(Ta, Tb)
+    
+    def integrate_over_T(self, Ta, Tb, P):
+        """Return the integral of the function over temperature by 
+        temperature from Ta to Tb."""
+        return self.get_table(P).integrate_over_T(Ta, Tb)
+    
+    def __repr__(self):
+        return f"<{type(self).__name__}: dT={self.dT:g} K, N={self.N}>"
+
+
 # %% Interfaces
 
 def model_matching_function(f):
@@ -159,18 +723,28 @@ class TDependentModel(ThermoModel, Functor=TFunctor):
         self.Pmax = Pmax or infinity
         self.Tmin = Tmin or 0.
         self.Tmax = Tmax or infinity
-        self.integrate_by_T = integrate_by_T or self.numerically_integrate_by_T
-        self.integrate_by_T_over_T = integrate_by_T_over_T or self.numerically_integrate_by_T_over_T
+        if not (integrate_by_T and integrate_by_T_over_T):
+            numerically_integrate_by_T, numerically_integrate_by_T_over_T = self.numerical_integrals()
+        self.integrate_by_T = integrate_by_T or numerically_integrate_by_T
+        self.integrate_by_T_over_T = integrate_by_T_over_T or numerically_integrate_by_T_over_T
+    
+    def numerical_integrals(self):
+        # Integrals are tabulated with panels starting at the minimum temperature
+        table = AntiderivativeTable(self.evaluate, self.Tmin)
+        return table.integrate, table.integrate_over_T
     
     def set_value(self, var, value):
         isa = isinstance
         for f in (self.evaluate, self.integrate_by_T, self.integrate_by_T_over_T):
-            if isa(f, Functor): f.set_value(var, value)
+            if isa(f, Functor): 
+                f.set_value(var, value)
+            elif isa(getattr(f, '__self__', None), (AntiderivativeTable, AntiderivativeTables)):
+                f.__self__.clear()
     
     def tabulate_vs_T(self, T_range=None, T_units=None, units=None, P=101325):
         if not T_range: T_range = (self.Tmin, self.Tmax)
         Ts = T_linspace(*T_range)
-        Ys = np.array([self(T) for T in Ts])
+        Ys = array_call(self, Ts)
         if T_units: Ts = convert_var(Ts, 'T', T_units)
         if units: Ys = convert_var(Ys, self.var, units)
         return Ts, Ys
@@ -185,18 +759,15 @@ class TDependentModel(ThermoModel, Functor=TFunctor):
         return Ps, Ys
     
     def indomain(self, T, P=None):
-        return self.Tmin < T < self.Tmax
+        return (self.Tmin < T) & (T < self.Tmax)
      
-    def numerically_integrate_by_T(self, Ta, Tb, P=None):
-        return self.evaluate((Tb+Ta)/2.)*(Tb - Ta)
-    
-    def numerically_integrate_by_T_over_T(self, Ta, Tb, P=None): 
-        return self.evaluate((Tb+Ta)/2.)*log(Tb/Ta)
-
-    def differentiate_by_T(self, T, P=None, dT=1e-12):
-        return (self.evaluate(T+dT) - self.evaluate(T))/dT
+    def differentiate_by_T(self, T, P=None, dT=None):
+        evaluate = self.evaluate
+        if dT: return central_difference(evaluate, T, dT)
+        if isinstance(evaluate, TFunctor): return evaluate.differentiate_by_T(T)
+        return differentiate(evaluate, T)
     
-    def differentiate_by_P(self, T, P=None, dP=1e-12):
+    def differentiate_by_P(self, T, P=None, dP=None):
         return 0
     
     def integrate_by_P(self, Pa, Pb, T):
@@ -219,7 +790,7 @@ class TPDependentModel(ThermoModel, Functor=TPFunctor):
     def tabulate_vs_T(self, T_range=None, T_units=None, units=None, P=101325):
         if not T_range: T_range = (self.Tmin, self.Tmax)
         Ts = T_linspace(*T_range)
-        Ys = np.array([self(T, P) for T in Ts])
+        Ys = array_call(self, Ts, P)
         if T_units: Ts = convert_var(Ts, 'T', T_units)
         if units: Ys = convert_var(Ys, self.var, units)
         return Ts, Ys
@@ -227,28 +798,34 @@ class TPDependentModel(ThermoModel, Functor=TPFunctor):
     def tabulate_vs_P(self, P_range=None, P_units=None, units=None, T=298.15):
         if not P_range: P_range = (self.Pmin, self.Pmax)
         Ps = P_linspace(*P_range)
-        Ys = np.array([self(T, P) for P in Ps])
+        Ys = array_call(self, T, Ps)
         if P_units: Ps = convert_var(Ps, 'P', P_units)
         if units: Ys = convert_var(Ys, self.var, units)
         return Ps, Ys
     
     def indomain(self, T, P):
-        return self.Tmin < T < self.Tmax and self.Pmin < P < self.Pmax
+        return (self.Tmin < T) & (T < self.Tmax) & (self.Pmin < P) & (P < self.Pmax)
     
-    def numerically_integrate_by_T(self, Ta, Tb, P):
-        return self.evaluate((Tb+Ta)/2, P)*(Tb - Ta)
-    
-    def numerically_integrate_by_T_over_T(self, Ta, Tb, P): 
-        return self.evaluate((Tb+Ta)/2., P)*log(Tb/Ta)
+    def numerical_integrals(self):
+        # Integrals are tabulated for each pressure with panels starting at 
+        # the minimum temperature
+        tables = AntiderivativeTables(self.evaluate, self.Tmin)
+        return tables.integrate, tables.integrate_over_T
     
     def integrate_by_P(self, Pa, Pb, T):
         return self.evaluate((Pb+Pa)/2, T)*(Pb - Pa)
 
-    def differentiate_by_T(self, T, P, dT=1e-12):
-        return (self.evaluate(T+dT, P) - self.evaluate(T, P))/dT
+    def differentiate_by_T(self, T, P, dT=None):
+        evaluate = self.evaluate
+        if dT: return central_difference(lambda T: evaluate(T, P), T, dT)
+        if isinstance(evaluate, TPFunctor): return evaluate.differentiate_by_T(T, P)
+        return differentiate(lambda T: evaluate(T, P), T)
     
-    def differentiate_by_P(self, T, P, dP=1e-12):
-        return (self.evaluate(T, P+dP) - self.evaluate(T, P))/dP
+    def differentiate_by_P(self, T, P, dP=None):
+        evaluate = self.evaluate
+        if dP: return central_difference(lambda P: evaluate(T, P), P, dP)
+        if isinstance(evaluate, TPFunctor): return evaluate.differentiate_by_P(T, P)
+        return differentiate(lambda P: evaluate(T, P), P)
 
     def show(self):
         print(f"{self}\n"
@@ -335,41 +912,377 @@ class ConstantTPDependentModel(ConstantThermoModel):
 
 
 class InterpolatedTDependentModel(ThermoModel):
-    __slots__ = ('extrapolator', 'spline', 
-                 'Tmin', 'Tmax', 'T_lb', 'T_ub', 
-                 'name', 'var')
+    """
+    Create an InterpolatedTDependentModel object that interpolates tabulated
+    data with a spline (linear if there are no more than 5 points) and 
+    extrapolates linearly. The coefficients of the spline are precomputed
+    for each interval between data points (and knots), which is found by 
+    bisection (or directly if intervals are evenly spaced), and integrals 
+    and derivatives are exact.
+    
+    Parameters
+    ----------
+    Ts : Iterable[float]
+        Temperatures [K].
+    Ys : Iterable[float]
+        Values at given temperatures.
+    Tmin : float, optional
+        Minimum temperature [K].
+    Tmax : float, optional
+        Maximum temperature [K].
+    kind : str or int, optional
+        Kind of spline ('zero', 'linear', 'quadratic', or 'cubic') or its
+        degree. Defaults to 'cubic'.
+    name : str, optional
+        Name of the model. Defaults to 'Interpolated'.
+    var : str, optional
+        Name of variable returned.
+    
+    Examples
+    --------
+    Cubic splines are exact for cubic polynomials within the data:
+    
+    >>> import numpy as np
+    >>> from thermosteam.base import InterpolatedTDependentModel
+    >>> Ts = np.linspace(300., 400., 11)
+    >>> model = InterpolatedTDependentModel(Ts, 1e-3 * Ts**3)
+    >>> model.evaluate(np.array([305., 395.]))
+    array([28372.625, 61629.875])
+    >>> round(model.integrate_by_T(300., 400.), 3) # 1e-3 * (400**4 - 300**4) / 4
+    4375000.0
+    >>> round(model.integrate_by_T_over_T(300., 400.), 3) # 1e-3 * (400**3 - 300**3) / 3
+    12333.333
+    
+    Values beyond the data are extrapolated linearly:
+    
+    >>> round(model.evaluate(410.), 3)
+    68681.0
     
+    """
+    __slots__ = ('Ts', 'Ys', 'breakpoints', 'coefficients', 'integrals', 'integrals_over_T',
+                 'dT', 'Tmin', 'Tmax', 'T_lb', 'T_ub', 'name', 'var')
     
     def __init__(self, Ts, Ys, Tmin=None, Tmax=None, 
                  kind='cubic', name='Interpolated', var=None):
-        # Only allow linear extrapolation, but with whatever transforms are specified
-        self.extrapolator = interp1d(Ts, Ys, fill_value='extrapolate')
-        # If more than 5 property points, create a spline interpolation
-        self.spline = interp1d(Ts, Ys, kind=kind) if len(Ts)>5 else self.extrapolator
+        Ts = np.asarray(Ts, float)
+        Ys = np.asarray(Ys, float)
+        index = np.argsort(Ts)
+        Ts = Ts[index]
+        Ys = Ys[index]
+        k = spline_degrees[kind] if isinstance(kind, str) else int(kind)
+        if Ts.size <= 5: k = 1
+        breakpoints, coefficients = spline_coefficients(Ts, Ys, k)
+        a = breakpoints[:-1]
+        x = np.diff(breakpoints)
+        self.integrals = np.cumsum([0., *integrate_polynomial(coefficients.T, x)]).tolist()
+        self.integrals_over_T = np.cumsum([0., *integrate_polynomial_over_T(coefficients.T, a, x)]).tolist()
+        self.coefficients = coefficients.tolist()
+        self.Ts = Ts.tolist()
+        self.Ys = Ys.tolist()
+        self.breakpoints = breakpoints.tolist()
+        self.dT = uniform_spacing(breakpoints)
         self.Tmin = Tmin or 0.
         self.Tmax = Tmax or infinity
-        self.T_lb = Ts[0]
-        self.T_ub = Ts[-1]
+        self.T_lb = self.Ts[0]
+        self.T_ub = self.Ts[-1]
         self.name = name
         self.var = var
     
+    def _interval(self, T):
+        # Return the index of the interval containing T
+        N = len(self.breakpoints) - 2
+        if self.dT: 
+            index = int((T - self.T_lb) / self.dT)
+        else:
+            index = bisect_right(self.breakpoints, T) - 1
+        return 0 if index < 0 else N if index > N else index
+    
+    def _intervals(self, T):
+        # Return the indices of the intervals containing an array of T
+        if self.dT:
+            index = np.floor((T - self.T_lb) / self.dT).astype(int)
+        else:
+            index = np.searchsorted(self.breakpoints, T, 'right') - 1
+        return np.clip(index, 0, len(self.breakpoints) - 2)
+    
+    def _line(self, end):
+        # Return the coefficients of the line used to extrapolate beyond the 
+        # lower (end=0) or upper (end=-1) bound of the data, and that bound
+        Ts = self.Ts
+        Ys = self.Ys
+        other = 1 if end == 0 else -2
+        return [Ys[end], (Ys[other] - Ys[end]) / (Ts[other] - Ts[end])], Ts[end]
+    
+    def _piecewise(self, f, T, integrals=None):
+        # Apply a function of polynomial coefficients, lower bounds, and local
+        # coordinates to the line or interval containing T (for integrals,
+        # results are added to the integrals at the lower bounds)
+        if T.__class__ is np.ndarray:
+            index = self._intervals(T)
+            a = np.array(self.breakpoints)[index]
+            values = f(np.array(self.coefficients)[index].T, a, np.clip(T, self.T_lb, self.T_ub) - a)
+            # Derivatives of piecewise constant splines are scalar zeros
+            if values.__class__ is not np.ndarray: values = np.full(T.shape, values)
+            if integrals: values += np.array(integrals)[index]
+            below = T < self.T_lb
+            above = T > self.T_ub
+            if below.any():
+                c, a = self._line(0)
+                values[below] = f(c, a, T[below] - a)
+            if above.any():
+                c, a = self._line(-1)
+                values[above] = f(c, a, T[above] - a) + (integrals[-1] if integrals else 0.)
+            return values
+        elif T < self.T_lb:
+            c, a = self._line(0)
+            return f(c, a, T - a)
+        elif T > self.T_ub:
+            c, a = self._line(-1)
+            return f(c, a, T - a) + (integrals[-1] if integrals else 0.)
+        index = self._interval(T)
+        a = self.breakpoints[index]
+        value = f(self.coefficients[index], a, T - a)
+        return value + integrals[index] if integrals else value
+    
     def evaluate(self, T, P=None):
-        return self.spline(T) if (self.T_lb <= T <= self.T_ub) else self.extrapolator(T)
+        if T.__class__ is np.ndarray: 
+            return self._piecewise(lambda c, a, x: polyval(c, x), T)
+        elif self.T_lb <= T <= self.T_ub:
+            index = self._interval(T)
+            return polyval(self.coefficients[index], T - self.breakpoints[index])
+        else:
+            return self._piecewise(lambda c, a, x: polyval(c, x), T)
+    
+    def integrate_by_T(self, Ta, Tb, P=None):
+        f = lambda c, a, x: integrate_polynomial(c, x)
+        integrals = self.integrals
+        return self._piecewise(f, Tb, integrals) - self._piecewise(f, Ta, integrals)
+    
+    def integrate_by_T_over_T(self, Ta, Tb, P=None):
+        f = integrate_polynomial_over_T
+        integrals = self.integrals_over_T
+        return self._piecewise(f, Tb, integrals) - self._piecewise(f, Ta, integrals)
+    
+    def differentiate_by_T(self, T, P=None, dT=None):
+        return self._piecewise(lambda c, a, x: polyval_derivative(c, x), T)
     
     set_value = ConstantThermoModel.set_value
     tabulate_vs_T = TDependentModel.tabulate_vs_T
     tabulate_vs_P = TDependentModel.tabulate_vs_P
     indomain = TDependentModel.indomain
-    integrate_by_T = TDependentModel.numerically_integrate_by_T
-    integrate_by_T_over_T = TDependentModel.numerically_integrate_by_T_over_T
     integrate_by_P = TDependentModel.integrate_by_P
-    differentiate_by_T = TDependentModel.differentiate_by_T
     differentiate_by_P = TDependentModel.differentiate_by_P
     
     def show(self):
         print(f"{self}\n"
-              f" name: {self.name}"
+              f" name: {self.name}\n"
               f" Tmin: {self.Tmin:.2f}\n"
               f" Tmax: {self.Tmax:.2f}")
 
-    _ipython_display_ = show
\ No newline at end of file
+    _ipython_display_ = show
+
+
+class ChebyshevTDependentModel(ThermoModel):
+    """
+    Create a ChebyshevTDependentModel object that approximates a function of 
+    temperature with a piecewise Chebyshev series (with exact integrals and 
+    derivatives). Intervals are bisected until the pointwise relative error 
+    at the midpoints of Chebyshev nodes is below the tolerance.
+    
+    Parameters
+    ----------
+    f : function(T)
+        Function to approximate.
+    Tmin : float
+        Minimum temperature [K].
+    Tmax : float
+        Maximum temperature [K].
+    tol : float, optional
+        Relative tolerance. Defaults to 1e-6.
+    breakpoints : Iterable[float], optional
+        Temperatures where `f` may not be smooth (e.g. boundaries of models).
+    name : str, optional
+        Name of the model. Defaults to 'Chebyshev surrogate'.
+    var : str, optional
+        Name of variable returned.
+    
+    """
+    __slots__ = ('name', 'var', 'Tmin', 'Tmax', 'Pmin', 'Pmax', 'error', 
+                 'breakpoints', 'coefficients', 'T_coefficients', 'data')
+    
+    #: [function] Entry point of the numba-compiled kernel (compiled on first use).
+    kernel = None
+    
+    def __init__(self, f, Tmin, Tmax, tol=1e-6, breakpoints=(), 
+                 name='Chebyshev surrogate', var=None):
+        breakpoints = sorted({Tmin, Tmax, *[i for i in breakpoints if Tmin < i < Tmax]})
+        self.breakpoints, coefficients, self.error = fit_piecewise_chebyshev(f, breakpoints, tol)
+        self.coefficients = [c.tolist() for c, _ in coefficients]
+        self.T_coefficients = [c.tolist() for _, c in coefficients]
+        self.data = pack_chebyshev(self.breakpoints, self.coefficients)
+        self.Tmin = Tmin
+        self.Tmax = Tmax
+        self.Pmin = 0.
+        self.Pmax = infinity
+        self.name = name
+        self.var = var
+    
+    @classmethod
+    def compile_kernel(cls):
+        cls.kernel = kernel = compile_entry_point(
+            chebval_packed, numba.float64(numba.float64, numba.float64[::1])
+        )
+        return kernel
+    
+    def evaluate(self, T, P=None):
+        if T.__class__ is np.ndarray: 
+            return chebval_piecewise(self.breakpoints, self.coefficients, T)
+        return (self.kernel or self.compile_kernel())(T, self.data)
+    
+    def integrate_by_T(self, Ta, Tb, P=None):
+        return integrate_chebyshev(self.breakpoints, self.coefficients.__getitem__, Ta, Tb)
+    
+    def integrate_by_T_over_T(self, Ta, Tb, P=None):
+        return integrate_chebyshev(self.breakpoints, self.T_coefficients.__getitem__, Ta, Tb)
+    
+    def differentiate_by_T(self, T, P=None, dT=None):
+        return differentiate_chebyshev(self.breakpoints, self.coefficients.__getitem__, T)
+    
+    def integrate_by_P(self, Pa, Pb, T):
+        return (Pb - Pa) * self.evaluate(T)
+    
+    set_value = ConstantThermoModel.set_value
+    tabulate_vs_T = TDependentModel.tabulate_vs_T
+    tabulate_vs_P = TDependentModel.tabulate_vs_P
+    indomain = TDependentModel.indomain
+    differentiate_by_P = TDependentModel.differentiate_by_P
+    
+    def __str__(self):
+        return f"{type(self).__name__}(T, P=None) -> {self.var}"
+    
+    def show(self):
+        print(f"{self}\n"
+              f" name: {self.name}\n"
+              f" Tmin: {self.Tmin:.5g} K\n"
+              f" Tmax: {self.Tmax:.5g} K\n"
+              f" intervals: {len(self.coefficients)}\n"
+              f" error: {self.error:.3g}")
+        
+    _ipython_display_ = show
+
+
+class ChebyshevTPDependentModel(ThermoModel):
+    """
+    Create a ChebyshevTPDependentModel object that approximates a function of
+    temperature and pressure with a piecewise Chebyshev series over a grid 
+    (with exact integrals and derivatives). Intervals of temperature and 
+    pressure are bisected until the pointwise relative error at the 
+    midpoints of Chebyshev nodes is below the tolerance.
+    
+    Parameters
+    ----------
+    f : function(T, P)
+        Function to approximate.
+    Tmin : float
+        Minimum temperature [K].
+    Tmax : float
+        Maximum temperature [K].
+    Pmin : float
+        Minimum pressure [Pa].
+    Pmax : float
+        Maximum pressure [Pa].
+    tol : float, optional
+        Relative tolerance. Defaults to 1e-6.
+    T_breakpoints : Iterable[float], optional
+        Temperatures where `f` may not be smooth.
+    P_breakpoints : Iterable[float], optional
+        Pressures where `f` may not be smooth.
+    name : str, optional
+        Name of the model. Defaults to 'Chebyshev surrogate'.
+    var : str, optional
+        Name of variable returned.
+    
+    """
+    __slots__ = ('name', 'var', 'Tmin', 'Tmax', 'Pmin', 'Pmax', 'error',
+                 'T_breakpoints', 'P_breakpoints', 'coefficients', 'T_coefficients',
+                 'data')
+    
+    #: [function] Entry point of the numba-compiled kernel (compiled on first use).
+    kernel = None
+    
+    def __init__(self, f, Tmin, Tmax, Pmin, Pmax, tol=1e-6,
+                 T_breakpoints=(), P_breakpoints=(), 
+                 name='Chebyshev surrogate', var=None):
+        T_breakpoints = sorted({Tmin, Tmax, *[i for i in T_breakpoints if Tmin < i < Tmax]})
+        P_breakpoints = sorted({Pmin, Pmax, *[i for i in P_breakpoints if Pmin < i < Pmax]})
+        (self.T_breakpoints, self.P_breakpoints,
+         coefficients, self.error) = fit_piecewise_chebyshev_2d(f, T_breakpoints, P_breakpoints, tol)
+        self.coefficients = [[C.tolist() for C, _ in i] for i in coefficients]
+        self.T_coefficients = [[C.tolist() for _, C in i] for i in coefficients]
+        self.data = pack_chebyshev_2d(self.T_breakpoints, self.P_breakpoints, self.coefficients)
+        self.Tmin = Tmin
+        self.Tmax = Tmax
+        self.Pmin = Pmin
+        self.Pmax = Pmax
+        self.name = name
+        self.var = var
+    
+    @classmethod
+    def compile_kernel(cls):
+        cls.kernel = kernel = compile_entry_point(
+            chebval2d_packed, numba.float64(numba.float64, numba.float64, numba.float64[::1])
+        )
+        return kernel
+    
+    def evaluate(self, T, P):
+        if T.__class__ is np.ndarray or P.__class__ is np.ndarray:
+            return chebval2d_piecewise(self.T_breakpoints, self.P_breakpoints, self.coefficients, T, P)
+        return (self.kernel or self.compile_kernel())(T, P, self.data)
+    
+    def _at_P(self, coefficients, P):
+        # Return a function of the temperature interval index that returns 
+        # coefficients of the series in temperature at given pressure
+        j, y = locate(self.P_breakpoints, P)
+        return lambda i: chebyshev.chebval(y, coefficients[i][j])
+    
+    def _at_T(self, T):
+        # Return a function of the pressure interval index that returns 
+        # coefficients of the series in pressure at given temperature
+        i, x = locate(self.T_breakpoints, T)
+        coefficients = self.coefficients[i]
+        return lambda j: [chebval(x, c) for c in coefficients[j]]
+    
+    def integrate_by_T(self, Ta, Tb, P):
+        return integrate_chebyshev(self.T_breakpoints, self._at_P(self.coefficients, P), Ta, Tb)
+    
+    def integrate_by_T_over_T(self, Ta, Tb, P):
+        return integrate_chebyshev(self.T_breakpoints, self._at_P(self.T_coefficients, P), Ta, Tb)
+    
+    def integrate_by_P(self, Pa, Pb, T):
+        return integrate_chebyshev(self.P_breakpoints, self._at_T(T), Pa, Pb)
+    
+    def differentiate_by_T(self, T, P, dT=None):
+        return differentiate_chebyshev(self.T_breakpoints, self._at_P(self.coefficients, P), T)
+    
+    def differentiate_by_P(self, T, P, dP=None):
+        return differentiate_chebyshev(self.P_breakpoints, self._at_T(T), P)
+    
+    set_value = ConstantThermoModel.set_value
+    tabulate_vs_T = TPDependentModel.tabulate_vs_T
+    tabulate_vs_P = TPDependentModel.tabulate_vs_P
+    indomain = TPDependentModel.indomain
+    
+    def __str__(self):
+        return f"{type(self).__name__}(T, P) -> {self.var}"
+    
+    def show(self):
+        print(f"{self}\n"
+              f" name: {self.name}\n"
+              f" Tmin: {self.Tmin:.5g} K\n"
+              f" Tmax: {self.Tmax:.5g} K\n"
+              f" Pmin: {self.Pmin:.5g} Pa\n"
+              f" Pmax: {self.Pmax:.5g} Pa\n"
+              f" intervals: {len(self.T_breakpoints) - 1} x {len(self.P_breakpoints) - 1}\n"
+              f" error: {self.error:.3g}")
+        
+    _ipython_display_ = show
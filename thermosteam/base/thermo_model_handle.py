@@ -8,15 +8,19 @@
 """
 """
 from collections import deque
-from numpy import inf as infinity
+from numpy import inf as infinity, ndarray
+import numpy as np
 from .thermo_model import (ThermoModel,
                            TDependentModel,
                            TPDependentModel,
+                           ChebyshevTDependentModel,
+                           ChebyshevTPDependentModel,
                            thermo_model,
-                           create_axis_labels)
+                           create_axis_labels,
+                           breakpoints_of)
 from ..exceptions import DomainError
 from ..units_of_measure import definitions
-from .functor import functor_lookalike
+from .functor import functor_lookalike, array_call, map_elements, Functor, CompiledFunctor
 import matplotlib.pyplot as plt
 
 __all__ = ('ThermoModelHandle',
@@ -29,6 +33,10 @@ def find_model_by_name(models, name):
     for model in models:
         if model.name == name: return model
     raise LookupError(f'no model with name {name}')
+
+def reset_fingerprint(handle):
+    chemical = handle._chemical
+    if chemical is not None: chemical._reset_fingerprint(handle)
     
 def find_model_index_by_name(models, name):
     for index, model in enumerate(models):
@@ -41,6 +49,71 @@ def no_valid_model(chemical, var):
     msg += f"{definition.lower()} model" if definition else "model"
     return msg
 
+def without_surrogates(handle):
+    # Surrogates are fit to the original models
+    copy = handle.copy()
+    copy._chemical = handle._chemical
+    models = copy._models
+    for model in [i for i in models if isinstance(i, (ChebyshevTDependentModel, 
+                                                      ChebyshevTPDependentModel))]:
+        models.remove(model)
+    return copy
+
+def map_models(handle, call, T, P=None):
+    # Evaluate arrays with the first model in domain of each element
+    if P is None:
+        T = np.asarray(T, float)
+    else:
+        T, P = np.broadcast_arrays(np.asarray(T, float), np.asarray(P, float))
+    values = np.zeros(T.shape)
+    remaining = np.ones(T.shape, bool)
+    if not T.size: return values
+    for model in handle._models:
+        mask = remaining & (model.indomain(T) if P is None else model.indomain(T, P))
+        if not mask.any(): continue
+        values[mask] = call(model, T[mask]) if P is None else call(model, T[mask], P[mask])
+        remaining &= ~mask
+        if not remaining.any(): return values
+    T = T[remaining][0]
+    msg = f"at T={T:.2f} K" if P is None else f"at T={T:.2f} K and P={P[remaining][0]:.0f} Pa"
+    raise DomainError(f"{no_valid_model(handle._chemical, handle._var)} {msg}",
+                      chemical=handle._chemical)
+
+def integrate_models(handle, name, a, b, x=None, bounds=('Tmin', 'Tmax'), 
+                     x_bounds=('Pmin', 'Pmax')):
+    # Integrate arrays by dispatching elements which the scalar method 
+    # integrates with a single model to that model (other elements are 
+    # integrated element-wise)
+    args = [np.asarray(i, float) for i in ((a, b) if x is None else (a, b, x))]
+    args = np.broadcast_arrays(*args)
+    a, b, *x = args
+    values = np.zeros(a.shape)
+    remaining = np.ones(a.shape, bool)
+    scalar = np.zeros(a.shape, bool)
+    lb, ub = bounds
+    for model in handle._models:
+        if not remaining.any(): break
+        if not hasattr(model, name): continue
+        min_ = getattr(model, lb)
+        max_ = getattr(model, ub)
+        lb_satisfied = a > min_
+        ub_satisfied = b < max_
+        touched = remaining & ((lb_satisfied & (a < max_)) | (ub_satisfied & (b > min_)))
+        if x:
+            x_min, x_max = [getattr(model, i) for i in x_bounds]
+            touched &= (x_min < x[0]) & (x[0] < x_max)
+        full = touched & lb_satisfied & ub_satisfied
+        if full.any(): values[full] = array_call(getattr(model, name), *[i[full] for i in args])
+        scalar |= touched & ~full
+        remaining &= ~touched
+    scalar |= remaining
+    if scalar.any(): 
+        values[scalar] = map_elements(getattr(handle, name), *[i[scalar] for i in args])
+    return values
+
+def evaluate_model(model, T, P=None):
+    return array_call(model.evaluate, T) if P is None else array_call(model.evaluate, T, P)
+
 def as_model_index(models, key):
     isa = isinstance
     if isa(key, int):
@@ -96,6 +169,7 @@ class ThermoModelHandle:
     
     def set_value(self, var, value):
         for model in self._models: model.set_value(var, value)
+        reset_fingerprint(self)
     
     def plot_vs_T(self, T_range=None, T_units=None, units=None, 
                   P=101325, label_axis=True, **plot_kwargs):
@@ -138,6 +212,7 @@ class ThermoModelHandle:
             "contain 'ThermoModel' objects")
         models = self._models
         models[as_model_index(models, index)] = model
+        reset_fingerprint(self)
 	
     def __iter__(self):
         return iter(self._models)
@@ -165,6 +240,7 @@ class ThermoModelHandle:
         model = as_model(models, key)
         models.remove(model)
         models.insert(priority, model)
+        reset_fingerprint(self)
     
     def move_up_model_priority(self, key, priority=0):
         """
@@ -180,6 +256,7 @@ class ThermoModelHandle:
         """
         index = as_model_index(self._models, key)
         self._models.rotate(priority - index)
+        reset_fingerprint(self)
     
     def add_model(self, evaluate=None,
                   Tmin=None, Tmax=None,
@@ -237,8 +314,39 @@ class ThermoModelHandle:
         if top_priority:
             self._models.appendleft(model)
         else:
-            self._models.append(model)    
+            self._models.append(model)
+        reset_fingerprint(self)
         return evaluate
+    
+    def compile_kernels(self):
+        """
+        Replace the functors of all models with their numba-compiled 
+        counterparts (evaluated without unpacking keyword arguments) and
+        return the number of compiled functors. Functors with hooks or
+        which are not numba-compatible are not replaced.
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> Water = tmo.Chemical('Water')
+        >>> Psat = Water.Psat(350.)
+        >>> Water.Psat.compile_kernels() > 0
+        True
+        >>> abs(Water.Psat(350.) / Psat - 1.) < 1e-12
+        True
+        
+        """
+        N_compiled = 0
+        for model in self._models:
+            if not isinstance(model, (TDependentModel, TPDependentModel)): continue
+            for name in ('evaluate', 'integrate_by_T', 'integrate_by_T_over_T'):
+                f = getattr(model, name)
+                if not isinstance(f, Functor) or isinstance(f, CompiledFunctor): continue
+                f = f.compile()
+                if isinstance(f, CompiledFunctor): 
+                    setattr(model, name, f)
+                    N_compiled += 1
+        return N_compiled
        
     def remove(self, key):
         """
@@ -252,6 +360,7 @@ class ThermoModelHandle:
         """
         model = as_model(self._models, key)
         self._models.remove(model)
+        reset_fingerprint(self)
        
     def show(self):
         info = f"{self}\n"
@@ -280,6 +389,7 @@ class TDependentModelHandle(ThermoModelHandle):
         return max([i.Tmax for i in self._models])
     
     def __call__(self, T, P=None):
+        if T.__class__ is ndarray: return map_models(self, evaluate_model, T)
         for model in self._models:
             if model.indomain(T): return model.evaluate(T)
         raise DomainError(f"{no_valid_model(self._chemical, self._var)} "
@@ -291,16 +401,20 @@ class TDependentModelHandle(ThermoModelHandle):
         for model in self._models:
             if model.indomain(T): return model.evaluate(T)
     
-    def differentiate_by_T(self, T, P=None, dT=1e-12):
+    def differentiate_by_T(self, T, P=None, dT=None):
+        if T.__class__ is ndarray:
+            return map_models(self, lambda model, T: array_call(lambda T: model.differentiate_by_T(T, dT=dT), T), T)
         for model in self._models:
             if model.indomain(T): return model.differentiate_by_T(T, dT=dT)
         raise DomainError(f"{no_valid_model(self._chemical, self._var)} "
                          f"at T={T:.2f} K", chemical=self._chemical)
         
-    def differentiate_by_P(self, T, P=None, dP=1e-12):
+    def differentiate_by_P(self, T, P=None, dP=None):
         return 0
         
     def integrate_by_T(self, Ta, Tb):
+        if Ta.__class__ is ndarray or Tb.__class__ is ndarray:
+            return integrate_models(self, 'integrate_by_T', Ta, Tb)
         integral = 0.
         defined = hasattr
         for model in self._models:
@@ -324,7 +438,58 @@ class TDependentModelHandle(ThermoModelHandle):
     def integrate_by_P(self, Pa, Pb, T):
         return (Pb - Pa) * self(T)
     
+    def compile_surrogate(self, Tmin, Tmax, tol=1e-6):
+        """
+        Fit a piecewise Chebyshev series to the active models between given 
+        temperatures and add it as the top priority model. Surrogates are 
+        evaluated as a single polynomial by a numba-compiled kernel 
+        (regardless of the cost of the original models) and have exact 
+        integrals and derivatives.
+        
+        Parameters
+        ----------
+        Tmin : float
+            Minimum temperature [K].
+        Tmax : float
+            Maximum temperature [K].
+        tol : float, optional
+            Relative tolerance of the fit. Defaults to 1e-6.
+        
+        Returns
+        -------
+        surrogate : ChebyshevTDependentModel
+            The added model (with the maximum relative error of the fit as 
+            the `error` attribute).
+        
+        Notes
+        -----
+        Models are split at the boundaries of other models, where the active
+        model may change. Surrogates are always fit to the original 
+        models (not to other surrogates).
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> Water = tmo.Chemical('Water')
+        >>> Cn = Water.Cn.l(350.)
+        >>> surrogate = Water.Cn.l.compile_surrogate(280., 500.)
+        >>> surrogate.error < 1e-6
+        True
+        >>> abs(Water.Cn.l(350.) / Cn - 1.) < 1e-6
+        True
+        >>> Water.Cn.l.remove(surrogate)
+        
+        """
+        handle = without_surrogates(self)
+        surrogate = ChebyshevTDependentModel(handle, Tmin, Tmax, tol,
+                                             breakpoints_of(handle, Tmin, Tmax),
+                                             var=self._var)
+        self.add_model(surrogate, top_priority=True)
+        return surrogate
+    
     def integrate_by_T_over_T(self, Ta, Tb):
+        if Ta.__class__ is ndarray or Tb.__class__ is ndarray:
+            return integrate_models(self, 'integrate_by_T_over_T', Ta, Tb)
         integral = 0.
         defined = hasattr
         for model in self._models:
@@ -363,11 +528,61 @@ class TPDependentModelHandle(ThermoModelHandle):
         return max([i.Pmax for i in self._models])
     
     def __call__(self, T, P):
+        if T.__class__ is ndarray or P.__class__ is ndarray: 
+            return map_models(self, evaluate_model, T, P)
         for model in self._models:
             if model.indomain(T, P): return model.evaluate(T, P)
         raise DomainError(f"{no_valid_model(self._chemical, self._var)} "
                           f"at T={T:.2f} K and P={P:.0f} Pa", chemical=self._chemical)
 
+    def compile_surrogate(self, Tmin, Tmax, Pmin, Pmax, tol=1e-6):
+        """
+        Fit a piecewise Chebyshev series to the active models over a grid of 
+        temperatures and pressures and add it as the top priority model. 
+        Surrogates are evaluated as a single polynomial by a numba-compiled 
+        kernel (regardless of the cost of the original models) and have exact
+        integrals and derivatives.
+        
+        Parameters
+        ----------
+        Tmin : float
+            Minimum temperature [K].
+        Tmax : float
+            Maximum temperature [K].
+        Pmin : float
+            Minimum pressure [Pa].
+        Pmax : float
+            Maximum pressure [Pa].
+        tol : float, optional
+            Relative tolerance of the fit. Defaults to 1e-6.
+        
+        Returns
+        -------
+        surrogate : ChebyshevTPDependentModel
+            The added model (with the maximum relative error of the fit as 
+            the `error` attribute).
+        
+        Examples
+        --------
+        >>> import thermosteam as tmo
+        >>> Water = tmo.Chemical('Water')
+        >>> mu = Water.mu.l(350., 5e5)
+        >>> surrogate = Water.mu.l.compile_surrogate(280., 500., 1e5, 1e6)
+        >>> surrogate.error < 1e-6
+        True
+        >>> abs(Water.mu.l(350., 5e5) / mu - 1.) < 1e-6
+        True
+        >>> Water.mu.l.remove(surrogate)
+        
+        """
+        handle = without_surrogates(self)
+        surrogate = ChebyshevTPDependentModel(handle, Tmin, Tmax, Pmin, Pmax, tol,
+                                              breakpoints_of(handle, Tmin, Tmax),
+                                              breakpoints_of(handle, Pmin, Pmax, 'Pmin', 'Pmax'),
+                                              var=self._var)
+        self.add_model(surrogate, top_priority=True)
+        return surrogate
+
     def at_T(self, T):
         isa = isinstance
         for model in self._models:
@@ -381,18 +596,24 @@ class TPDependentModelHandle(ThermoModelHandle):
             if model.indomain(T, P): return model.evaluate(T, P)
 
     def differentiate_by_T(self, T, P):
+        if T.__class__ is ndarray or P.__class__ is ndarray: 
+            return map_models(self, lambda model, T, P: array_call(model.differentiate_by_T, T, P), T, P)
         for model in self._models:
             if model.indomain(T, P): return model.differentiate_by_T(T, P)
         raise DomainError(f"{no_valid_model(self._chemical, self._var)} "
                           f"at T={T:.2f} K and P={P:.0f} Pa", chemical=self._chemical)
             
     def differentiate_by_P(self, T, P):
+        if T.__class__ is ndarray or P.__class__ is ndarray: 
+            return map_models(self, lambda model, T, P: array_call(model.differentiate_by_P, T, P), T, P)
         for model in self._models:
              if model.indomain(T, P): return model.differentiate_by_P(T, P)
         raise DomainError(f"{no_valid_model(self._chemical, self._var)} "
                           f"at T={T:.2f} K and P={P:.0f} Pa", chemical=self._chemical)
         
     def integrate_by_T(self, Ta, Tb, P):
+        if Ta.__class__ is ndarray or Tb.__class__ is ndarray or P.__class__ is ndarray:
+            return integrate_models(self, 'integrate_by_T', Ta, Tb, P)
         integral = 0
         defined = hasattr
         for model in self._models:
@@ -415,6 +636,8 @@ class TPDependentModelHandle(ThermoModelHandle):
                           chemical=self._chemical)
     
     def integrate_by_P(self, Pa, Pb, T):
+        if Pa.__class__ is ndarray or Pb.__class__ is ndarray or T.__class__ is ndarray:
+            return integrate_models(self, 'integrate_by_P', Pa, Pb, T, ('Pmin', 'Pmax'), ('Tmin', 'Tmax'))
         integral = 0
         defined = hasattr
         for model in self._models:
@@ -438,6 +661,8 @@ class TPDependentModelHandle(ThermoModelHandle):
                           chemical=self._chemical)
     
     def integrate_by_T_over_T(self, Ta, Tb, P):
+        if Ta.__class__ is ndarray or Tb.__class__ is ndarray or P.__class__ is ndarray:
+            return integrate_models(self, 'integrate_by_T_over_T', Ta, Tb, P)
         integral = 0
         defined = hasattr
         for model in self._models:
@@ -6,192 +6,412 @@
 # github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
 # for license details.
 """
+All data tables are loaded (and indexed) from the chemicals library on the
+first lookup, so importing this module does not read any data files.
+
+Tables of constants and correlation coefficients may also be consolidated 
+into a binary database file (see :func:`build_database`). If the file is set
+as the `chemical_database` in the thermosteam settings, tables are memory 
+mapped from the file instead, so that all processes on a machine share the
+same pages through the page cache of the operating system.
 """
 import os
 import json
+import numpy as np
+from importlib import import_module
+from chemicals.miscdata import lookup_VDI_tabular_data
+
+__all__ = ('RowData', 'LazyMapping', 'build_database')
 
 # %% Readers
 
 class RowData:
     """
-    Create a RowData object for fast data frame lookups by row.
+    Create a RowData object for fast data frame lookups by row. If a `loader` 
+    is given, it is called on the first lookup to return the index, values, 
+    and columns. An index given as a sorted array of byte strings (e.g. 
+    memory mapped from a database file) is searched by bisection instead of
+    being hashed.
     
     """
-    __slots__ = ('index', 'values', 'columns')
+    __slots__ = ('_index', '_keys', '_values', '_columns', '_loader')
+    
+    def __init__(self, index=None, values=None, columns=None, loader=None):
+        self._loader = loader
+        if not loader: self._set_data(index, values, columns)
+    
+    def _set_data(self, index, values, columns):
+        if isinstance(index, np.ndarray) and index.dtype.char == 'S':
+            self._index = None
+            self._keys = index
+        else:
+            self._index = {key: i for i, key in enumerate(index)}
+            self._keys = None
+        self._values = values
+        self._columns = columns if columns is None else {key: i for i, key in enumerate(columns)} 
+    
+    def _load(self):
+        loader = self._loader
+        if loader:
+            self._set_data(*loader())
+            self._loader = None
+    
+    def _find(self, row):
+        self._load()
+        index = self._index
+        if index is None:
+            keys = self._keys
+            try: key = row.encode('ascii')
+            except: return None
+            i = keys.searchsorted(key)
+            return i if i < keys.size and keys[i] == key else None
+        else:
+            return index.get(row)
+    
+    def _locate(self, row):
+        i = self._find(row)
+        if i is None: raise KeyError(row)
+        return i
     
-    def __init__(self, index, values=None, columns=None):
-        self.index = {key: i for i, key in enumerate(index)}
-        self.values = values
-        self.columns = columns if columns is None else {key: i for i, key in enumerate(columns)} 
+    @property
+    def index(self):
+        """dict[str, int] Row indices by key."""
+        self._load()
+        index = self._index
+        if index is None:
+            index = {key.decode(): i for i, key in enumerate(self._keys)}
+        return index
+    
+    @property
+    def values(self):
+        """[ndarray] All values."""
+        self._load()
+        return self._values
+    
+    @property
+    def columns(self):
+        """dict[str, int] Column indices by name."""
+        self._load()
+        return self._columns
     
     def get(self, row, col):
-        columns = self.columns
+        i = self._locate(row)
+        columns = self._columns
         if not columns: raise RuntimeError('no columns implemented')
-        return self.values[self.index[row], columns[col]]
+        return self._values[i, columns[col]]
     
     def __getitem__(self, row):
-        return self.values[self.index[row]]
+        i = self._locate(row)
+        return self._values[i]
     
     def __contains__(self, row):
-        return row in self.index   
+        return self._find(row) is not None
+
+
+class LazyMapping:
+    """
+    Create a LazyMapping object that loads a dictionary on the first lookup.
+    
+    """
+    __slots__ = ('_data', '_loader')
+    
+    def __init__(self, loader):
+        self._data = None
+        self._loader = loader
+    
+    @property
+    def data(self):
+        """[dict] Loaded dictionary."""
+        data = self._data
+        if data is None: self._data = data = self._loader()
+        return data
+    
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+    
+    def __getitem__(self, key):
+        return self.data[key]
+    
+    def __contains__(self, key):
+        return key in self.data
+    
+    def __iter__(self):
+        return iter(self.data)
     
+    def __len__(self):
+        return len(self.data)
+
+
 def load_json(folder, json_file, hook=None):
     with open(os.path.join(folder, json_file)) as f:
         return json.loads(f.read(), object_hook=hook)
+
+def load_attribute(module, name):
+    return getattr(import_module(module), name)
+
+def load_table(module, data, values=None, columns=False):
+    df = load_attribute(module, data)
+    return (df.index, 
+            load_attribute(module, values) if values else df.values,
+            df.columns if columns else None)
+
+def lazy_row_data(module, data, values=None, columns=False):
+    """
+    Return a RowData object that loads a data frame from a module of the 
+    chemicals library on the first lookup. The values of the data frame are
+    used unless the name of a separate array of values is given. The table
+    is included in the binary database and memory mapped from it if 
+    available (see :func:`build_database`).
     
+    """
+    table = (module, data, values, columns)
+    database_tables[data] = table
+    def load():
+        return load_database_table(data) or load_table(*table)
+    return RowData(loader=load)
+
+def lazy_mapping(module, name):
+    """Return a LazyMapping object that loads a dictionary from a module of 
+    the chemicals library on the first lookup."""
+    return LazyMapping(lambda: load_attribute(module, name))
+    
+# %% Binary database
+
+#: dict[str, tuple] Tables consolidated in the binary database by name.
+database_tables = {}
+
+#: [bytes] Identifies binary database files.
+database_magic = b'TMODATA\x00'
+
+#: [int] Format version of binary database files.
+database_format = 1
+
+#: dict[str, dict] Headers of opened database files by file name (None for
+#: files that are missing or outdated).
+database_headers = {}
+
+def database_version():
+    import chemicals
+    return f"chemicals {chemicals.__version__}"
+
+def as_float(value):
+    try: return float(value)
+    except: return np.nan
+
+def align(offset, alignment=64):
+    return -(-offset // alignment) * alignment
+
+def build_database(file):
+    """
+    Consolidate all tables of constants and correlation coefficients used 
+    by the model handle builders into a binary database file and return
+    the file name.
+    
+    Each table is stored as an array of CAS numbers (sorted, as fixed
+    width byte strings) followed by a float64 array of values (non-numeric 
+    entries are stored as NaN). The file is versioned by its format and 
+    the version of the chemicals library; outdated files are ignored.
+    Set the file as the `chemical_database` in the thermosteam settings 
+    to memory map tables from it.
+    
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> import thermosteam as tmo
+    >>> from thermosteam.chemicals.data import build_database
+    >>> file = build_database(os.path.join(tempfile.mkdtemp(), 'chemicals.bin'))
+    >>> tmo.settings.chemical_database = file
+    
+    New chemicals read constants and coefficients from the database:
+    
+    >>> tmo.Chemical('Water').Psat(373.15)
+    101284.55
+    >>> tmo.settings.chemical_database = None
+    
+    """
+    tables = {}
+    blocks = []
+    offset = 0
+    for name, table in database_tables.items():
+        index, values, columns = load_table(*table)
+        rows = {key: i for i, key in enumerate(index)} # Last duplicate wins
+        keys = sorted(rows)
+        if not keys: continue
+        keys_array = np.array([i.encode('ascii') for i in keys])
+        values = np.asarray(values)[[rows[i] for i in keys]]
+        if values.dtype != np.float64:
+            values = np.array([[as_float(j) for j in i] for i in values])
+        values = np.ascontiguousarray(values, dtype='<f8')
+        tables[name] = {
+            'keys': offset,
+            'key_dtype': keys_array.dtype.str,
+            'values': align(offset + keys_array.nbytes),
+            'shape': values.shape,
+            'columns': None if columns is None else [str(i) for i in columns],
+        }
+        offset = tables[name]['values']
+        blocks.append((tables[name], keys_array, values))
+        offset = align(offset + values.nbytes)
+    header = json.dumps({'format': database_format,
+                         'version': database_version(),
+                         'tables': tables}).encode()
+    start = align(len(database_magic) + 8 + len(header))
+    directory = os.path.dirname(os.path.abspath(file))
+    os.makedirs(directory, exist_ok=True)
+    temporary_file = file + '.tmp'
+    with open(temporary_file, 'wb') as f:
+        f.write(database_magic)
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        for info, keys, values in blocks:
+            f.seek(start + info['keys'])
+            f.write(keys.tobytes())
+            f.seek(start + info['values'])
+            f.write(values.tobytes())
+    os.replace(temporary_file, file)
+    database_headers.pop(os.path.abspath(file), None)
+    return file
+
+def load_database_header(file):
+    file = os.path.abspath(file)
+    if file in database_headers: return database_headers[file]
+    header = None
+    try:
+        with open(file, 'rb') as f:
+            if f.read(len(database_magic)) == database_magic:
+                size = int.from_bytes(f.read(8), 'little')
+                header = json.loads(f.read(size))
+                header['start'] = align(len(database_magic) + 8 + size)
+    except OSError:
+        pass
+    if header and (header['format'] != database_format 
+                   or header['version'] != database_version()):
+        header = None
+    database_headers[file] = header
+    return header
+
+def load_database_table(name):
+    from .._settings import settings
+    file = settings.chemical_database
+    if not file: return None
+    header = load_database_header(file)
+    if not header: return None
+    info = header['tables'].get(name)
+    if info is None: return None
+    start = header['start']
+    shape = tuple(info['shape'])
+    keys = np.memmap(file, info['key_dtype'], 'r', 
+                     start + info['keys'], (shape[0],)).view(np.ndarray)
+    values = np.memmap(file, '<f8', 'r', 
+                       start + info['values'], shape).view(np.ndarray)
+    return keys, values, info['columns']
+
 # %% Data
 
 ### Volume ###
 
-from chemicals.volume import (
-    rho_data_COSTALD, 
-    rho_data_SNM0,
-    rho_data_Perry_8E_105_l, rho_values_Perry_8E_105_l,
-    rho_data_VDI_PPDS_2, rho_values_VDI_PPDS_2,
-    rho_data_CRC_inorg_l, rho_values_CRC_inorg_l,
-    rho_data_CRC_inorg_l_const,
-    rho_data_CRC_inorg_s_const, 
-    rho_data_CRC_virial, rho_values_CRC_virial,
-)
-from chemicals.miscdata import (
-    VDI_saturation_dict,
-    lookup_VDI_tabular_data,    
-)
-
-rho_data_COSTALD = RowData(rho_data_COSTALD.index, 
-                           rho_data_COSTALD.values,
-                           rho_data_COSTALD.columns)
-rho_data_SNM0 = RowData(rho_data_SNM0.index, 
-                        rho_data_SNM0.values,
-                        rho_data_SNM0.columns)
-rho_data_Perry_8E_105_l = RowData(rho_data_Perry_8E_105_l.index,
-                                  rho_values_Perry_8E_105_l)
-rho_data_VDI_PPDS_2 = RowData(rho_data_VDI_PPDS_2.index, 
-                              rho_values_VDI_PPDS_2)
-rho_data_CRC_inorg_l = RowData(rho_data_CRC_inorg_l.index, 
-                               rho_values_CRC_inorg_l)
-rho_data_CRC_inorg_l_const = RowData(rho_data_CRC_inorg_l_const.index, 
-                                     rho_data_CRC_inorg_l_const.values,
-                                     rho_data_CRC_inorg_l_const.columns)
-rho_data_CRC_inorg_s_const = RowData(rho_data_CRC_inorg_s_const, 
-                                     rho_data_CRC_inorg_s_const.values,
-                                     rho_data_CRC_inorg_s_const.columns)
-rho_data_CRC_virial = RowData(rho_data_CRC_virial.index, 
-                              rho_values_CRC_virial)
+volume = 'chemicals.volume'
+rho_data_COSTALD = lazy_row_data(volume, 'rho_data_COSTALD', columns=True)
+rho_data_SNM0 = lazy_row_data(volume, 'rho_data_SNM0', columns=True)
+rho_data_Perry_8E_105_l = lazy_row_data(volume, 'rho_data_Perry_8E_105_l', 
+                                        'rho_values_Perry_8E_105_l')
+rho_data_VDI_PPDS_2 = lazy_row_data(volume, 'rho_data_VDI_PPDS_2', 
+                                    'rho_values_VDI_PPDS_2')
+rho_data_CRC_inorg_l = lazy_row_data(volume, 'rho_data_CRC_inorg_l', 
+                                     'rho_values_CRC_inorg_l')
+rho_data_CRC_inorg_l_const = lazy_row_data(volume, 'rho_data_CRC_inorg_l_const',
+                                           columns=True)
+def load_rho_data_CRC_inorg_s_const():
+    df = load_attribute('chemicals.volume', 'rho_data_CRC_inorg_s_const')
+    return df, df.values, df.columns
+rho_data_CRC_inorg_s_const = RowData(loader=load_rho_data_CRC_inorg_s_const)
+rho_data_CRC_virial = lazy_row_data(volume, 'rho_data_CRC_virial', 
+                                    'rho_values_CRC_virial')
+VDI_saturation_dict = lazy_mapping('chemicals.miscdata', 'VDI_saturation_dict')
 
 ### Phase change ###
 
-from chemicals.phase_change import (
-    phase_change_data_Perrys2_150, phase_change_values_Perrys2_150,
-    phase_change_data_VDI_PPDS_4, phase_change_values_VDI_PPDS_4,
-    phase_change_data_Alibakhshi_Cs, 
-    Hvap_data_CRC,
-    Hvap_data_Gharagheizi,
-)
-
-phase_change_data_Perrys2_150 = RowData(phase_change_data_Perrys2_150.index,
-                                        phase_change_values_Perrys2_150)
-phase_change_data_VDI_PPDS_4 = RowData(phase_change_data_VDI_PPDS_4.index, 
-                                       phase_change_values_VDI_PPDS_4)
-phase_change_data_Alibakhshi_Cs = RowData(phase_change_data_Alibakhshi_Cs.index,
-                                          phase_change_data_Alibakhshi_Cs.values,
-                                          phase_change_data_Alibakhshi_Cs.columns)
-Hvap_data_CRC = RowData(Hvap_data_CRC.index, 
-                        Hvap_data_CRC.values,
-                        Hvap_data_CRC.columns)
-Hvap_data_Gharagheizi = RowData(Hvap_data_Gharagheizi.index, 
-                                Hvap_data_Gharagheizi.values,
-                                Hvap_data_Gharagheizi.columns)
+phase_change = 'chemicals.phase_change'
+phase_change_data_Perrys2_150 = lazy_row_data(phase_change, 'phase_change_data_Perrys2_150',
+                                              'phase_change_values_Perrys2_150')
+phase_change_data_VDI_PPDS_4 = lazy_row_data(phase_change, 'phase_change_data_VDI_PPDS_4',
+                                             'phase_change_values_VDI_PPDS_4')
+phase_change_data_Alibakhshi_Cs = lazy_row_data(phase_change, 'phase_change_data_Alibakhshi_Cs',
+                                                columns=True)
+Hvap_data_CRC = lazy_row_data(phase_change, 'Hvap_data_CRC', columns=True)
+Hvap_data_Gharagheizi = lazy_row_data(phase_change, 'Hvap_data_Gharagheizi', columns=True)
 
 ### Heat capacity ###
 
-from chemicals.heat_capacity import (
-    Cp_data_Poling,
-    Cp_values_Poling,
-    TRC_gas_data,
-    TRC_gas_values,
-    CRC_standard_data,
-    Cp_dict_PerryI,
-    zabransky_dict_sat_s,
-    zabransky_dict_sat_p,
-    zabransky_dict_const_s,
-    zabransky_dict_const_p,
-    zabransky_dict_iso_s,
-    zabransky_dict_iso_p,
-)
-
-Cp_data_Poling = RowData(Cp_data_Poling.index, Cp_values_Poling)
-TRC_gas_data = RowData(TRC_gas_data.index, TRC_gas_values)
-CRC_standard_data = RowData(CRC_standard_data)
+heat_capacity = 'chemicals.heat_capacity'
+Cp_data_Poling = lazy_row_data(heat_capacity, 'Cp_data_Poling', 'Cp_values_Poling')
+TRC_gas_data = lazy_row_data(heat_capacity, 'TRC_gas_data', 'TRC_gas_values')
+def load_CRC_standard_data():
+    return load_attribute('chemicals.heat_capacity', 'CRC_standard_data'), None, None
+CRC_standard_data = RowData(loader=load_CRC_standard_data)
+Cp_dict_PerryI = lazy_mapping(heat_capacity, 'Cp_dict_PerryI')
+zabransky_dict_sat_s = lazy_mapping(heat_capacity, 'zabransky_dict_sat_s')
+zabransky_dict_sat_p = lazy_mapping(heat_capacity, 'zabransky_dict_sat_p')
+zabransky_dict_const_s = lazy_mapping(heat_capacity, 'zabransky_dict_const_s')
+zabransky_dict_const_p = lazy_mapping(heat_capacity, 'zabransky_dict_const_p')
+zabransky_dict_iso_s = lazy_mapping(heat_capacity, 'zabransky_dict_iso_s')
+zabransky_dict_iso_p = lazy_mapping(heat_capacity, 'zabransky_dict_iso_p')
 
 ### Permitivity ###
 
-from chemicals.permittivity import (
-    permittivity_data_CRC, permittivity_values_CRC
-)
-
-permittivity_data_CRC = RowData(permittivity_data_CRC.index,
-                                permittivity_values_CRC)
+permittivity_data_CRC = lazy_row_data('chemicals.permittivity', 'permittivity_data_CRC',
+                                      'permittivity_values_CRC')
 
 ### Surface tension ###
 
-from chemicals.interface import (
-    sigma_data_Mulero_Cachadina, sigma_values_Mulero_Cachadina,
-    sigma_data_Jasper_Lange, sigma_values_Jasper_Lange,
-    sigma_data_Somayajulu, sigma_values_Somayajulu, sigma_data_Somayajulu2,
-    sigma_values_Somayajulu2, sigma_data_VDI_PPDS_11, sigma_values_VDI_PPDS_11
-)
-
-sigma_data_Mulero_Cachadina = RowData(sigma_data_Mulero_Cachadina.index, sigma_values_Mulero_Cachadina)
-sigma_data_Jasper_Lange = RowData(sigma_data_Jasper_Lange.index, sigma_values_Jasper_Lange,)
-sigma_data_Somayajulu = RowData(sigma_data_Somayajulu.index, sigma_values_Somayajulu)
-sigma_data_Somayajulu2 = RowData(sigma_data_Somayajulu2.index, sigma_values_Somayajulu2)
-sigma_data_VDI_PPDS_11 = RowData(sigma_data_VDI_PPDS_11.index, sigma_values_VDI_PPDS_11)
+interface = 'chemicals.interface'
+sigma_data_Mulero_Cachadina = lazy_row_data(interface, 'sigma_data_Mulero_Cachadina',
+                                            'sigma_values_Mulero_Cachadina')
+sigma_data_Jasper_Lange = lazy_row_data(interface, 'sigma_data_Jasper_Lange',
+                                        'sigma_values_Jasper_Lange')
+sigma_data_Somayajulu = lazy_row_data(interface, 'sigma_data_Somayajulu',
+                                      'sigma_values_Somayajulu')
+sigma_data_Somayajulu2 = lazy_row_data(interface, 'sigma_data_Somayajulu2',
+                                       'sigma_values_Somayajulu2')
+sigma_data_VDI_PPDS_11 = lazy_row_data(interface, 'sigma_data_VDI_PPDS_11',
+                                       'sigma_values_VDI_PPDS_11')
 
 ### Thermal conductivity ###
 
-from chemicals.thermal_conductivity import (
-    k_data_Perrys_8E_2_315, k_values_Perrys_8E_2_315, 
-    k_data_VDI_PPDS_9, k_values_VDI_PPDS_9
-)
-
-k_data_Perrys_8E_2_315 = RowData(k_data_Perrys_8E_2_315.index, k_values_Perrys_8E_2_315)
-k_data_VDI_PPDS_9 = RowData(k_data_VDI_PPDS_9.index, k_values_VDI_PPDS_9)
+thermal_conductivity = 'chemicals.thermal_conductivity'
+k_data_Perrys_8E_2_315 = lazy_row_data(thermal_conductivity, 'k_data_Perrys_8E_2_315',
+                                       'k_values_Perrys_8E_2_315')
+k_data_VDI_PPDS_9 = lazy_row_data(thermal_conductivity, 'k_data_VDI_PPDS_9',
+                                  'k_values_VDI_PPDS_9')
 
 ### Vapor pressure ###
 
-from chemicals.vapor_pressure import (
-    Psat_data_WagnerMcGarry, Psat_values_WagnerMcGarry,
-    Psat_data_WagnerPoling, Psat_values_WagnerPoling,
-    Psat_data_AntoinePoling, Psat_values_AntoinePoling,
-    Psat_data_AntoineExtended, Psat_values_AntoineExtended,
-    Psat_data_Perrys2_8, Psat_values_Perrys2_8,
-    Psat_data_VDI_PPDS_3, Psat_values_VDI_PPDS_3
-)
-
-Psat_data_WagnerMcGarry = RowData(Psat_data_WagnerMcGarry.index, Psat_values_WagnerMcGarry)
-Psat_data_WagnerPoling = RowData(Psat_data_WagnerPoling.index, Psat_values_WagnerPoling)
-Psat_data_AntoinePoling = RowData(Psat_data_AntoinePoling.index, Psat_values_AntoinePoling)
-Psat_data_AntoineExtended = RowData(Psat_data_AntoineExtended.index, Psat_values_AntoineExtended)
-Psat_data_Perrys2_8 = RowData(Psat_data_Perrys2_8.index, Psat_values_Perrys2_8)
-Psat_data_VDI_PPDS_3 = RowData(Psat_data_VDI_PPDS_3.index, Psat_values_VDI_PPDS_3)
+vapor_pressure = 'chemicals.vapor_pressure'
+Psat_data_WagnerMcGarry = lazy_row_data(vapor_pressure, 'Psat_data_WagnerMcGarry',
+                                        'Psat_values_WagnerMcGarry')
+Psat_data_WagnerPoling = lazy_row_data(vapor_pressure, 'Psat_data_WagnerPoling',
+                                       'Psat_values_WagnerPoling')
+Psat_data_AntoinePoling = lazy_row_data(vapor_pressure, 'Psat_data_AntoinePoling',
+                                        'Psat_values_AntoinePoling')
+Psat_data_AntoineExtended = lazy_row_data(vapor_pressure, 'Psat_data_AntoineExtended',
+                                          'Psat_values_AntoineExtended')
+Psat_data_Perrys2_8 = lazy_row_data(vapor_pressure, 'Psat_data_Perrys2_8',
+                                    'Psat_values_Perrys2_8')
+Psat_data_VDI_PPDS_3 = lazy_row_data(vapor_pressure, 'Psat_data_VDI_PPDS_3',
+                                     'Psat_values_VDI_PPDS_3')
 
 ### Viscosity ###
 
-from chemicals.viscosity import (
-    mu_data_Dutt_Prasad, mu_values_Dutt_Prasad,
-    mu_data_VN3, mu_values_VN3,
-    mu_data_VN2, mu_values_VN2,
-    mu_data_VN2E, mu_values_VN2E, 
-    mu_data_Perrys_8E_2_313, mu_values_Perrys_8E_2_313,
-    mu_data_Perrys_8E_2_312, mu_values_Perrys_8E_2_312,
-    mu_data_VDI_PPDS_7, mu_values_PPDS_7, 
-    mu_data_VDI_PPDS_8, mu_values_PPDS_8,
-)
-mu_data_Dutt_Prasad = RowData(mu_data_Dutt_Prasad.index, mu_values_Dutt_Prasad)
-mu_data_VN3 = RowData(mu_data_VN3.index, mu_values_VN3)
-mu_data_VN2 = RowData(mu_data_VN2.index, mu_values_VN2)
-mu_data_Perrys_8E_2_313 = RowData(mu_data_Perrys_8E_2_313.index, mu_values_Perrys_8E_2_313)
-mu_data_Perrys_8E_2_312 = RowData(mu_data_Perrys_8E_2_312.index, mu_values_Perrys_8E_2_312)
-mu_data_VDI_PPDS_7 = RowData(mu_data_VDI_PPDS_7.index, mu_values_PPDS_7)
-mu_data_VDI_PPDS_8 = RowData(mu_data_VDI_PPDS_8.index, mu_values_PPDS_8)
+viscosity = 'chemicals.viscosity'
+mu_data_Dutt_Prasad = lazy_row_data(viscosity, 'mu_data_Dutt_Prasad', 'mu_values_Dutt_Prasad')
+mu_data_VN3 = lazy_row_data(viscosity, 'mu_data_VN3', 'mu_values_VN3')
+mu_data_VN2 = lazy_row_data(viscosity, 'mu_data_VN2', 'mu_values_VN2')
+mu_data_Perrys_8E_2_313 = lazy_row_data(viscosity, 'mu_data_Perrys_8E_2_313', 
+                                        'mu_values_Perrys_8E_2_313')
+mu_data_Perrys_8E_2_312 = lazy_row_data(viscosity, 'mu_data_Perrys_8E_2_312', 
+                                        'mu_values_Perrys_8E_2_312')
+mu_data_VDI_PPDS_7 = lazy_row_data(viscosity, 'mu_data_VDI_PPDS_7', 'mu_values_PPDS_7')
+mu_data_VDI_PPDS_8 = lazy_row_data(viscosity, 'mu_data_VDI_PPDS_8', 'mu_values_PPDS_8')
+
+del volume, phase_change, heat_capacity, interface, thermal_conductivity, \
+    vapor_pressure, viscosity
@@ -15,12 +15,19 @@
 # https://github.com/CalebBell/chemicals/blob/master/LICENSE.txt for details.
 from chemicals import dippr
 from ..base import functor
+from math import log
+
+def dEQ101_dT(T, A, B, C, D, E):
+    return dippr.EQ101(T, A, B, C, D, E) * (-B/(T*T) + C/T + D*E*T**(E - 1.))
+
+def dEQ105_dT(T, A, B, C, D):
+    return dippr.EQ105(T, A, B, C, D) * log(B) * D/C * (1. - T/C)**(D - 1.)
 
 EQ100 = functor(dippr.EQ100)
-EQ101 = functor(dippr.EQ101)
+EQ101 = functor(dippr.EQ101, derivative_by_T=dEQ101_dT)
 EQ102 = functor(dippr.EQ102)
 EQ104 = functor(dippr.EQ104)
-EQ105 = functor(dippr.EQ105)
+EQ105 = functor(dippr.EQ105, derivative_by_T=dEQ105_dT)
 EQ106 = functor(dippr.EQ106)
 EQ107 = functor(dippr.EQ107)
 EQ114 = functor(dippr.EQ114)
@@ -15,6 +15,7 @@
 # https://github.com/CalebBell/chemicals/blob/master/LICENSE.txt for details.
 from chemicals import heat_capacity as hc
 from math import log
+from fluids.constants import R
 import numpy as np
 from ..utils import forward
 from ..base import (InterpolatedTDependentModel,
@@ -136,7 +137,10 @@ def TRCCp_definite_integral_over_T(Ta, Tb, a0, a1, a2, a3, a4, a5, a6, a7):
     return (hc.TRCCp_integral_over_T(Tb, a0, a1, a2, a3, a4, a5, a6, a7)
             - hc.TRCCp_integral_over_T(Ta, a0, a1, a2, a3, a4, a5, a6, a7))
 
-Poling = functor(hc.Poling, 'Cn.g')
+def dPoling_dT(T, a, b, c, d, e):
+    return R*(b + T*(2.*c + T*(3.*d + 4.*e*T)))
+
+Poling = functor(hc.Poling, 'Cn.g', derivative_by_T=dPoling_dT)
 
 @forward(hc)
 @functor(var='H.g')
@@ -224,7 +228,13 @@ def Dadgostar_Shaw_definite_integral_over_T(Ta, Tb, similarity_variable, MW):
                - hc.Dadgostar_Shaw_integral_over_T(Ta, similarity_variable, MW, terms))
 hc.Dadgostar_Shaw_definite_integral_over_T = Dadgostar_Shaw_definite_integral_over_T
 
-Zabransky_quasi_polynomial = functor(hc.Zabransky_quasi_polynomial, 'Cn.l')
+def dZabransky_quasi_polynomial_dT(T, Tc, a1, a2, a3, a4, a5, a6):
+    Tr = T/Tc
+    x = 1. - Tr
+    return R/Tc*(-a1/x + a2/(x*x) + a4 + Tr*(2.*a5 + 3.*a6*Tr))
+
+Zabransky_quasi_polynomial = functor(hc.Zabransky_quasi_polynomial, 'Cn.l',
+                                     derivative_by_T=dZabransky_quasi_polynomial_dT)
  
 @forward(hc)
 @functor(var='H.l')
@@ -240,7 +250,11 @@ def Zabransky_quasi_polynomial_definite_integral_over_T(Ta, Tb, Tc, a1, a2, a3,
             - hc.Zabransky_quasi_polynomial_integral_over_T(Ta, Tc, a1, a2, a3, a4, a5, a6))
 hc.Zabransky_quasi_polynomial_definite_integral_over_T = Zabransky_quasi_polynomial_definite_integral_over_T
 
-Zabransky_cubic = functor(hc.Zabransky_cubic, 'Cn.l')
+def dZabransky_cubic_dT(T, a1, a2, a3, a4):
+    T = 0.01*T
+    return R*(a2 + T*(2.*a3 + 3.*a4*T))/100.
+
+Zabransky_cubic = functor(hc.Zabransky_cubic, 'Cn.l', derivative_by_T=dZabransky_cubic_dT)
 
 @forward(hc)
 @functor(var='H.l')
@@ -15,6 +15,9 @@
 # https://github.com/CalebBell/chemicals/blob/master/LICENSE.txt for details.
 import re
 import os
+import json
+import hashlib
+import numpy as np
 from chemicals.elements import (
     periodic_table, 
     homonuclear_elemental_gases,  
@@ -25,11 +28,22 @@ from chemicals.identifiers import (
     ChemicalMetadata,
     check_CAS,
 )
-from ..utils import forward
+from ..utils import forward, LRUCache
+from .data import align
 from chemicals import identifiers
 folder = identifiers.folder
 searchable_format = re.compile(r"\B([A-Z])")
 
+#: tuple[str] Metadata files in the order they are loaded.
+database_files = tuple([os.path.join(folder, i) for i in (
+    'chemical identifiers pubchem small.tsv',
+    'chemical identifiers example user db.tsv',
+    'Cation db.tsv',
+    'Anion db.tsv',
+    'Inorganic db.tsv',
+    'chemical identifiers pubchem large.tsv',
+)])
+
 @forward(identifiers)
 def spaceout_words(ID):
     return searchable_format.sub(r" \1", ID)
@@ -38,6 +52,220 @@ def spaceout_words(ID):
 def to_searchable_format(ID):    
     return spaceout_words(ID).replace('_', ' ')
 
+# %% Search index
+
+#: tuple[str] Kinds of identifiers in search indices.
+search_index_kinds = ('name', 'CAS', 'pubchem', 'smiles', 'InChI', 'InChI_key', 'formula')
+
+#: [bytes] Identifies search index files.
+search_index_magic = b'TMOINDEX'
+
+#: [int] Format version of search index files.
+search_index_format = 1
+
+def search_index_version(files=None):
+    import chemicals
+    files = ':'.join([f"{os.path.basename(i)}:{os.path.getsize(i)}" for i in files or database_files])
+    return f"chemicals {chemicals.__version__}:{files}"
+
+def encode_key(key):
+    return str(key).encode('utf-8', 'surrogatepass')
+
+def hash_key(key):
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), 'little')
+
+def metadata_to_line(obj):
+    values = (obj.pubchemid, obj.CAS, obj.formula, repr(obj.MW), obj.smiles,
+              obj.InChI, obj.InChI_key, obj.iupac_name, obj.common_name, *obj.synonyms)
+    return '\t'.join(['' if i is None else str(i) for i in values])
+
+def line_to_metadata(line):
+    (pubchemid, CAS, formula, MW, smiles, InChI, 
+     InChI_key, iupac_name, common_name, *synonyms) = line.split('\t')
+    return ChemicalMetadata(int(pubchemid) if pubchemid else None, int(CAS), 
+                            formula, float(MW), smiles, InChI, InChI_key, 
+                            iupac_name, common_name, synonyms or ())
+
+def build_search_index(file, files=None):
+    """
+    Build a search index of all chemical metadata (by name, CAS, pubchem 
+    identifier, SMILES, InChI, InChI key, and formula) and save it to given 
+    file. Return the file name. Metadata is read from the given metadata 
+    files (defaults to `database_files`).
+    
+    Keys are stored as 64-bit hashes (sorted for binary search) along with 
+    the keys themselves (to resolve collisions) and the row of their 
+    metadata. Lookups give the same results as searching through all 
+    metadata files. The index is versioned by its format, the version of 
+    the chemicals library, and the size of the metadata files; outdated 
+    files are ignored.
+    
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> import thermosteam as tmo
+    >>> from thermosteam.chemicals.identifiers import build_search_index
+    >>> file = build_search_index(os.path.join(tempfile.mkdtemp(), 'index.bin')) # doctest: +SKIP
+    >>> tmo.settings.chemical_search_index = file # doctest: +SKIP
+    >>> tmo.Chemicals(['Water', 'Ethanol', 'AceticAcid']) # doctest: +SKIP
+    Chemicals([Water, Ethanol, AceticAcid])
+    >>> tmo.settings.chemical_search_index = None # doctest: +SKIP
+    
+    """
+    db = ChemicalMetadataDB(files)
+    db.load_all()
+    rows = {}
+    lines = []
+    for obj in db.CAS_index.values():
+        rows[id(obj)] = len(lines)
+        lines.append(metadata_to_line(obj).encode('utf-8', 'surrogatepass'))
+    blocks = []
+    def add_block(array):
+        offset = align(sum([i.nbytes for i in blocks]))
+        padding = offset - sum([i.nbytes for i in blocks])
+        if padding: blocks.append(np.zeros(padding, np.uint8))
+        blocks.append(array)
+        return offset
+    def add_blob(items):
+        offsets = np.zeros(len(items) + 1, np.uint64)
+        offsets[1:] = np.cumsum([len(i) for i in items])
+        return {'offsets': add_block(offsets),
+                'data': add_block(np.frombuffer(b''.join(items), np.uint8)),
+                'size': len(items)}
+    header = {'format': search_index_format,
+              'version': search_index_version(files),
+              'rows': add_blob(lines),
+              'kinds': {}}
+    for kind in search_index_kinds:
+        index = getattr(db, kind + '_index')
+        keys = [encode_key(i) for i in index if i is not None]
+        objs = [j for i, j in index.items() if i is not None]
+        hashes = np.array([hash_key(i) for i in keys], np.uint64)
+        order = np.argsort(hashes, kind='stable')
+        info = add_blob([keys[i] for i in order])
+        info['hashes'] = add_block(hashes[order])
+        info['rows'] = add_block(np.array([rows[id(objs[i])] for i in order], np.uint32))
+        header['kinds'][kind] = info
+    header = json.dumps(header).encode()
+    start = align(len(search_index_magic) + 8 + len(header))
+    directory = os.path.dirname(os.path.abspath(file))
+    os.makedirs(directory, exist_ok=True)
+    temporary_file = file + '.tmp'
+    with open(temporary_file, 'wb') as f:
+        f.write(search_index_magic)
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        f.seek(start)
+        for i in blocks: f.write(i.tobytes())
+    os.replace(temporary_file, file)
+    return file
+
+
+class MappedBlob:
+    """Create a MappedBlob object for reading variable length items from 
+    a memory mapped file."""
+    __slots__ = ('offsets', 'data')
+    
+    def __init__(self, file, start, info):
+        size = info['size']
+        self.offsets = np.memmap(file, np.uint64, 'r', start + info['offsets'], 
+                                 (size + 1,)).view(np.ndarray)
+        nbytes = int(self.offsets[-1])
+        self.data = np.memmap(file, np.uint8, 'r', start + info['data'], 
+                              (max(nbytes, 1),)).view(np.ndarray)
+        
+    def __getitem__(self, index):
+        offsets = self.offsets
+        return self.data[offsets[index]:offsets[index + 1]].tobytes()
+
+
+class MappedIndex:
+    """Create a MappedIndex object that works as a read-only dictionary of 
+    chemical metadata by identifier."""
+    __slots__ = ('search_index', 'keys', 'hashes', 'rows')
+    
+    def __init__(self, search_index, file, start, info):
+        self.search_index = search_index
+        self.keys = MappedBlob(file, start, info)
+        size = info['size']
+        self.hashes = np.memmap(file, np.uint64, 'r', start + info['hashes'],
+                                (size,)).view(np.ndarray)
+        self.rows = np.memmap(file, np.uint32, 'r', start + info['rows'],
+                              (size,)).view(np.ndarray)
+    
+    def _find(self, key, value, index):
+        hashes = self.hashes
+        keys = self.keys
+        size = hashes.size
+        while index < size and hashes[index] == value:
+            if keys[index] == key: return self.search_index.get_row(int(self.rows[index]))
+            index += 1
+    
+    def get_many(self, keys):
+        """Return a list of metadata for all keys (None if not found)."""
+        keys = [encode_key(i) for i in keys]
+        hashes = np.array([hash_key(i) for i in keys], np.uint64)
+        indices = self.hashes.searchsorted(hashes)
+        return [self._find(*i) for i in zip(keys, hashes.tolist(), indices.tolist())]
+    
+    def get(self, key, default=None):
+        obj, = self.get_many([key])
+        return default if obj is None else obj
+    
+    def __getitem__(self, key):
+        obj, = self.get_many([key])
+        if obj is None: raise KeyError(key)
+        return obj
+    
+    def __contains__(self, key):
+        return self.get(key) is not None
+    
+    def __len__(self):
+        return self.hashes.size
+
+
+class ChemicalSearchIndex:
+    """Create a ChemicalSearchIndex object that loads chemical metadata from 
+    a memory mapped search index file (see :func:`build_search_index`)."""
+    __slots__ = ('file', 'lines', 'metadata', *search_index_kinds)
+    
+    def __init__(self, file, header):
+        self.file = file
+        self.metadata = {}
+        start = header['start']
+        self.lines = MappedBlob(file, start, header['rows'])
+        for kind, info in header['kinds'].items():
+            setattr(self, kind, MappedIndex(self, file, start, info))
+    
+    @classmethod
+    def from_file(cls, file, files=None):
+        """Return a ChemicalSearchIndex object from given file, or None if 
+        the file is missing or outdated with respect to the given metadata 
+        files (defaults to `database_files`)."""
+        file = os.path.abspath(os.fspath(file))
+        try:
+            with open(file, 'rb') as f:
+                if f.read(len(search_index_magic)) != search_index_magic: return None
+                size = int.from_bytes(f.read(8), 'little')
+                header = json.loads(f.read(size))
+        except OSError:
+            return None
+        if (header['format'] != search_index_format 
+            or header['version'] != search_index_version(files)):
+            return None
+        header['start'] = align(len(search_index_magic) + 8 + size)
+        return cls(file, header)
+    
+    def get_row(self, row):
+        """Return metadata at given row."""
+        metadata = self.metadata
+        if row in metadata: return metadata[row]
+        metadata[row] = obj = line_to_metadata(self.lines[row].decode('utf-8', 'surrogatepass'))
+        return obj
+
+
+# %% Metadata database
+
 @forward(identifiers)
 class ChemicalMetadataDB:
     __slots__ = ('pubchem_index',
@@ -47,18 +275,14 @@ class ChemicalMetadataDB:
                  'name_index',
                  'CAS_index',
                  'formula_index',
+                 'files',
                  'unloaded_files',
+                 'mapped_index',
     )
     
-    cache = {}
+    cache = LRUCache(capacity=1000)
     
-    def __init__(self, 
-                 files=[os.path.join(folder, 'chemical identifiers pubchem large.tsv'),
-                        os.path.join(folder, 'Inorganic db.tsv'),
-                        os.path.join(folder, 'Anion db.tsv'),
-                        os.path.join(folder, 'Cation db.tsv'),
-                        os.path.join(folder, 'chemical identifiers example user db.tsv'),
-                        os.path.join(folder, 'chemical identifiers pubchem small.tsv')]):                
+    def __init__(self, files=None):
         self.pubchem_index = {}
         self.smiles_index = {}
         self.InChI_index = {}
@@ -66,8 +290,35 @@ class ChemicalMetadataDB:
         self.name_index = {}
         self.CAS_index = {}
         self.formula_index = {}
-        self.unloaded_files = files
+        self.files = files = tuple(files or database_files)
+        # Files are popped from the end as needed
+        self.unloaded_files = list(reversed(files))
+        self.mapped_index = None
         self.load_elements()
+    
+    def set_search_index(self, file):
+        """
+        Search through the prebuilt index in given file (as built by 
+        :func:`build_search_index`) instead of loading metadata files. 
+        The index is memory mapped, so all processes using the same file 
+        share its memory. If no file is given (or the file is outdated), 
+        metadata files are loaded as needed.
+        
+        """
+        mapped_index = ChemicalSearchIndex.from_file(file, self.files) if file else None
+        if mapped_index is None:
+            self.__init__(self.files)
+        else:
+            for kind in search_index_kinds: 
+                setattr(self, kind + '_index', getattr(mapped_index, kind))
+            self.unloaded_files = []
+            self.mapped_index = mapped_index
+        self.cache.clear()
+    
+    def load_all(self):
+        """Load all metadata files."""
+        files = self.unloaded_files
+        while files: self.load(files.pop())
         
     def load_elements(self):
         InChI_key_index = self.InChI_key_index
@@ -160,12 +411,39 @@ class ChemicalMetadataDB:
 
     def search(self, ID):
         cache = self.cache
-        if ID in cache:
-            return cache[ID]
-        else:
-            if len(cache) > 100: cache.clear()
-            cache[ID] = obj = self._search(ID)
-            return obj
+        obj = cache.get(ID)
+        if obj is None: cache[ID] = obj = self._search(ID)
+        return obj
+
+    def search_many(self, IDs):
+        """
+        Return a list of metadata for all identifiers (None for identifiers
+        which are not found). With a search index, names are looked up in 
+        one batch. Results are cached for subsequent searches.
+        
+        """
+        cache = self.cache
+        mapped_index = self.mapped_index
+        results = {}
+        if mapped_index:
+            names = {}
+            for ID in IDs:
+                if not ID or ID in results or ID in cache or not isinstance(ID, str) or '=' in ID: continue
+                results[ID] = None
+                ID_lower = ID.replace('_', ' ').lower()
+                names[ID] = (ID_lower, spaceout_words(ID.replace('_', ' ')).lower())
+            found = mapped_index.name.get_many([j for i in names.values() for j in i])
+            for n, ID in enumerate(names):
+                obj = found[2*n] or found[2*n + 1]
+                if obj: cache[ID] = results[ID] = obj
+        metadata = []
+        for ID in IDs:
+            obj = results.get(ID)
+            if obj is None:
+                try: obj = self.search(ID)
+                except LookupError: pass
+            metadata.append(obj)
+        return metadata
 
     def _search(self, ID):
         if not ID: raise ValueError('ID cannot be empty')
@@ -16,6 +16,7 @@
 from chemicals import vapor_pressure as vp
 from ..base import functor, TDependentHandleBuilder
 from chemicals.dippr import EQ101
+from math import exp, log, sqrt
 import numpy as np
 from .data import (
     Psat_data_WagnerMcGarry,
@@ -32,10 +33,31 @@ vp.__all__.extend([
     'vapor_pressure_handle',
 ])
 
-Antoine = functor(vp.Antoine, 'Psat')
+def dAntoine_dT(T, A, B, C, base=10.0):
+    T_C = T + C
+    return base**(A - B/T_C) * B * log(base) / (T_C * T_C)
+
+def dWagner_original_dT(T, Tc, Pc, a, b, c, d):
+    Tr = T / Tc
+    tau = 1. - Tr
+    tau2 = tau * tau
+    f = ((d*tau2*tau + c)*tau2 + a + b*sqrt(tau))*tau
+    df_dtau = a + 1.5*b*sqrt(tau) + (3.*c + 6.*d*tau2*tau)*tau2
+    return Pc * exp(f / Tr) * -(df_dtau*Tr + f) / (Tc*Tr*Tr)
+
+def dWagner_dT(T, Tc, Pc, a, b, c, d):
+    Tr = T / Tc
+    tau = 1. - Tr
+    tau_rt = sqrt(tau)
+    tau_15 = tau * tau_rt
+    f = a*tau + b*tau_15 + c*tau_15*tau + d*tau**5
+    df_dtau = a + 1.5*b*tau_rt + 2.5*c*tau_15 + 5.*d*tau**4
+    return Pc * exp(f / Tr) * -(df_dtau*Tr + f) / (Tc*Tr*Tr)
+
+Antoine = functor(vp.Antoine, 'Psat', derivative_by_T=dAntoine_dT)
 TRC_Antoine_extended = functor(vp.TRC_Antoine_extended, 'Psat')
-Wagner_original = functor(vp.Wagner_original, 'Psat')
-Wagner = functor(vp.Wagner, 'Psat')
+Wagner_original = functor(vp.Wagner_original, 'Psat', derivative_by_T=dWagner_original_dT)
+Wagner = functor(vp.Wagner, 'Psat', derivative_by_T=dWagner_dT)
 boiling_critical_relation = functor(vp.boiling_critical_relation , 'Psat')
 Lee_Kesler = functor(vp.Lee_Kesler, 'Psat')
 Ambrose_Walton = functor(vp.Ambrose_Walton, 'Psat')
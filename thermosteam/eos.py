@@ -20,13 +20,189 @@ Data and methods related to equations of state.
 
 
 __all__ = ['GCEOS', 'PR', 'SRK', 'PR78', 'PRSV', 'PRSV2', 'VDW', 'RK',  
-'APISRK', 'TWUPR', 'TWUSRK', 'ALPHA_FUNCTIONS', 'eos_list', 'GCEOS_DUMMY']
+'APISRK', 'TWUPR', 'TWUSRK', 'ALPHA_FUNCTIONS', 'eos_list', 'GCEOS_DUMMY',
+'SaturationTable']
 
 from cmath import atanh as catanh
 from scipy.optimize import newton
+from scipy.interpolate import CubicSpline
+from warnings import warn
+from bisect import bisect_right
 from .functional import horner
 from ._constants import R
 from math import log, exp, sqrt, copysign
+from .utils.disk_cache import load_cached, dump_cached
+import numpy as np
+
+
+# %% Saturation tables
+
+def saturation_values(eos, T, maxiter=200):
+    # Return ln(Psat), dPsat_dT/Psat, V_l_sat and ln(V_g_sat) at temperatures,
+    # where the vapor pressure is solved for equal liquid and gas fugacities 
+    # (starting from the vapor pressure polynomials) and its derivative is
+    # given by the Clapeyron equation.
+    a_alpha, da_alpha_dT, d2a_alpha_dT2 = eos.a_alpha_and_derivatives_array(T)
+    args = (eos.b, eos.delta, eos.epsilon, a_alpha, da_alpha_dT, d2a_alpha_dT2)
+    departures = eos.main_derivatives_and_departures_array
+    RT = R * T
+    P = eos.Psat_array(T)
+    P_lb = np.zeros_like(T)
+    P_ub = np.full_like(T, np.inf)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for i in range(maxiter):
+            V_l, V_g, N = eos.volume_solutions_array(T, P, *args[:4])
+            dP_dT, dP_dV, _, d2P_dV2, d2P_dTdV, H_l, S_l, _ = departures(T, P, V_l, *args)
+            *_, H_g, S_g, _ = departures(T, P, V_g, *args)
+            two_phases = (N > 1) & (V_g > V_l)
+            dG = (H_l - T * S_l) - (H_g - T * S_g)
+            # A single volume solution is gas-like if the pressure is too low
+            PIP = V_l * (d2P_dTdV / dP_dT - d2P_dV2 / dP_dV)
+            low = np.where(two_phases, dG > 0., PIP <= 1.) 
+            P_lb = np.where(low, P, P_lb)
+            P_ub = np.where(low, P_ub, P)
+            P_newton = P - dG / (V_l - V_g)
+            converged = (np.abs(dG) < 1e-12 * RT) | (np.abs(P_newton - P) < 1e-14 * P)
+            if (two_phases & converged).all(): break
+            P_bisect = np.where(np.isinf(P_ub), 2. * P, 
+                                np.where(P_lb == 0., 0.5 * P, (P_lb * P_ub) ** 0.5))
+            P = np.where(two_phases & (P_newton > P_lb) & (P_newton < P_ub), 
+                         P_newton, P_bisect)
+        else:
+            raise RuntimeError("saturation pressure did not converge "
+                              f"after {maxiter} iterations")
+        dPsat_dT = (H_g - H_l) / (T * (V_g - V_l))
+        values = np.array([np.log(P), dPsat_dT / P, V_l, np.log(V_g)]).transpose()
+    return values
+
+def saturation_spline(eos, x_lb, x_ub, tol, N=16, N_max=8192):
+    # Piecewise cubic coefficients of saturation values with respect to 
+    # x = (Tc - T)**0.5, refined until the relative error at the midpoints 
+    # of all intervals is below tol.
+    Tc = eos.Tc
+    x = np.linspace(x_lb, x_ub, N + 1)
+    y = saturation_values(eos, Tc - x * x)
+    while True:
+        spline = CubicSpline(x, y, axis=0)
+        x_mid = 0.5 * (x[1:] + x[:-1])
+        y_mid = saturation_values(eos, Tc - x_mid * x_mid)
+        error = np.abs(spline(x_mid) - y_mid)
+        error[:, 1:3] /= np.abs(y_mid[:, 1:3]) # Logarithms are already relative
+        max_error = error.max()
+        if max_error < tol: break
+        x_new = np.empty(2 * x.size - 1)
+        x_new[::2] = x
+        x_new[1::2] = x_mid
+        y_new = np.empty([x_new.size, 4])
+        y_new[::2] = y
+        y_new[1::2] = y_mid
+        x = x_new
+        y = y_new
+        if x.size > N_max:
+            warn(f"saturation table could not reach a tolerance of {tol:.3g}; "
+                 f"maximum relative error is {max_error:.3g}", RuntimeWarning)
+            spline = CubicSpline(x, y, axis=0)
+            break
+    return spline.x, spline.c
+
+
+#: dict[tuple, SaturationTable] Saturation tables by EOS parameters, 
+#: temperature range, and tolerance (shared by all EOS objects).
+saturation_tables = {}
+
+class SaturationTable:
+    r'''
+    Create a SaturationTable object that interpolates the vapor pressure, its
+    temperature derivative, and the saturated liquid and gas volumes of an 
+    EOS with cubic splines. Vapor pressures are solved for equal liquid and 
+    gas fugacities (as in `GCEOS.Psat` with `polish=True`) and their 
+    derivatives are given by the Clapeyron equation. Splines are built with 
+    respect to :math:`x = \sqrt{T_c - T}` (which removes the square-root 
+    behavior of saturated volumes near the critical point) and refined until
+    the relative error at the midpoints of all intervals is below the 
+    tolerance.
+    
+    Parameters
+    ----------
+    eos : GCEOS
+        Pure component equation of state.
+    Tmin : float
+        Minimum temperature [K].
+    Tmax : float
+        Maximum temperature [K]. Must be less than the critical temperature.
+    tol : float
+        Relative tolerance of interpolated values.
+    
+    Examples
+    --------
+    >>> eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
+    >>> table = SaturationTable(eos, 200., 507., 1e-6)
+    >>> abs(table.Psat(400.) / eos.Psat(400., polish=True) - 1.) < 1e-6
+    True
+    
+    '''
+    __slots__ = ('Tc', 'Tmin', 'Tmax', 'tol', 'x', 'c', '_x')
+    
+    def __init__(self, eos, Tmin, Tmax, tol):
+        Tc = eos.Tc
+        if not Tmin < Tmax < Tc:
+            raise ValueError('temperatures must satisfy Tmin < Tmax < Tc')
+        self.Tc = Tc
+        self.Tmin = Tmin
+        self.Tmax = Tmax
+        self.tol = tol
+        self.x, self.c = saturation_spline(eos, (Tc - Tmax) ** 0.5, (Tc - Tmin) ** 0.5, tol)
+        self._x = self.x.tolist()
+    
+    def __setstate__(self, state):
+        for i, j in state[1].items(): setattr(self, i, j)
+        self._x = self.x.tolist()
+    
+    def __getstate__(self):
+        return (None, {i: getattr(self, i) for i in self.__slots__[:-1]})
+    
+    def __contains__(self, T):
+        return self.Tmin <= T <= self.Tmax
+    
+    def values(self, T):
+        """Return interpolated ln(Psat), dPsat_dT/Psat, V_l_sat, and 
+        ln(V_g_sat) at given temperature(s)."""
+        if isinstance(T, np.ndarray):
+            x = (self.Tc - T) ** 0.5
+            index = np.clip(np.searchsorted(self.x, x, 'right') - 1, 0, len(self._x) - 2)
+            dx = (x - self.x[index])[..., None]
+        else:
+            x = (self.Tc - T) ** 0.5
+            index = min(max(bisect_right(self._x, x) - 1, 0), len(self._x) - 2)
+            dx = x - self._x[index]
+        c = self.c[:, index]
+        return ((c[0] * dx + c[1]) * dx + c[2]) * dx + c[3]
+    
+    def Psat(self, T):
+        """Return interpolated vapor pressure [Pa]."""
+        return np.exp(self.values(T)[..., 0])
+    
+    def dPsat_dT(self, T):
+        """Return interpolated temperature derivative of vapor pressure [Pa/K]."""
+        lnPsat, dlnPsat_dT, *_ = self.values(T).T
+        return np.exp(lnPsat) * dlnPsat_dT
+    
+    def V_l_sat(self, T):
+        """Return interpolated saturated liquid molar volume [m^3/mol]."""
+        return self.values(T)[..., 2]
+    
+    def V_g_sat(self, T):
+        """Return interpolated saturated gas molar volume [m^3/mol]."""
+        return np.exp(self.values(T)[..., 3])
+    
+    def Hvap(self, T):
+        """Return heat of vaporization [J/mol] computed from interpolated 
+        saturation properties with the Clapeyron equation."""
+        lnPsat, dlnPsat_dT, V_l, lnV_g = self.values(T).T
+        return np.exp(lnPsat) * dlnPsat_dT * T * (np.exp(lnV_g) - V_l)
+    
+    def __repr__(self):
+        return f"<{type(self).__name__}: {self.Tmin:.5g} to {self.Tmax:.5g} K, tol={self.tol:.3g}>"
 
 
 class GCEOS:
@@ -87,6 +263,14 @@ class GCEOS:
     the variable names.
     '''
     kwargs = {}
+    #: Whether `a_alpha_and_derivatives` accepts arrays of temperatures.
+    vectorized_a_alpha = False
+    
+    #: [SaturationTable or None] Interpolation table of saturation properties
+    #: used (within its temperature range) by `Psat`, `dPsat_dT`, `V_l_sat`,
+    #: `V_g_sat`, and `Hvap`. 
+    saturation_table = None
+    
     def check_sufficient_inputs(self):
         '''Method to an exception if none of the pairs (T, P), (T, V), or 
         (P, V) are given. '''
@@ -620,6 +804,386 @@ class GCEOS:
             Cv_dep = -T*(sqrt(1/(delta**2 - 4*epsilon))*log(V - delta**2*sqrt(1/(delta**2 - 4*epsilon))/2 + delta/2 + 2*epsilon*sqrt(1/(delta**2 - 4*epsilon))) - sqrt(1/(delta**2 - 4*epsilon))*log(V + delta**2*sqrt(1/(delta**2 - 4*epsilon))/2 + delta/2 - 2*epsilon*sqrt(1/(delta**2 - 4*epsilon))))*d2a_alpha_dT2
         return [dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep]
     
+    def phase_volume(self, T, P, phase, a_alpha):
+        r'''
+        Return the molar volume of the given phase at `T` and `P` without 
+        modifying the EOS object. The liquid and gas volumes are the smallest 
+        and largest real volume solutions, respectively. If only one real 
+        solution exists, its phase is determined with the phase 
+        identification parameter as in `set_properties_from_solution`.
+        
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        phase : str
+            'l' for liquid or 'g' for gas.
+        a_alpha : float
+            Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+        
+        Returns
+        -------
+        V : float
+            Molar volume, [m^3/mol]
+        
+        '''
+        b = self.b
+        delta = self.delta
+        epsilon = self.epsilon
+        RT = R*T
+        good_roots = []
+        for i in self.volume_solutions(T, P, b, delta, epsilon, a_alpha):
+            V = i.real
+            if abs(i.imag) > 1E-9 or V < 0: continue
+            # Polish with the pressure explicit form as in `volume_solutions_array`,
+            # as the closed form solutions lose precision at low pressures
+            for _ in range(2):
+                x0 = V - b
+                x1 = V*V + delta*V + epsilon
+                df = a_alpha*(2.*V + delta)/(x1*x1) - RT/(x0*x0)
+                if df >= 0.: break
+                polished = V - (RT/x0 - a_alpha/x1 - P)/df
+                if polished <= b: break
+                V = polished
+            good_roots.append(V)
+        if len(good_roots) == 1:
+            V, = good_roots
+            _, da_alpha_dT, d2a_alpha_dT2 = self.a_alpha_and_derivatives(T)
+            dP_dT, dP_dV, _, d2P_dV2, d2P_dTdV, *_ = self.main_derivatives_and_departures(
+                T, P, V, b, delta, epsilon, a_alpha, da_alpha_dT, d2a_alpha_dT2
+            )
+            PIP = V*(d2P_dTdV/dP_dT - d2P_dV2/dP_dV)
+            if phase != ('l' if PIP > 1 else 'g'):
+                raise ValueError(f"no volume solution for phase {repr(phase)} "
+                                 f"at {T:.5g} K and {P:.5g} Pa")
+            return V
+        elif phase == 'l':
+            return min(good_roots)
+        elif phase == 'g':
+            return max(good_roots)
+        else:
+            raise ValueError(f"phase must be either 'l' or 'g', not {repr(phase)}")
+    
+    def volume(self, T, P, phase):
+        r'''
+        Return the molar volume of the given phase at `T` and `P`. Unlike 
+        `to_TP`, no EOS object is created and only the volume is computed.
+        
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        phase : str
+            'l' for liquid or 'g' for gas.
+        
+        Returns
+        -------
+        V : float
+            Molar volume, [m^3/mol]
+        
+        Examples
+        --------
+        >>> import numpy as np
+        >>> eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
+        >>> np.allclose(eos.volume(299., 1E6, 'l'), eos.V_l)
+        True
+        
+        '''
+        return self.phase_volume(T, P, phase, self.a_alpha_and_derivatives(T, full=False))
+    
+    def departures(self, T, P, phase):
+        r'''
+        Return the enthalpy and entropy departures of the given phase at `T`
+        and `P`. Unlike `to_TP`, no EOS object is created and only the 
+        departures are computed.
+        
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        phase : str
+            'l' for liquid or 'g' for gas.
+        
+        Returns
+        -------
+        H_dep : float
+            Enthalpy departure, [J/mol]
+        S_dep : float
+            Entropy departure, [J/mol/K]
+        
+        Examples
+        --------
+        >>> import numpy as np
+        >>> eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
+        >>> np.allclose(eos.departures(299., 1E6, 'l'), (eos.H_dep_l, eos.S_dep_l))
+        True
+        
+        '''
+        a_alpha, da_alpha_dT, d2a_alpha_dT2 = self.a_alpha_and_derivatives(T)
+        V = self.phase_volume(T, P, phase, a_alpha)
+        *_, H_dep, S_dep, _ = self.main_derivatives_and_departures(
+            T, P, V, self.b, self.delta, self.epsilon, a_alpha, da_alpha_dT, d2a_alpha_dT2
+        )
+        return H_dep, S_dep
+    
+    def H_dep(self, T, P, phase):
+        """Return the enthalpy departure of the given phase at `T` and `P` [J/mol]."""
+        return self.departures(T, P, phase)[0]
+    
+    def S_dep(self, T, P, phase):
+        """Return the entropy departure of the given phase at `T` and `P` [J/mol/K]."""
+        return self.departures(T, P, phase)[1]
+    
+    def a_alpha_and_derivatives_array(self, T):
+        r'''
+        Return arrays of `a_alpha` and its first and second temperature 
+        derivatives at an array of temperatures. See 
+        `a_alpha_and_derivatives` for more documentation.
+        
+        Parameters
+        ----------
+        T : array_like
+            Temperatures, [K]
+        
+        Returns
+        -------
+        a_alpha : ndarray
+            Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+        da_alpha_dT : ndarray
+            Temperature derivative of coefficient calculated by EOS-specific 
+            method, [J^2/mol^2/Pa/K]
+        d2a_alpha_dT2 : ndarray
+            Second temperature derivative of coefficient calculated by  
+            EOS-specific method, [J^2/mol^2/Pa/K**2]
+        
+        '''
+        T = np.asarray(T, dtype=float)
+        if self.vectorized_a_alpha:
+            return [np.broadcast_to(i, T.shape).astype(float) 
+                    for i in self.a_alpha_and_derivatives(T)]
+        else:
+            values = np.array([self.a_alpha_and_derivatives(i) for i in T.flat], dtype=float)
+            return [i.reshape(T.shape) for i in values.reshape([T.size, 3]).T]
+    
+    @staticmethod
+    def volume_solutions_array(T, P, b, delta, epsilon, a_alpha):
+        r'''
+        Return the smallest and largest non-negative real volume solutions,
+        and the number of non-negative real volume solutions of the cubic EOS 
+        at arrays of `T` and `P`. The largest root is solved in closed form 
+        with real arithmetic (Cardano's formula for one real root and the 
+        trigonometric method for three) and the other roots are given by 
+        Vieta's formulas. All roots are polished with Newton steps.
+        
+        Parameters
+        ----------
+        T : ndarray
+            Temperatures, [K]
+        P : ndarray
+            Pressures, [Pa]
+        b : float
+            Coefficient calculated by EOS-specific method, [m^3/mol]
+        delta : float
+            Coefficient calculated by EOS-specific method, [m^3/mol]
+        epsilon : float
+            Coefficient calculated by EOS-specific method, [m^6/mol^2]
+        a_alpha : ndarray
+            Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+        
+        Returns
+        -------
+        V_min : ndarray
+            Smallest non-negative real volume solutions, [m^3/mol]
+        V_max : ndarray
+            Largest non-negative real volume solutions, [m^3/mol]
+        N : ndarray
+            Number of non-negative real volume solutions.
+        
+        Notes
+        -----
+        Volumes are nan where there are no non-negative real solutions.
+        
+        '''
+        RT_P = R*T/P
+        a_alpha_P = a_alpha/P
+        c2 = delta - b - RT_P
+        c1 = epsilon - b*delta - RT_P*delta + a_alpha_P
+        c0 = -(b + RT_P)*epsilon - a_alpha_P*b
+        shift = c2/3.
+        p = c1 - c2*shift
+        q = (2./27.)*c2*c2*c2 - c1*shift + c0
+        half_q = 0.5*q
+        D = half_q*half_q + p*p*p/27.
+        one_root = D > 0.
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # Largest real root (Cardano's formula for one real root and the
+            # trigonometric method for three)
+            sqrt_D = np.sqrt(np.where(one_root, D, 0.))
+            t = np.cbrt(-half_q + sqrt_D) + np.cbrt(-half_q - sqrt_D)
+            m = np.sqrt(np.where(one_root, 0., -p/3.))
+            cos_arg = np.where(one_root | (m == 0.), 0., half_q/(-m*m*m))
+            phi = np.arccos(np.clip(cos_arg, -1., 1.))/3.
+            V_max = np.where(one_root, t, 2.*m*np.cos(phi)) - shift
+            # Newton step to polish root
+            f = ((V_max + c2)*V_max + c1)*V_max + c0
+            df = (3.*V_max + 2.*c2)*V_max + c1
+            V_max = np.where(df != 0., V_max - f/df, V_max)
+            # The other roots are given by Vieta's formulas, which avoid the 
+            # loss of precision of the cubic coefficients at low pressures
+            product = -c0/V_max
+            total = (c1 - product)/V_max
+            discriminant = total*total - 4.*product
+            two_roots = discriminant >= 0.
+            half_sum = 0.5*(total + np.copysign(np.sqrt(np.where(two_roots, discriminant, 0.)), total))
+            roots = np.array([V_max, half_sum, product/half_sum])
+            # Roots are also polished with the pressure explicit form
+            RT = R*T
+            for i in range(2):
+                x0 = roots - b
+                x1 = roots*roots + delta*roots + epsilon
+                f = RT/x0 - a_alpha/x1 - P
+                df = a_alpha*(2.*roots + delta)/(x1*x1) - RT/(x0*x0)
+                polished = roots - f/df
+                roots = np.where((polished > b) & (df < 0.), polished, roots)
+        roots[1:, ~two_roots] = np.nan
+        roots[roots < 0.] = np.nan
+        N = (~np.isnan(roots)).sum(0)
+        with np.errstate(invalid='ignore'): # All nan slices return nan
+            return np.fmin.reduce(roots, 0), np.fmax.reduce(roots, 0), N
+    
+    @staticmethod
+    def main_derivatives_and_departures_array(T, P, V, b, delta, epsilon, a_alpha,
+                                              da_alpha_dT, d2a_alpha_dT2):
+        r'''
+        Array version of `main_derivatives_and_departures` using only real 
+        arithmetic. Requires `delta`**2 - 4`epsilon` > 0, which holds for 
+        the PR and SRK families of EOSs.
+        
+        '''
+        x0 = V - b
+        x1 = V*V + V*delta + epsilon
+        x3 = R*T
+        x4 = 1./(x0*x0)
+        x5 = 2.*V + delta
+        x6 = 1./(x1*x1)
+        x7 = a_alpha*x6
+        x8 = P*V
+        x9 = delta*delta
+        x10 = -4.*epsilon + x9
+        x13 = x10**-0.5
+        x11 = x13*x5
+        x12 = x13*np.log(np.abs((1. + x11)/(1. - x11))) # Real part of 2*atanh(x11)*x13
+        x14 = V + delta*0.5
+        x15 = 2.*epsilon*x13
+        x16 = x13*x9*0.5
+        dP_dT = R/x0 - da_alpha_dT/x1
+        dP_dV = -x3*x4 + x5*x7
+        d2P_dT2 = -d2a_alpha_dT2/x1
+        d2P_dV2 = -2.*a_alpha*x5*x5*x6/x1 + 2.*x7 + 2.*x3*x4/x0
+        d2P_dTdV = -R*x4 + da_alpha_dT*x5*x6
+        H_dep = x12*(T*da_alpha_dT - a_alpha) - x3 + x8
+        S_dep = -R*np.log(np.abs(V*x3/(x0*x8))) + da_alpha_dT*x12
+        Cv_dep = T*d2a_alpha_dT2*x13*np.log(np.abs((x14 - x15 + x16)/(x14 + x15 - x16)))
+        return [dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep]
+    
+    def phase_volume_and_derivatives_array(self, T, P, phase):
+        '''Return molar volumes of the given phase at arrays of `T` and `P`
+        along with the output of `main_derivatives_and_departures_array`.'''
+        T, P = np.broadcast_arrays(np.asarray(T, dtype=float), 
+                                   np.asarray(P, dtype=float))
+        a_alpha, da_alpha_dT, d2a_alpha_dT2 = self.a_alpha_and_derivatives_array(T)
+        V_min, V_max, N = self.volume_solutions_array(T, P, self.b, self.delta, self.epsilon, a_alpha)
+        if phase == 'l':
+            V = V_min
+        elif phase == 'g':
+            V = V_max
+        else:
+            raise ValueError(f"phase must be either 'l' or 'g', not {repr(phase)}")
+        with np.errstate(invalid='ignore', divide='ignore'):
+            values = self.main_derivatives_and_departures_array(
+                T, P, V, self.b, self.delta, self.epsilon, a_alpha, da_alpha_dT, d2a_alpha_dT2
+            )
+            dP_dT, dP_dV, _, d2P_dV2, d2P_dTdV, *_ = values
+            PIP = V*(d2P_dTdV/dP_dT - d2P_dV2/dP_dV)
+        # Phase of single solutions is determined by the phase identification parameter
+        mismatch = (N == 1) & ((PIP > 1) if phase == 'g' else (PIP <= 1))
+        if mismatch.any():
+            V = V.copy()
+            V[mismatch] = np.nan
+            values = [np.where(mismatch, np.nan, i) for i in values]
+        return V, values
+    
+    def volume_array(self, T, P, phase):
+        r'''
+        Return molar volumes of the given phase at arrays of `T` and `P`.
+        The same volume solutions as in `volume` are selected, but all 
+        cubic equations are solved at once. Volumes are nan where there is 
+        no volume solution for the phase.
+        
+        Parameters
+        ----------
+        T : array_like
+            Temperatures, [K]
+        P : array_like
+            Pressures, [Pa]
+        phase : str
+            'l' for liquid or 'g' for gas.
+        
+        Examples
+        --------
+        >>> import numpy as np
+        >>> eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
+        >>> V = eos.volume_array([299., 400., 500.], 1E6, 'l') # No liquid at 500 K
+        >>> V[2]
+        nan
+        >>> np.allclose(V[:2], [eos.volume(299., 1E6, 'l'), eos.volume(400., 1E6, 'l')])
+        True
+        
+        '''
+        return self.phase_volume_and_derivatives_array(T, P, phase)[0]
+    
+    def departures_array(self, T, P, phase):
+        r'''
+        Return enthalpy and entropy departures of the given phase at arrays
+        of `T` and `P`. Departures are nan where there is no volume solution 
+        for the phase.
+        
+        Parameters
+        ----------
+        T : array_like
+            Temperatures, [K]
+        P : array_like
+            Pressures, [Pa]
+        phase : str
+            'l' for liquid or 'g' for gas.
+        
+        Returns
+        -------
+        H_dep : ndarray
+            Enthalpy departures, [J/mol]
+        S_dep : ndarray
+            Entropy departures, [J/mol/K]
+        
+        Examples
+        --------
+        >>> import numpy as np
+        >>> eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
+        >>> H_dep, S_dep = eos.departures_array([400., 500.], [1E5, 2E6], 'g')
+        >>> H_dep
+        array([ -250.648, -4574.741])
+        >>> np.allclose(H_dep, [eos.H_dep(400., 1E5, 'g'), eos.H_dep(500., 2E6, 'g')])
+        True
+        
+        '''
+        *_, H_dep, S_dep, _ = self.phase_volume_and_derivatives_array(T, P, phase)[1]
+        return H_dep, S_dep
+    
     def Psat(self, T, polish=False):
         r'''Generic method to calculate vapor pressure for a specified `T`.
         
@@ -631,7 +1195,8 @@ class GCEOS:
         
         If `polish` is True, SciPy's `newton` solver is launched with the 
         calculated vapor pressure as an initial guess in an attempt to get more
-        accuracy. This may not converge however.
+        accuracy. This may not converge however. For repeated evaluations of
+        the solution with equal fugacities, see `tabulate_saturation`.
         
         Results above the critical temperature are meaningless. A first-order 
         polynomial is used to extrapolate under 0.32 Tc; however, there is 
@@ -644,7 +1209,7 @@ class GCEOS:
             Temperature, [K]
         polish : bool, optional
             Whether to attempt to use a numerical solver to make the solution
-            more precise or not
+            more precise or not. Defaults to False.
         
         Returns
         -------
@@ -672,7 +1237,7 @@ class GCEOS:
         Tr = T/self.Tc
         x = alpha/Tr - 1.
         c = self.Psat_coeffs_limiting if Tr < 0.32 else self.Psat_coeffs
-        y = horner(c, x)
+        y = horner(x, c)
         try:
             Psat = exp(y)*Tr*self.Pc
         except OverflowError:
@@ -690,6 +1255,41 @@ class GCEOS:
             Psat = newton(to_solve, Psat)
         return Psat
 
+    def Psat_array(self, T):
+        r'''
+        Return vapor pressures at an array of temperatures using the same 
+        polynomials as `Psat` (without polishing).
+        
+        Parameters
+        ----------
+        T : array_like
+            Temperatures, [K]
+        
+        Returns
+        -------
+        Psat : ndarray
+            Vapor pressures, [Pa]
+        
+        Examples
+        --------
+        >>> import numpy as np
+        >>> eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
+        >>> np.allclose(eos.Psat_array([100., 300., 400.]), [eos.Psat(100.), eos.Psat(300.), eos.Psat(400.)])
+        True
+        
+        '''
+        T = np.asarray(T, dtype=float)
+        alpha = self.a_alpha_and_derivatives_array(T)[0]/self.a
+        Tr = T/self.Tc
+        x = alpha/Tr - 1.
+        y = np.where(Tr < 0.32,
+                     horner(x, self.Psat_coeffs_limiting),
+                     horner(x, self.Psat_coeffs))
+        with np.errstate(over='ignore'):
+            Psat = np.exp(y)*Tr*self.Pc
+        Psat[np.isinf(Psat)] = 0.
+        return Psat
+
     def dPsat_dT(self, T):
         r'''Generic method to calculate the temperature derivative of vapor 
         pressure for a specified `T`. Implements the analytical derivative
@@ -836,9 +1436,70 @@ class GCEOS:
         
     
 
+    def tabulate_saturation(self, Tmin=None, Tmax=None, tol=1e-6):
+        r'''
+        Precompute a table of saturation properties (see `SaturationTable`)
+        and set it as the `saturation_table` attribute. The table interpolates
+        the vapor pressure (solved for equal fugacities as in `Psat` with 
+        `polish=True`), its temperature derivative, the saturated volumes, 
+        and the heat of vaporization; the methods of the EOS object itself 
+        are not affected. Tables are shared by all EOS objects with the same 
+        parameters (so rebuilt EOS objects reuse them). If 
+        `thermosteam.settings.chemical_cache_directory` is set, tables are 
+        also loaded from (or saved to) the directory.
+        
+        Parameters
+        ----------
+        Tmin : float, optional
+            Minimum temperature [K]. Defaults to 0.32 Tc (where the vapor 
+            pressure polynomial switches).
+        Tmax : float, optional
+            Maximum temperature [K]. Defaults to 0.999 Tc.
+        tol : float, optional
+            Relative tolerance of interpolated values. Defaults to 1e-6.
+        
+        Returns
+        -------
+        table : SaturationTable
+        
+        Examples
+        --------
+        >>> eos = PR(Tc=507.6, Pc=3025000, omega=0.2975, T=299., P=1E6)
+        >>> table = eos.tabulate_saturation()
+        >>> table
+        <SaturationTable: 162.43 to 507.09 K, tol=1e-06>
+        >>> Psat = table.Psat(300.) # Interpolated
+        >>> abs(Psat / eos.Psat(300., polish=True) - 1.) < 1e-6
+        True
+        >>> eos.to_TP(350., 1e5).tabulate_saturation() is eos.saturation_table
+        True
+        
+        '''
+        from ._settings import settings
+        if Tmin is None: Tmin = 0.32 * self.Tc
+        if Tmax is None: Tmax = 0.999 * self.Tc
+        key = (f"{type(self).__module__}.{type(self).__qualname__}",
+               self.Tc, self.Pc, self.omega, tuple(sorted(self.kwargs.items())),
+               Tmin, Tmax, tol)
+        table = saturation_tables.get(key)
+        if table is None:
+            directory = settings.chemical_cache_directory
+            if directory:
+                table = load_cached(directory, 'saturation_tables', key)
+                if not isinstance(table, SaturationTable):
+                    table = SaturationTable(self, Tmin, Tmax, tol)
+                    dump_cached(directory, 'saturation_tables', key, table)
+            else:
+                table = SaturationTable(self, Tmin, Tmax, tol)
+            saturation_tables[key] = table
+        self.saturation_table = table
+        return table
+    
     def to_TP(self, T, P):
         if T != self.T or P != self.P:
-            return self.__class__(T=T, P=P, Tc=self.Tc, Pc=self.Pc, omega=self.omega, **self.kwargs)
+            new = self.__class__(T=T, P=P, Tc=self.Tc, Pc=self.Pc, omega=self.omega, **self.kwargs)
+            new.saturation_table = self.saturation_table
+            return new
         else:
             return self
 
@@ -1588,6 +2249,8 @@ class PR(GCEOS):
                    -0.00013358770454510461]
     Psat_coeffs_limiting = [-3.4758880164801873, 0.7675486448347723]
 
+    vectorized_a_alpha = True
+
     def __init__(self, Tc, Pc, omega, T=None, P=None, V=None):
         self.Tc = Tc
         self.Pc = Pc
@@ -2101,6 +2764,8 @@ class PRSV2(PR):
        Chemical Engineering 64, no. 5 (October 1, 1986): 820-26. 
        doi:10.1002/cjce.5450640516. 
     '''
+    vectorized_a_alpha = False
+
     def __init__(self, Tc, Pc, omega, T=None, P=None, V=None, kappa1=0, kappa2=0, kappa3=0):
         self.Tc = Tc
         self.Pc = Pc
@@ -2306,6 +2971,8 @@ class VDW(GCEOS):
     Psat_coeffs_limiting = [-3.0232164484175756, 0.20980668241160666]
     
     
+    vectorized_a_alpha = True
+
     def __init__(self, Tc, Pc, T=None, P=None, V=None, omega=None):
         self.Tc = Tc
         self.Pc = Pc
@@ -2396,6 +3063,21 @@ class VDW(GCEOS):
         S_dep = R*(-log(V) + log(V - b)) + R*log(P*V/(R*T))
         Cv_dep = 0
         return [dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep]
+    
+    @staticmethod
+    def main_derivatives_and_departures_array(T, P, V, b, delta, epsilon, a_alpha,
+                                              da_alpha_dT, d2a_alpha_dT2):
+        '''Array version of `main_derivatives_and_departures`.'''
+        x0 = V - b
+        dP_dT = R/x0
+        dP_dV = -R*T/(x0*x0) + 2*a_alpha/V**3
+        d2P_dT2 = np.zeros_like(V)
+        d2P_dV2 = 2*(R*T/x0**3 - 3*a_alpha/V**4)
+        d2P_dTdV = -R/(x0*x0)
+        H_dep = P*V - R*T - a_alpha/V
+        S_dep = R*(np.log(x0/V) + np.log(P*V/(R*T)))
+        Cv_dep = np.zeros_like(V)
+        return [dP_dT, dP_dV, d2P_dT2, d2P_dV2, d2P_dTdV, H_dep, S_dep, Cv_dep]
 
         
 
@@ -2470,6 +3152,8 @@ class RK(GCEOS):
                    3188268.8928488772, 1083057.9018650202, 142620.21200653521]
     Psat_coeffs_limiting = [-72.700288369511583, -68.76714163049]
 
+    vectorized_a_alpha = True
+
     def __init__(self, Tc, Pc, T=None, P=None, V=None, omega=None):
         self.Tc = Tc
         self.Pc = Pc
@@ -2620,6 +3304,8 @@ class SRK(GCEOS):
                    -3.6895279306603668e-05]
     Psat_coeffs_limiting = [-3.2308843103522107, 0.7210534170705403]
 
+    vectorized_a_alpha = True
+
     def __init__(self, Tc, Pc, omega, T=None, P=None, V=None):
         self.Tc = Tc
         self.Pc = Pc
@@ -2977,6 +3663,8 @@ class TWUPR(PR):
        Peng-Robinson Equation." Fluid Phase Equilibria 105, no. 1 (March 15, 
        1995): 49-59. doi:10.1016/0378-3812(94)02601-V.
     '''
+    vectorized_a_alpha = False
+
     def __init__(self, Tc, Pc, omega, T=None, P=None, V=None):
         self.Tc = Tc
         self.Pc = Pc
@@ -3182,6 +3870,8 @@ class TWUSRK(SRK):
        Redlich-Kwong Equation." Fluid Phase Equilibria 105, no. 1 (March 15, 
        1995): 61-69. doi:10.1016/0378-3812(94)02602-W.
     '''
+    vectorized_a_alpha = False
+
     def __init__(self, Tc, Pc, omega, T=None, P=None, V=None):
         self.Tc = Tc
         self.Pc = Pc
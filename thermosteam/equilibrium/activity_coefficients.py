@@ -18,6 +18,7 @@
 import numpy as np
 from .unifac import DOUFSG, DOUFIP2016, UFIP, UFSG
 from flexsolve import njitable
+from ..utils import fill_like, same_objects
 
 __all__ = ('ActivityCoefficients',
            'IdealActivityCoefficients',
@@ -155,14 +156,21 @@ class GroupActivityCoefficients(ActivityCoefficients):
     
     """
     __slots__ = ('_rs', '_qs', '_Qs','_chemgroups',
-                 '_group_psis',  '_chem_Qfractions',
+                 '_chem_Qfractions',
                  '_group_mask', '_interactions',
                  '_chemicals')
     
     def __new__(cls, chemicals):
         chemicals = tuple(chemicals)
-        if chemicals in cls._cached:
-            return cls._cached[chemicals]
+        key = tuple([i.fingerprint for i in chemicals])
+        cached = cls._cached
+        if key in cached:
+            other = cached[key]
+            if same_objects(other._chemicals, chemicals): return other
+            self = super().__new__(cls)
+            fill_like(self, other, GroupActivityCoefficients.__slots__)
+            self._chemicals = chemicals
+            return self
         else:
             self = super().__new__(cls)
         chemgroups = get_chemgroups(chemicals, self.group_name)
@@ -188,8 +196,6 @@ class GroupActivityCoefficients(ActivityCoefficients):
             [[get_interaction(all_interactions, i, j, no_interaction)
               for i in main_group_ids]
              for j in main_group_ids])
-        # Psis array with only symmetrically available groups
-        self._group_psis = np.zeros(group_shape, dtype=float)
         # Make mask for retrieving symmetrically available groups
         rowindex = np.arange(N_groups, dtype=int)
         indices = [rowindex[rowmask] for rowmask in cQfs != 0]
@@ -197,9 +203,9 @@ class GroupActivityCoefficients(ActivityCoefficients):
         for index in indices:
             for i in index:
                 group_mask[i, index] = True
-        self._cached[chemicals] = self
         self._chemicals = chemicals
-        return self
+        # Objects created concurrently by other threads take precedence
+        return cached.setdefault(key, self)
     
     def __reduce__(self):
         return type(self), (self.chemicals,)
@@ -217,12 +223,13 @@ class GroupActivityCoefficients(ActivityCoefficients):
         """
         x = np.asarray(x)
         psis = self.psi(T, self._interactions.copy())
-        self._group_psis[self._group_mask] =  psis[self._group_mask]
+        # Psis array with only symmetrically available groups
+        group_psis = np.where(self._group_mask, psis, 0.)
         gamma =  group_activity_coefficients(x, self._chemgroups,
                                              self.loggammacs(self._qs, self._rs, x),
                                              self._Qs, psis,
                                              self._chem_Qfractions,
-                                             self._group_psis)
+                                             group_psis)
         gamma[np.isnan(gamma)] = 1
         return gamma
     
@@ -12,7 +12,7 @@ import flexsolve as flx
 from ..exceptions import InfeasibleRegion, DomainError
 from .solve_vle_composition import solve_y
 from .. import functional as fn
-from ..utils import fill_like, Cache
+from ..utils import fill_like, same_objects, Cache
 from .._settings import settings
 
 __all__ = ('BubblePoint', 'BubblePointValues', 'BubblePointCache')
@@ -71,11 +71,16 @@ class BubblePoint:
     def __init__(self, chemicals=(), thermo=None):
         thermo = settings.get_default_thermo(thermo)
         chemicals = tuple(chemicals)
-        key = (chemicals, thermo.Gamma, thermo.Phi, thermo.PCF)
+        # Chemical fingerprints are memoized, so keys are cheap after the first call
+        key = (tuple([i.fingerprint for i in chemicals]),
+               thermo.Gamma, thermo.Phi, thermo.PCF)
         cached = self._cached
         if key in cached:
             other = cached[key]
             fill_like(self, other, self.__slots__)
+            if not same_objects(other.chemicals, chemicals):
+                self.chemicals = chemicals
+                self.Psats = [i.Psat for i in chemicals]
         else:
             self.IDs = tuple([i.ID for i in chemicals])
             self.gamma = thermo.Gamma(chemicals)
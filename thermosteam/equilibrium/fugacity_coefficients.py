@@ -7,8 +7,121 @@
 # for license details.
 """
 """
-__all__ = ('FugacityCoefficients', 
-           'IdealFugacityCoefficients')
+import numpy as np
+from flexsolve import njitable
+from .._constants import R
+from ..eos import PR, SRK
+
+__all__ = ('InteractionParameters',
+           'FugacityCoefficients', 
+           'IdealFugacityCoefficients',
+           'CubicEOSFugacityCoefficients',
+           'PRFugacityCoefficients',
+           'SRKFugacityCoefficients')
+
+# %% Utilities
+
+@njitable(cache=True)
+def largest_cubic_root(c2, c1, c0):
+    # Largest real root of x**3 + c2*x**2 + c1*x + c0
+    shift = c2 / 3.
+    p = c1 - c2 * shift
+    q = 2. * shift * shift * shift - c1 * shift + c0
+    D = 0.25 * q * q + p * p * p / 27.
+    if D > 0.:
+        sqrt_D = D ** 0.5
+        x = np.cbrt(-0.5 * q + sqrt_D) + np.cbrt(-0.5 * q - sqrt_D) - shift
+    elif p == 0.:
+        x = -shift
+    else:
+        m = (-p / 3.) ** 0.5
+        cos_arg = min(max(0.5 * q / (-m * m * m), -1.), 1.)
+        x = 2. * m * np.cos(np.arccos(cos_arg) / 3.) - shift
+    f = ((x + c2) * x + c1) * x + c0
+    df = (3. * x + 2. * c2) * x + c1
+    if df != 0.: x -= f / df
+    return x
+
+@njitable(cache=True)
+def cubic_eos_ln_fugacity_coefficients(y, a, b, T, P, u, w):
+    # Gas fugacity coefficients of a cubic EOS with van der Waals mixing rules
+    a_y = a @ y
+    a_mix = (y * a_y).sum()
+    b_mix = (y * b).sum()
+    RT = R * T
+    A = a_mix * P / (RT * RT)
+    B = b_mix * P / RT
+    Z = largest_cubic_root(
+        (u - 1.) * B - 1.,
+        A + w * B * B - u * B - u * B * B,
+        -(A * B + w * B * B + w * B * B * B),
+    )
+    d = (u * u - 4. * w) ** 0.5
+    b_ratio = b / b_mix
+    log_term = np.log((2. * Z + B * (u + d)) / (2. * Z + B * (u - d)))
+    return (b_ratio * (Z - 1.) - np.log(Z - B)
+            - A / (B * d) * (2. * a_y / a_mix - b_ratio) * log_term)
+
+
+class InteractionParameters(dict):
+    """
+    Create an InteractionParameters object, a dictionary of binary 
+    interaction parameters by pairs of chemical IDs that counts its 
+    modifications (so that users can check for changes without comparing 
+    all items).
+    
+    Examples
+    --------
+    >>> from thermosteam.equilibrium import InteractionParameters
+    >>> kijs = InteractionParameters({('CO2', 'H2'): -0.1622})
+    >>> kijs.version
+    0
+    >>> kijs['CO2', 'Propane'] = 0.135
+    >>> kijs.version
+    1
+    
+    """
+    __slots__ = ('version',)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+        
+    def __ior__(self, other):
+        self.update(other)
+        return self
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+    
+    def setdefault(self, key, default=None):
+        if key not in self: self.version += 1
+        return super().setdefault(key, default)
+    
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+    
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+    
+    def clear(self):
+        super().clear()
+        self.version += 1
+    
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
 
 class FugacityCoefficients:
     """
@@ -53,6 +166,212 @@ class IdealFugacityCoefficients(FugacityCoefficients):
     def __call__(self, y, T, P):
         return 1.
 
+
+class CubicEOSFugacityCoefficients(FugacityCoefficients):
+    """
+    Abstract class for the estimation of gas fugacity coefficients with a
+    cubic equation of state and van der Waals mixing rules. Non-abstract
+    subclasses should define the pure component EOS class `EOS` (which 
+    provides the `c1` and `c2` coefficients), the parameters `u` and `w` 
+    of the cubic EOS (i.e. `delta = u * b` and `epsilon = w * b ** 2`), 
+    and a `kappa(omega)` static method for the alpha function
+    (i.e. `alpha = (1 + kappa * (1 - Tr ** 0.5)) ** 2`).
+    
+    Parameters
+    ----------
+    chemicals : Iterable[Chemical]
+    kijs : dict[tuple[str, str], float], optional
+        Binary interaction parameters by pairs of chemical IDs. Defaults to
+        the interaction parameters of the class, `interaction_parameters`.
+    
+    Notes
+    -----
+    Binary interaction parameters are read at call time, so changes to the 
+    interaction parameters of the class apply to all existing objects, 
+    including those created by `Thermo` objects 
+    (e.g. `Thermo(chemicals, Phi=PRFugacityCoefficients)`). Given 
+    parameters are copied into an InteractionParameters object, which 
+    counts its modifications; the matrix of (1 - kij) values is only 
+    rebuilt when the parameters in use are replaced or modified.
+    
+    """
+    __slots__ = ('_chemicals', '_kijs', 'b', 'one_minus_kijs', 
+                 'sqrt_a', 'sqrt_Tcs', 'kappas', '_kijs_state', '_T_a')
+    EOS = None
+    u = w = None
+    
+    def __init_subclass__(cls):
+        cls.interaction_parameters = InteractionParameters()
+    
+    def __init__(self, chemicals, kijs=None):
+        self.chemicals = chemicals
+        chemicals = self._chemicals
+        for i in chemicals:
+            if not (i.Tc and i.Pc and i.omega is not None):
+                raise RuntimeError(f"{i} has no defined critical temperature, "
+                                    "critical pressure, or acentric factor")
+        Tcs = np.array([i.Tc for i in chemicals])
+        Pcs = np.array([i.Pc for i in chemicals])
+        omegas = np.array([i.omega for i in chemicals])
+        EOS = self.EOS
+        self.sqrt_a = (EOS.c1 * R * R * Tcs * Tcs / Pcs) ** 0.5
+        self.b = EOS.c2 * R * Tcs / Pcs
+        self.kappas = self.kappa(omegas)
+        self.sqrt_Tcs = Tcs ** 0.5
+        self.kijs = kijs
+        self._kijs_state = (None, None, None)
+        self.update_interaction_parameters()
+    
+    @property
+    def kijs(self):
+        """[InteractionParameters or None] Binary interaction parameters 
+        by pairs of chemical IDs (None to use the interaction parameters
+        of the class)."""
+        return self._kijs
+    @kijs.setter
+    def kijs(self, kijs):
+        self._kijs = None if kijs is None else InteractionParameters(kijs)
+    
+    @property
+    def interaction_parameters_in_use(self):
+        """dict[tuple[str, str], float] Binary interaction parameters in use
+        (the interaction parameters of the class if none were given)."""
+        kijs = self.kijs
+        return self.interaction_parameters if kijs is None else kijs
+    
+    def update_interaction_parameters(self):
+        """Update the matrix of (1 - kij) values if binary interaction 
+        parameters changed."""
+        kijs = self.interaction_parameters_in_use
+        last, version, values = self._kijs_state
+        if kijs is last:
+            if isinstance(kijs, InteractionParameters):
+                if kijs.version == version: return
+            elif kijs == values: # Modifications are not counted
+                return
+        IDs = [i.ID for i in self._chemicals]
+        N = len(IDs)
+        one_minus_kijs = np.ones([N, N])
+        for i in range(N):
+            for j in range(N):
+                if i == j: continue
+                key = (IDs[i], IDs[j])
+                if key not in kijs: key = key[::-1]
+                if key in kijs: one_minus_kijs[i, j] = 1. - kijs[key]
+        self.one_minus_kijs = one_minus_kijs
+        self._kijs_state = (kijs, getattr(kijs, 'version', None), dict(kijs))
+        self._T_a = (None, None)
+    
+    @property
+    def chemicals(self):
+        """tuple[Chemical] All chemicals involved in the calculation of fugacity coefficients."""
+        return self._chemicals
+    @chemicals.setter
+    def chemicals(self, chemicals):
+        self._chemicals = tuple(chemicals)
+    
+    def a_matrix(self, T):
+        """Return the matrix of a_ij coefficients [J^2/mol^2/Pa] at given 
+        temperature (cached for the last temperature)."""
+        self.update_interaction_parameters()
+        T_last, a = self._T_a # Temperature and matrix are stored together for thread safety
+        if T != T_last:
+            sqrt_a_alphas = self.sqrt_a * (1. + self.kappas * (1. - T ** 0.5 / self.sqrt_Tcs))
+            a = self.one_minus_kijs * np.outer(sqrt_a_alphas, sqrt_a_alphas)
+            self._T_a = (T, a)
+        return a
+    
+    def __call__(self, y, T, P):
+        return np.exp(cubic_eos_ln_fugacity_coefficients(
+            np.asarray(y, dtype=float), self.a_matrix(T), self.b, T, P, self.u, self.w
+        ))
+
+
+class PRFugacityCoefficients(CubicEOSFugacityCoefficients):
+    """
+    Create a PRFugacityCoefficients object that estimates gas fugacity 
+    coefficients with the Peng-Robinson equation of state when called with 
+    composition, temperature (K), and pressure (Pa).
+    
+    Parameters
+    ----------
+    chemicals : Iterable[Chemical]
+    kijs : dict[tuple[str, str], float], optional
+        Binary interaction parameters by pairs of chemical IDs. Defaults to
+        the interaction parameters of the class, `interaction_parameters`.
+    
+    Examples
+    --------
+    >>> import thermosteam as tmo
+    >>> chemicals = tmo.Chemicals(['CO2', 'H2'], cache=True)
+    >>> phi = tmo.equilibrium.PRFugacityCoefficients(chemicals, kijs={('CO2', 'H2'): -0.1622})
+    >>> phi([0.5, 0.5], 300., 5e6)
+    array([0.795, 1.061])
+    
+    Flash a pressurized gas with a Thermo object (binary interaction 
+    parameters may be set by a subclass):
+    
+    >>> eq = tmo.equilibrium
+    >>> class PRFugacityCoefficientsCO2Propane(eq.PRFugacityCoefficients):
+    ...     __slots__ = ()
+    ...     def __init__(self, chemicals, kijs={('CO2', 'Propane'): 0.135}):
+    ...         super().__init__(chemicals, kijs)
+    >>> thermo = tmo.Thermo(['CO2', 'Propane', 'Water'], 
+    ...                     Gamma=eq.IdealActivityCoefficients,
+    ...                     Phi=PRFugacityCoefficientsCO2Propane, cache=True)
+    >>> tmo.settings.set_thermo(thermo)
+    >>> s = tmo.Stream('s', CO2=1, Propane=1, Water=1)
+    >>> s.vle(T=300, P=3e6)
+    >>> s.show(composition=True)
+    MultiStream: s
+     phases: ('g', 'l'), T: 300 K, P: 3e+06 Pa
+     composition: (g) CO2      0.8325
+                      Propane  0.1668
+                      Water    0.0006634
+                      -------  0.0979 kmol/hr
+                  (l) CO2      0.3165
+                      Propane  0.339
+                      Water    0.3446
+                      -------  2.9 kmol/hr
+    
+    """
+    __slots__ = ()
+    EOS = PR
+    u = 2.
+    w = -1.
+    
+    @staticmethod
+    def kappa(omega):
+        return 0.37464 + 1.54226*omega - 0.26992*omega*omega
+
+
+class SRKFugacityCoefficients(CubicEOSFugacityCoefficients):
+    """
+    Create a SRKFugacityCoefficients object that estimates gas fugacity 
+    coefficients with the Soave-Redlich-Kwong equation of state when called
+    with composition, temperature (K), and pressure (Pa).
     
+    Parameters
+    ----------
+    chemicals : Iterable[Chemical]
+    kijs : dict[tuple[str, str], float], optional
+        Binary interaction parameters by pairs of chemical IDs. Defaults to
+        the interaction parameters of the class, `interaction_parameters`.
+    
+    Examples
+    --------
+    >>> import thermosteam as tmo
+    >>> chemicals = tmo.Chemicals(['CO2', 'H2'], cache=True)
+    >>> phi = tmo.equilibrium.SRKFugacityCoefficients(chemicals)
+    >>> phi([0.5, 0.5], 300., 5e6)
+    array([0.824, 1.083])
     
+    """
+    __slots__ = ()
+    EOS = SRK
+    u = 1.
+    w = 0.
     
+    @staticmethod
+    def kappa(omega):
+        return 0.480 + 1.574*omega - 0.176*omega*omega
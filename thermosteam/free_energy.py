@@ -141,7 +141,7 @@ def Excess_Liquid_Enthalpy_Ref_Liquid(T, P):
 def Excess_Liquid_Enthalpy_Ref_Gas(T, P, eos, H_dep_Tb_Pb_g,
                                    H_dep_Tb_P_ref_g, eos_1atm):
     return (H_dep_Tb_Pb_g - H_dep_Tb_P_ref_g
-            + eos.to_TP(T, P).H_dep_l - eos_1atm.H_dep_l)
+            + eos.H_dep(T, P, 'l') - eos_1atm.H_dep_l)
     
 @functor(var='H.l')
 def Excess_Liquid_Enthalpy_Ref_Solid(T, P):
@@ -161,12 +161,12 @@ def Excess_Solid_Enthalpy_Ref_Gas(T, P):
     
 @functor(var='H.g')
 def Excess_Gas_Enthalpy_Ref_Gas(T, P, eos, H_dep_ref_g):
-    return eos.to_TP(T, P).H_dep_g - H_dep_ref_g
+    return eos.H_dep(T, P, 'g') - H_dep_ref_g
 
 @functor(var='H.g')
 def Excess_Gas_Enthalpy_Ref_Liquid(T, P, eos, H_dep_T_ref_Pb,
                                    H_dep_ref_l, H_dep_Tb_Pb_g):
-    return H_dep_T_ref_Pb - H_dep_ref_l + eos.to_TP(T, P).H_dep_g - H_dep_Tb_Pb_g
+    return H_dep_T_ref_Pb - H_dep_ref_l + eos.H_dep(T, P, 'g') - H_dep_Tb_Pb_g
 
 @functor(var='H.g')
 def Excess_Gas_Enthalpy_Ref_Solid(T):
@@ -195,7 +195,7 @@ def Excess_Liquid_Entropy_Ref_Liquid(T, P):
 def Excess_Liquid_Entropy_Ref_Gas(T, P, eos, S_dep_Tb_Pb_g,
                                   S_dep_Tb_P_ref_g, eos_1atm):
     return (S_dep_Tb_Pb_g - S_dep_Tb_P_ref_g
-            + eos.to_TP(T, P).S_dep_l - eos_1atm.S_dep_l)
+            + eos.S_dep(T, P, 'l') - eos_1atm.S_dep_l)
     
 @functor(var='S.l')
 def Excess_Liquid_Entropy_Ref_Solid(T, P):
@@ -215,12 +215,12 @@ def Excess_Solid_Entropy_Ref_Gas(T, P):
     
 @functor(var='S.g')
 def Excess_Gas_Entropy_Ref_Gas(T, P, eos, S_dep_ref_g):
-    return eos.to_TP(T, P).S_dep_g - S_dep_ref_g
+    return eos.S_dep(T, P, 'g') - S_dep_ref_g
 
 @functor(var='S.g')
 def Excess_Gas_Entropy_Ref_Liquid(T, P, eos, S_dep_T_ref_Pb, 
                                   S_dep_ref_l, S_dep_Tb_Pb_g):
-    return S_dep_T_ref_Pb - S_dep_ref_l + eos.to_TP(T, P).S_dep_g - S_dep_Tb_Pb_g
+    return S_dep_T_ref_Pb - S_dep_ref_l + eos.S_dep(T, P, 'g') - S_dep_Tb_Pb_g
 
 @functor(var='S.g')
 def Excess_Gas_Entropy_Ref_Solid(T):
@@ -13,7 +13,14 @@ from flexsolve import njitable
 from thermosteam.base import functor
 import numpy as np
 
-@functor
+def dhorner_dT(T, coeffs):
+    tot = dtot = 0
+    for c in coeffs: 
+        dtot = dtot * T + tot
+        tot = tot * T + c
+    return dtot
+
+@functor(derivative_by_T=dhorner_dT)
 def horner(T, coeffs):
     tot = 0
     for c in coeffs: tot = tot * T + c
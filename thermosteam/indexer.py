@@ -12,7 +12,7 @@ from .units_of_measure import AbsoluteUnitsOfMeasure
 from . import utils
 from .exceptions import UndefinedPhase, UndefinedChemical
 from ._phase import Phase, LockedPhase, NoPhase
-from free_properties import PropertyFactory, property_array
+from numpy.lib.mixins import NDArrayOperatorsMixin
 import numpy as np
 
 __all__ = ('ChemicalIndexer',
@@ -23,8 +23,9 @@ __all__ = ('ChemicalIndexer',
            'MassFlowIndexer',
            'ChemicalVolumetricFlowIndexer',
            'VolumetricFlowIndexer',
-           'MassFlowProperty',
-           'VolumetricFlowProperty')
+           'FlowDataView',
+           'MassFlowData',
+           'VolumetricFlowData')
 
 # %% Utilities
 
@@ -138,10 +139,10 @@ class ChemicalIndexer(Indexer):
         return self.from_data, (self._data, self._phase, self._chemicals, False)
     
     def __getitem__(self, key):
-        return self._data[self.get_index(key)]
+        return self._data[self._chemicals.get_index(key)]
     
     def __setitem__(self, key, data):
-        self._data[self.get_index(key)] = data
+        self._data[self._chemicals.get_index(key)] = data
     
     def sum_across_phases(self):
         return self._data
@@ -305,7 +306,6 @@ class MaterialIndexer(Indexer):
     """
     __slots__ = ('_chemicals', '_phases', '_phase_index',
                  '_index_cache', '_data_cache')
-    _index_caches = {}
     _phase_index_cache = {}
     _ChemicalIndexer = ChemicalIndexer
     
@@ -405,12 +405,13 @@ class MaterialIndexer(Indexer):
             phase_index[...] = slice(None) 
             
     def _set_cache(self):
-        caches = self._index_caches
-        key = self._phases, self._chemicals
+        # Index caches are shared by all indexers with the same phases and chemicals
+        caches = self._chemicals._material_index_caches
+        phases = self._phases
         try:
-            self._index_cache = caches[key]
+            self._index_cache = caches[phases]
         except KeyError:
-            self._index_cache = caches[key] = {}
+            self._index_cache = caches[phases] = {}
     
     def _copy_without_data(self):
         new = _new(self.__class__)
@@ -466,8 +467,10 @@ class MaterialIndexer(Indexer):
         return material_indexer
     
     def get_phase(self, phase):
-        return self._ChemicalIndexer.from_data(self._data[self.get_phase_index(phase)],
-                                               LockedPhase(phase), self._chemicals, False)
+        index = self.get_phase_index(phase)
+        data = self._data
+        data = data.row(index, phase) if isa(data, FlowDataView) else data[index]
+        return self._ChemicalIndexer.from_data(data, LockedPhase(phase), self._chemicals, False)
     
     def __getitem__(self, key):
         index = self.get_index(key)
@@ -648,16 +651,177 @@ ChemicalMolarFlowIndexer, MolarFlowIndexer = _new_Indexer('MolarFlow', 'kmol/hr'
 ChemicalMassFlowIndexer, MassFlowIndexer = _new_Indexer('MassFlow', 'kg/hr')
 ChemicalVolumetricFlowIndexer, VolumetricFlowIndexer = _new_Indexer('VolumetricFlow', 'm^3/hr')
 
-# %% Mass flow properties
+# %% Flow data views
+
+class FlowDataView(NDArrayOperatorsMixin):
+    """
+    Abstract class for lazy, vectorized views of flow rate data. Values are
+    computed from molar data with array operations on demand and set values 
+    are written back to the molar data.
+    
+    """
+    __slots__ = ('mol',)
+    dtype = np.dtype(float)
+    
+    def to_array(self): # pragma: no cover
+        raise NotImplementedError('FlowDataView subclass must implement a `to_array` method')
+    
+    def row(self, index, phase): # pragma: no cover
+        raise NotImplementedError('FlowDataView subclass must implement a `row` method')
+    
+    def __array__(self, dtype=None, copy=None):
+        array = self.to_array()
+        return array if dtype is None else array.astype(dtype)
+    
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = [i.to_array() if isa(i, FlowDataView) else i for i in inputs]
+        out = kwargs.get('out')
+        if out:
+            kwargs['out'] = out_arrays = tuple([i.to_array() if isa(i, FlowDataView) else i 
+                                                for i in out])
+            getattr(ufunc, method)(*inputs, **kwargs)
+            for i, j in zip(out, out_arrays):
+                if isa(i, FlowDataView): i[...] = j
+            return out[0] if len(out) == 1 else out
+        else:
+            return getattr(ufunc, method)(*inputs, **kwargs)
+    
+    @property
+    def shape(self):
+        return self.mol.shape
+    @property
+    def ndim(self):
+        return self.mol.ndim
+    @property
+    def size(self):
+        return self.mol.size
+    
+    def __len__(self):
+        return self.mol.__len__()
+    
+    def __iter__(self):
+        return self.to_array().__iter__()
+    
+    def copy(self):
+        return self.to_array()
+    __copy__ = copy
+    
+    def sum(self, *args, **kwargs):
+        return self.to_array().sum(*args, **kwargs)
+    
+    def any(self, *args, **kwargs):
+        return self.to_array().any(*args, **kwargs)
+    
+    def all(self, *args, **kwargs):
+        return self.to_array().all(*args, **kwargs)
+    
+    def __repr__(self):
+        return type(self).__name__ + np.array_repr(self.to_array())[5:]
+
+
+class MassFlowData(FlowDataView):
+    """
+    Create a MassFlowData object that references molar data and computes
+    mass flow rates (kg/hr) as a vectorized view.
+    
+    Parameters
+    ----------
+    mol : ndarray
+        Molar flow rates [kmol/hr].
+    MW : 1d ndarray
+        Molecular weights of all chemicals [g/mol].
+    
+    """
+    __slots__ = ('MW',)
+    
+    def __init__(self, mol, MW):
+        self.mol = mol
+        self.MW = MW
+    
+    def to_array(self):
+        return self.mol * self.MW
+    
+    def row(self, index, phase):
+        """Return a MassFlowData object of the given row (phase) of 2d data."""
+        return MassFlowData(self.mol[index], self.MW)
+    
+    def __getitem__(self, index):
+        return self.mol[index] * np.broadcast_to(self.MW, self.mol.shape)[index]
+    
+    def __setitem__(self, index, value):
+        mol = self.mol
+        mol[index] = value / np.broadcast_to(self.MW, mol.shape)[index]
+    
 
-@PropertyFactory(slots=('name', 'mol', 'index', 'MW'))
-def MassFlowProperty(self):
-    """Mass flow (kg/hr)."""
-    return self.mol[self.index] * self.MW
-    
-@MassFlowProperty.setter
-def MassFlowProperty(self, value):
-    self.mol[self.index] = value/self.MW
+class VolumetricFlowData(FlowDataView):
+    """
+    Create a VolumetricFlowData object that references molar data and 
+    computes volumetric flow rates (m^3/hr) as a vectorized view. Molar 
+    volumes are only evaluated for the entries being accessed (and for 
+    nonzero flows when getting values).
+    
+    Parameters
+    ----------
+    mol : ndarray
+        Molar flow rates [kmol/hr].
+    chemicals : CompiledChemicals
+        Chemicals corresponding to molar data columns.
+    TP : ThermalCondition
+        Temperature and pressure.
+    phases : tuple[str] or Phase
+        Phases of molar data rows (2d data) or phase of molar data (1d data).
+    
+    """
+    __slots__ = ('chemicals', 'TP', 'phases')
+    
+    def __init__(self, mol, chemicals, TP, phases):
+        self.mol = mol
+        self.chemicals = chemicals
+        self.TP = TP
+        self.phases = phases
+    
+    def molar_volumes(self, mask):
+        """Return molar volumes [m^3/mol] evaluated at masked entries (zero elsewhere)."""
+        mol = self.mol
+        V = np.zeros(mol.shape)
+        if not mask.any(): return V
+        T, P = self.TP
+        chemicals = self.chemicals.tuple
+        if mol.ndim == 1:
+            phase = self.phases.phase
+            for i in np.flatnonzero(mask):
+                V[i] = molar_volume(chemicals[i], phase, T, P)
+        else:
+            phases = self.phases
+            for i, j in zip(*np.nonzero(mask)):
+                V[i, j] = molar_volume(chemicals[j], phases[i], T, P)
+        return V
+    
+    def to_array(self):
+        mol = self.mol
+        return 1000. * mol * self.molar_volumes(mol != 0.)
+    
+    def row(self, index, phase):
+        """Return a VolumetricFlowData object of the given row (phase) of 2d data."""
+        return VolumetricFlowData(self.mol[index], self.chemicals, self.TP, LockedPhase(phase))
+    
+    def __getitem__(self, index):
+        mol = self.mol
+        mask = np.zeros(mol.shape, bool)
+        mask[index] = True
+        mask &= mol != 0.
+        return 1000. * mol[index] * self.molar_volumes(mask)[index]
+    
+    def __setitem__(self, index, value):
+        mol = self.mol
+        mask = np.zeros(mol.shape, bool)
+        mask[index] = True
+        mol[index] = value / (1000. * self.molar_volumes(mask)[index])
+        
+def molar_volume(chemical, phase, T, P):
+    V = chemical.V
+    if hasattr(V, phase): V = getattr(V, phase)
+    return V(T, P)
 
 def by_mass(self):
     """Return a ChemicalMassFlowIndexer that references this object's molar data."""
@@ -665,14 +829,10 @@ def by_mass(self):
         mass = self._data_cache['mass']
     except:
         chemicals = self.chemicals
-        mol = self.data
-        mass = np.zeros_like(mol, dtype=object)
-        for i, chem in enumerate(chemicals):
-            mass[i] = MassFlowProperty(chem.ID, mol, i, chem.MW)
         self._data_cache['mass'] = mass = ChemicalMassFlowIndexer.from_data(
-                                                        property_array(mass),
-                                                        self._phase, chemicals,
-                                                        False)
+                                                MassFlowData(self.data, chemicals.MW),
+                                                self._phase, chemicals,
+                                                False)
     return mass
 ChemicalMolarFlowIndexer.by_mass = by_mass
 
@@ -681,42 +841,14 @@ def by_mass(self):
     try:
         mass = self._data_cache['mass']
     except:
-        phases = self.phases
         chemicals = self.chemicals
-        mol = self.data
-        mass = np.zeros_like(mol, dtype=object)
-        for i, phase in enumerate(phases):
-            for j, chem in enumerate(chemicals):
-                index = (i, j)
-                mass[index] = MassFlowProperty(chem.ID, mol, index, chem.MW)
         self._data_cache['mass'] = mass = MassFlowIndexer.from_data(
-                                                        property_array(mass),
-                                                        phases, chemicals,
-                                                        False)
+                                                MassFlowData(self.data, chemicals.MW),
+                                                self.phases, chemicals,
+                                                False)
     return mass
 MolarFlowIndexer.by_mass = by_mass; del by_mass
 
-
-# %% Volumetric flow properties
-
-@PropertyFactory(slots=('name', 'mol', 'index', 'V',
-                        'TP', 'phase', 'phase_container'))
-def VolumetricFlowProperty(self):
-    """Volumetric flow (m^3/hr)."""
-    f_mol = self.mol[self.index] 
-    phase = self.phase or self.phase_container.phase
-    V = getattr(self.V, phase) if hasattr(self.V, phase) else self.V
-    return 1000. * f_mol * V(*self.TP) if f_mol else 0.
-    
-@VolumetricFlowProperty.setter
-def VolumetricFlowProperty(self, value):
-    if value:
-        phase = self.phase or self.phase_container.phase
-        V = getattr(self.V, phase) if hasattr(self.V, phase) else self.V
-        self.mol[self.index] = value / V(*self.TP) / 1000.
-    else:
-        self.mol[self.index] = 0.
-
 def by_volume(self, TP):
     """Return a ChemicalVolumetricFlowIndexer that references this object's molar data.
     
@@ -729,15 +861,10 @@ def by_volume(self, TP):
         vol = self._data_cache[TP]
     except:
         chemicals = self.chemicals
-        mol = self.data
-        vol = np.zeros_like(mol, dtype=object)
-        for i, chem in enumerate(chemicals):
-            vol[i] = VolumetricFlowProperty(chem.ID, mol, i, chem.V,
-                                            TP, None, self._phase)
         self._data_cache[TP] = \
-        vol = ChemicalVolumetricFlowIndexer.from_data(property_array(vol),
-                                                      self._phase, chemicals,
-                                                      False)
+        vol = ChemicalVolumetricFlowIndexer.from_data(
+                    VolumetricFlowData(self.data, chemicals, TP, self._phase),
+                    self._phase, chemicals, False)
     return vol
 ChemicalMolarFlowIndexer.by_volume = by_volume
 	
@@ -754,18 +881,9 @@ def by_volume(self, TP):
     except:
         phases = self.phases
         chemicals = self.chemicals
-        mol = self.data
-        vol = np.zeros_like(mol, dtype=object)
-        for i, phase in enumerate(phases):
-            for j, chem in enumerate(chemicals):
-                index = i, j
-                phase_name = tmo.settings._phase_names[phase]
-                vol[index] = VolumetricFlowProperty(f"{phase_name}{chem.ID}", 
-                                                    mol, index, chem.V, TP, phase)
         self._data_cache[TP] = \
-        vol = VolumetricFlowIndexer.from_data(property_array(vol),
-                                              phases, chemicals,
-                                              False)
+        vol = VolumetricFlowIndexer.from_data(
+                    VolumetricFlowData(self.data, chemicals, TP, phases),
+                    phases, chemicals, False)
     return vol
 MolarFlowIndexer.by_volume = by_volume; del by_volume
-del PropertyFactory
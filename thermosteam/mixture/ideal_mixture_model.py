@@ -46,12 +46,35 @@ class IdealMixtureModel:
     84902.48775
     
     """
-    __slots__ = ('var', 'models',)
+    __slots__ = ('var', '_models', '_loader')
 
     def __init__(self, models, var):
-        self.models = tuple(models)
+        self._models = tuple(models)
+        self._loader = None
         self.var = var
 
+    @classmethod
+    def lazy(cls, loader, var):
+        """
+        Return an IdealMixtureModel object that only loads its models (by 
+        calling `loader` with no arguments) when first needed.
+        
+        """
+        self = cls.__new__(cls)
+        self._models = None
+        self._loader = loader
+        self.var = var
+        return self
+
+    @property
+    def models(self):
+        """tuple[function(T, P)] Chemical property functions."""
+        models = self._models
+        if models is None:
+            self._models = models = tuple(self._loader())
+            self._loader = None
+        return models
+
     def __call__(self, mol, T, P=None):
         return sum([j * i(T, P) for i, j in zip(self.models, mol) if j])
     
@@ -9,6 +9,7 @@
 All Mixture object builders.
 
 """
+from functools import partial
 from ..base import PhaseMixtureHandle
 from .ideal_mixture_model import IdealMixtureModel
 from .mixture import Mixture
@@ -17,32 +18,46 @@ __all__ = ('ideal_mixture',)
 
 # %% Functions
 
-def group_handles_by_phase(phase_handles):
+def get_phase_handles(phase_handles, phase):
     hasfield = hasattr
     getfield = getattr
     iscallable = callable
-    handles_by_phase = {'s': [],
-                        'l': [],
-                        'g': []}
-    for phase, handles in handles_by_phase.items():
-        for phase_handle in phase_handles:
-            if iscallable(phase_handle) and hasfield(phase_handle, phase):
-                prop = getfield(phase_handle, phase)
-            else:
-                prop = phase_handle
-            handles.append(prop)
-    return handles_by_phase
+    handles = []
+    for phase_handle in phase_handles:
+        if iscallable(phase_handle) and hasfield(phase_handle, phase):
+            prop = getfield(phase_handle, phase)
+        else:
+            prop = phase_handle
+        handles.append(prop)
+    return handles
+
+def get_chemical_handles(chemicals, var, phase=None):
+    getfield = getattr
+    handles = [getfield(i, var) for i in chemicals]
+    return get_phase_handles(handles, phase) if phase else handles
     
-def build_ideal_PhaseMixtureHandle(chemicals, var):
+def build_ideal_PhaseMixtureHandle(chemicals, var, lazy=False):
     setfield = object.__setattr__
-    getfield = getattr
-    phase_handles = [getfield(i, var) for i in chemicals]
     new = PhaseMixtureHandle.__new__(PhaseMixtureHandle)
-    for phase, handles in group_handles_by_phase(phase_handles).items():
-        setfield(new, phase, IdealMixtureModel(handles, var))
+    if lazy:
+        for phase in ('s', 'l', 'g'):
+            loader = partial(get_chemical_handles, chemicals, var, phase)
+            setfield(new, phase, IdealMixtureModel.lazy(loader, var))
+    else:
+        phase_handles = get_chemical_handles(chemicals, var)
+        for phase in ('s', 'l', 'g'):
+            handles = get_phase_handles(phase_handles, phase)
+            setfield(new, phase, IdealMixtureModel(handles, var))
     setfield(new, 'var', var)
     return new
 
+def build_ideal_MixtureModel(chemicals, var, lazy=False):
+    if lazy:
+        loader = partial(get_chemical_handles, chemicals, var)
+        return IdealMixtureModel.lazy(loader, var)
+    else:
+        return IdealMixtureModel(get_chemical_handles(chemicals, var), var)
+
 # %% Ideal mixture model builder 
 
 def ideal_mixture(chemicals,
@@ -74,17 +89,18 @@ def ideal_mixture(chemicals,
 
     """
     chemicals = tuple(chemicals)
-    getfield = getattr
     Cn =  build_ideal_PhaseMixtureHandle(chemicals, 'Cn')
     H =  build_ideal_PhaseMixtureHandle(chemicals, 'H')
     S = build_ideal_PhaseMixtureHandle(chemicals, 'S')
     H_excess = build_ideal_PhaseMixtureHandle(chemicals, 'H_excess')
     S_excess = build_ideal_PhaseMixtureHandle(chemicals, 'S_excess')
-    mu = build_ideal_PhaseMixtureHandle(chemicals, 'mu')
     V = build_ideal_PhaseMixtureHandle(chemicals, 'V')
-    kappa = build_ideal_PhaseMixtureHandle(chemicals, 'kappa')
-    Hvap = IdealMixtureModel([getfield(i, 'Hvap') for i in chemicals], 'Hvap')
-    sigma = IdealMixtureModel([getfield(i, 'sigma') for i in chemicals], 'sigma')
-    epsilon = IdealMixtureModel([getfield(i, 'epsilon') for i in chemicals], 'epsilon')
+    Hvap = build_ideal_MixtureModel(chemicals, 'Hvap')
+    # Transport and interfacial properties are seldom needed, so chemical 
+    # model handles are not accessed (nor built) until first used
+    mu = build_ideal_PhaseMixtureHandle(chemicals, 'mu', lazy=True)
+    kappa = build_ideal_PhaseMixtureHandle(chemicals, 'kappa', lazy=True)
+    sigma = build_ideal_MixtureModel(chemicals, 'sigma', lazy=True)
+    epsilon = build_ideal_MixtureModel(chemicals, 'epsilon', lazy=True)
     return Mixture('ideal mixing', Cn, H, S, H_excess, S_excess,
                    mu, V, kappa, Hvap, sigma, epsilon, include_excess_energies)
\ No newline at end of file
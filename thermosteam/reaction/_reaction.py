@@ -350,7 +350,7 @@ class Reaction:
         >>> reaction.adiabatic_reaction(s2)
         >>> s2.show() # After adiabatic reaction
         Stream: s2
-         phase: 'l', T: 323.97 K, P: 101325 Pa
+         phase: 'l', T: 324.16 K, P: 101325 Pa
          flow (kmol/hr): H2   3
                          O2   16.5
                          H2O  1.01e+03
@@ -746,7 +746,7 @@ class ParallelReaction(ReactionSet):
         >>> reaction.adiabatic_reaction(s2)
         >>> s2.show() # After adiabatic reaction
         Stream: s2
-         phase: 'l', T: 328.82 K, P: 101325 Pa
+         phase: 'l', T: 329.01 K, P: 101325 Pa
          flow (kmol/hr): H2   3
                          CH4  4.5
                          O2   96
@@ -859,7 +859,7 @@ class SeriesReaction(ReactionSet):
         >>> reaction.adiabatic_reaction(s2)
         >>> s2.show() # After adiabatic reaction
         Stream: s2
-         phase: 'l', T: 326.13 K, P: 101325 Pa
+         phase: 'l', T: 326.46 K, P: 101325 Pa
          flow (kmol/hr): CH4  1.5
                          CO   3.15
                          O2   94.6
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+This module contains functions for exporting and importing the data of
+many streams at once as NumPy structured arrays, Apache Arrow tables, and
+Parquet files.
+
+Molar flow rates are stored by phase as contiguous blocks with a row for
+each stream and a column for each chemical (in the order of the chemicals
+of the property package). Arrow columns wrap these blocks without copying
+and streams created by the loaders reference rows of a single block, so no
+per-stream copies of flow rate data are made.
+
+"""
+import thermosteam as tmo
+import numpy as np
+from .indexer import MaterialIndexer, MolarFlowIndexer
+from .exceptions import UndefinedPhase
+
+__all__ = ('streams_to_array', 'streams_from_array',
+           'streams_to_arrow', 'streams_from_arrow',
+           'write_parquet', 'read_parquet')
+
+# %% Utilities
+
+def import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError: # pragma: no cover
+        raise ImportError("pyarrow is required for exporting to Arrow tables "
+                          "and Parquet files; install it with `pip install pyarrow`")
+    return pyarrow
+
+def property_name_and_units(property):
+    if isinstance(property, str):
+        return property, None
+    else:
+        name, units = property
+        return name, units
+
+def get_chemicals(streams):
+    chemicals = streams[0].chemicals
+    for i in streams:
+        if i.chemicals is not chemicals:
+            raise ValueError('all streams must have the same chemicals defined')
+    return chemicals
+
+def get_stream_phases(stream):
+    imol = stream._imol
+    return imol._phases if isinstance(imol, MaterialIndexer) else (imol.phase,)
+
+def stream_columns(streams, properties, phases):
+    """Return dictionary of columns with stream data."""
+    streams = list(streams)
+    if not streams: raise ValueError('at least one stream must be given')
+    chemicals = get_chemicals(streams)
+    if phases is None:
+        phases = set()
+        for i in streams: phases.update(get_stream_phases(i))
+    phases = tuple(sorted(phases))
+    phase_index = {j: i for i, j in enumerate(phases)}
+    M = len(phases)
+    S = len(streams)
+    N = chemicals.size
+    mol = np.zeros([M, S, N])
+    T = np.zeros(S)
+    P = np.zeros(S)
+    stream_phases = []
+    for i, stream in enumerate(streams):
+        imol = stream._imol
+        T[i], P[i] = stream._thermal_condition
+        try:
+            if isinstance(imol, MaterialIndexer):
+                for phase, data in imol: mol[phase_index[phase], i] = data
+                stream_phases.append(''.join(imol._phases))
+            else:
+                phase = imol.phase
+                mol[phase_index[phase], i] = imol._data
+                stream_phases.append(phase)
+        except KeyError as error:
+            raise UndefinedPhase(error.args[0])
+    columns = {'ID': [i.ID for i in streams],
+               'phase': stream_phases,
+               'T': T,
+               'P': P}
+    for i, phase in enumerate(phases): columns['mol_' + phase] = mol[i]
+    for property in properties:
+        name, units = property_name_and_units(property)
+        if name in columns:
+            raise ValueError(f"property '{name}' is already exported as a field")
+        if units:
+            columns[name] = np.array([i.get_property(name, units) for i in streams], float)
+        else:
+            columns[name] = np.array([getattr(i, name) for i in streams], float)
+    return chemicals, phases, columns
+
+def streams_from_columns(IDs, stream_phases, T, P, mol, phases, thermo, register):
+    """Return a list of streams that reference rows of the molar flow rate block."""
+    chemicals = thermo.chemicals
+    phase_index = {j: i for i, j in enumerate(phases)}
+    streams = []
+    for i, (ID, phase) in enumerate(zip(IDs, stream_phases)):
+        ID = ID if register else None
+        if len(phase) == 1:
+            stream = tmo.Stream(ID, mol[phase_index[phase], i], phase,
+                                T[i], P[i], thermo=thermo)
+        else:
+            multi_phases = tuple(phase)
+            if multi_phases == phases:
+                data = mol[:, i]
+            else:
+                data = mol[[phase_index[j] for j in multi_phases], i]
+            imol = MolarFlowIndexer.from_data(data, multi_phases, chemicals, False)
+            stream = tmo.MultiStream(ID, imol, T[i], P[i], multi_phases,
+                                     thermo=thermo)
+        streams.append(stream)
+    return streams
+
+
+# %% NumPy structured arrays
+
+def streams_to_array(streams, properties=(), phases=None):
+    """
+    Return a NumPy structured array with the data of all streams.
+
+    Parameters
+    ----------
+    streams : Iterable[Stream]
+        Streams to export. All streams must have the same chemicals.
+    properties : Iterable[str or tuple[str, str]], optional
+        Names of stream properties to include. Units of measure may be
+        given by passing (name, units) pairs.
+    phases : Iterable[str], optional
+        Phases of molar flow rate fields. Defaults to all phases present.
+
+    Notes
+    -----
+    The array has an 'ID', 'phase' (phases of MultiStream objects are joined),
+    'T', and 'P' field, a 'mol_<phase>' field for each phase holding the
+    molar flow rates of all chemicals [kmol/hr], and a field for each property.
+
+    Examples
+    --------
+    >>> import thermosteam as tmo
+    >>> tmo.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    >>> s1 = tmo.Stream('s1', Water=2, Ethanol=1, T=300)
+    >>> s2 = tmo.MultiStream('s2', l=[('Water', 1)], g=[('Ethanol', 2)], T=360)
+    >>> array = tmo.stream_io.streams_to_array([s1, s2], properties=['F_mass'])
+    >>> array['phase']
+    array(['l', 'gl'], dtype='<U2')
+    >>> array['mol_l']
+    array([[2., 1.],
+           [1., 0.]])
+    >>> array['F_mass']
+    array([ 82.099, 110.152])
+
+    """
+    chemicals, phases, columns = stream_columns(streams, properties, phases)
+    N = chemicals.size
+    ID_size = max([len(i) for i in columns['ID']])
+    phase_size = max([len(i) for i in columns['phase']])
+    dtype = [('ID', f'U{ID_size}'), ('phase', f'U{phase_size}')]
+    for name, values in columns.items():
+        if name in ('ID', 'phase'): continue
+        if name.startswith('mol_'):
+            dtype.append((name, float, (N,)))
+        else:
+            dtype.append((name, float))
+    array = np.empty(len(columns['T']), dtype)
+    for name, values in columns.items(): array[name] = values
+    return array
+
+def streams_from_array(array, thermo=None, register=False):
+    """
+    Return a list of Stream and MultiStream objects from a structured array
+    created with `streams_to_array`.
+
+    Parameters
+    ----------
+    array : ndarray
+        Structured array with stream data.
+    thermo : Thermo, optional
+        Property package with the same chemicals as the exported streams.
+        Defaults to `thermosteam.settings.get_thermo()`.
+    register : bool, optional
+        Whether to register streams with their original IDs. Defaults to False.
+
+    Examples
+    --------
+    >>> import thermosteam as tmo
+    >>> tmo.settings.set_thermo(['Water', 'Ethanol'], cache=True)
+    >>> s1 = tmo.Stream('s1', Water=2, Ethanol=1, T=300)
+    >>> s2 = tmo.MultiStream('s2', l=[('Water', 1)], g=[('Ethanol', 2)], T=360)
+    >>> array = tmo.stream_io.streams_to_array([s1, s2])
+    >>> streams = tmo.stream_io.streams_from_array(array)
+    >>> streams[1].imol.show()
+    MolarFlowIndexer (kmol/hr):
+     (g) Ethanol   2
+     (l) Water     1
+    >>> streams[1].T
+    360.0
+
+    """
+    thermo = tmo.settings.get_default_thermo(thermo)
+    names = array.dtype.names
+    phases = tuple(sorted([i[4:] for i in names if i.startswith('mol_')]))
+    mol = np.array([array['mol_' + i] for i in phases], float)
+    if mol.shape[-1] != thermo.chemicals.size:
+        raise ValueError('number of chemicals in molar flow rate data must be '
+                         'equal to the number of chemicals in the property package')
+    return streams_from_columns(array['ID'], array['phase'], array['T'], array['P'],
+                                mol, phases, thermo, register)
+
+
+# %% Apache Arrow and Parquet
+
+def streams_to_arrow(streams, properties=(), phases=None):
+    """
+    Return a pyarrow Table with the data of all streams. Molar flow rates are
+    stored as fixed-size list columns ('mol_<phase>') that wrap contiguous
+    blocks without copying. The IDs of chemicals are stored in the schema
+    metadata.
+
+    Parameters
+    ----------
+    streams : Iterable[Stream]
+        Streams to export. All streams must have the same chemicals.
+    properties : Iterable[str or tuple[str, str]], optional
+        Names of stream properties to include. Units of measure may be
+        given by passing (name, units) pairs.
+    phases : Iterable[str], optional
+        Phases of molar flow rate columns. Defaults to all phases present.
+
+    """
+    pa = import_pyarrow()
+    chemicals, phases, columns = stream_columns(streams, properties, phases)
+    N = chemicals.size
+    arrays = []
+    for name, values in columns.items():
+        if name.startswith('mol_'):
+            values = pa.FixedSizeListArray.from_arrays(pa.array(values.ravel()), N)
+        else:
+            values = pa.array(values)
+        arrays.append(values)
+    metadata = {'chemicals': ','.join(chemicals.IDs),
+                'phases': ''.join(phases)}
+    return pa.Table.from_arrays(arrays, names=list(columns), metadata=metadata)
+
+def streams_from_arrow(table, thermo=None, register=False):
+    """
+    Return a list of Stream and MultiStream objects from a pyarrow Table
+    created with `streams_to_arrow`. Flow rates of chemicals are matched by
+    ID, so the property package may define chemicals in any order (or
+    additional chemicals).
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        Table with stream data.
+    thermo : Thermo, optional
+        Property package. Defaults to `thermosteam.settings.get_thermo()`.
+    register : bool, optional
+        Whether to register streams with their original IDs. Defaults to False.
+
+    """
+    thermo = tmo.settings.get_default_thermo(thermo)
+    metadata = table.schema.metadata
+    IDs = tuple(metadata[b'chemicals'].decode().split(','))
+    phases = tuple(metadata[b'phases'].decode())
+    S = table.num_rows
+    N = len(IDs)
+    chemicals = thermo.chemicals
+    if IDs == chemicals.IDs:
+        mol = np.empty([len(phases), S, N])
+        for i, phase in enumerate(phases):
+            values = table.column('mol_' + phase).combine_chunks().flatten()
+            mol[i] = values.to_numpy().reshape([S, N])
+    else:
+        index = chemicals.get_index(IDs)
+        mol = np.zeros([len(phases), S, chemicals.size])
+        for i, phase in enumerate(phases):
+            values = table.column('mol_' + phase).combine_chunks().flatten()
+            mol[i][:, index] = values.to_numpy().reshape([S, N])
+    return streams_from_columns(table.column('ID').to_pylist(),
+                                table.column('phase').to_pylist(),
+                                table.column('T').to_numpy(),
+                                table.column('P').to_numpy(),
+                                mol, phases, thermo, register)
+
+def write_parquet(streams, file, properties=(), phases=None, **kwargs):
+    """
+    Write the data of all streams to a Parquet file. Additional keyword
+    arguments are passed to `pyarrow.parquet.write_table`.
+
+    Parameters
+    ----------
+    streams : Iterable[Stream]
+        Streams to export. All streams must have the same chemicals.
+    file : str
+        Path of Parquet file.
+    properties : Iterable[str or tuple[str, str]], optional
+        Names of stream properties to include. Units of measure may be
+        given by passing (name, units) pairs.
+    phases : Iterable[str], optional
+        Phases of molar flow rate columns. Defaults to all phases present.
+
+    """
+    import_pyarrow()
+    import pyarrow.parquet as pq
+    pq.write_table(streams_to_arrow(streams, properties, phases), file, **kwargs)
+
+def read_parquet(file, thermo=None, register=False):
+    """
+    Return a list of Stream and MultiStream objects from a Parquet file
+    written with `write_parquet`.
+
+    Parameters
+    ----------
+    file : str
+        Path of Parquet file.
+    thermo : Thermo, optional
+        Property package. Defaults to `thermosteam.settings.get_thermo()`.
+    register : bool, optional
+        Whether to register streams with their original IDs. Defaults to False.
+
+    """
+    import_pyarrow()
+    import pyarrow.parquet as pq
+    return streams_from_arrow(pq.read_table(file), thermo, register)
@@ -11,6 +11,7 @@ __all__ = ('chemical_units_of_measure',
            'stream_units_of_measure',
            'ureg', 'get_dimensionality',
            'DisplayUnits', 'AbsoluteUnitsOfMeasure', 'convert',
+           'get_conversion_factor_and_offset',
            'Quantity', 'format_units', 'format_plot_units')
 
 from .exceptions import DimensionError
@@ -19,13 +20,13 @@ from .exceptions import DimensionError
 
 from pint import UnitRegistry
 from pint.quantity import to_units_container
+import numpy as np
 import os
 
 # Set pint Unit Registry
 ureg = UnitRegistry()
 ureg.default_format = '~P'
 ureg.load_definitions(os.path.dirname(os.path.realpath(__file__)) + '/units_of_measure.txt')
-convert = ureg.convert
 Quantity = ureg.Quantity
 del os, UnitRegistry
 
@@ -104,6 +105,51 @@ def get_dimensionality(units, cache={}):
 
 # %% Manage conversion factors
 
+def get_conversion_factor_and_offset(from_units, to_units, cache={}):
+    """
+    Return the factor and offset that convert values from given units
+    (i.e. `converted_value = factor * value + offset`). Conversions are 
+    computed by pint only once and cached by units of measure.
+    
+    Examples
+    --------
+    >>> get_conversion_factor_and_offset('kg/hr', 'g/s')
+    (0.277..., 0.0)
+    >>> get_conversion_factor_and_offset('K', 'degC')
+    (1.0, -273.15)
+    >>> get_conversion_factor_and_offset('degC', 'degF')
+    (1.8, 32.0...)
+    
+    """
+    key = (from_units, to_units)
+    if key in cache:
+        factor_and_offset = cache[key]
+    else:
+        offset = ureg.convert(0., from_units, to_units) # Also checks dimensions
+        # The factor is the ratio of the multiplicative conversions to root
+        # units, which excludes the offset of temperature scales
+        from_factor, _ = ureg._get_root_units(to_units_container(from_units, ureg))
+        to_factor, _ = ureg._get_root_units(to_units_container(to_units, ureg))
+        cache[key] = factor_and_offset = (from_factor / to_factor, offset)
+    return factor_and_offset
+
+def convert(value, from_units, to_units):
+    """
+    Return value(s) converted from given units of measure. Arrays are 
+    converted as a whole.
+    
+    Examples
+    --------
+    >>> convert(1., 'atm', 'Pa')
+    101325.0
+    >>> convert([273.15, 373.15], 'K', 'degC')
+    array([  0., 100.])
+    
+    """
+    factor, offset = get_conversion_factor_and_offset(from_units, to_units)
+    if value.__class__ in (list, tuple): value = np.array(value, dtype=float)
+    return factor * value + offset if offset else factor * value
+
 class UnitsOfMeasure:
     __slots__ = ('_units', '_units_container', '_dimensionality')
     
@@ -148,7 +194,7 @@ class AbsoluteUnitsOfMeasure(UnitsOfMeasure):
         if to_units in cache:
             factor = cache[to_units]
         else:
-            cache[to_units] = factor = ureg.convert(1., self._units_container, to_units)
+            cache[to_units] = factor = get_conversion_factor_and_offset(self._units_container, to_units)[0]
         return factor
     
     def convert(self, value, to_units):
@@ -177,13 +223,14 @@ class RelativeUnitsOfMeasure(UnitsOfMeasure):
             return self
     
     def conversion_factor(self, to_units):
-        return ureg.convert(1., self._units_container, to_units)
+        return convert(1., self._units_container, to_units)
     
     def convert(self, value, to_units):
-        return ureg.convert(value, self._units_container, to_units)
+        return convert(value, self._units_container, to_units)
     
     def unconvert(self, value, to_units):
-        return ureg.convert(value, to_units, self._units_container)
+        factor, offset = get_conversion_factor_and_offset(self._units_container, to_units)
+        return (value - offset) / factor
 
 
 # %% Manage display units
@@ -12,6 +12,8 @@ from . import representation
 from . import decorators
 from . import other
 from . import cache
+from . import disk_cache
+from . import shared_memory
 from . import registry
 from . import colors
 from . import plots
@@ -21,6 +23,8 @@ __all__ = (*pickle.__all__,
            *decorators.__all__,
            *other.__all__,
            *cache.__all__,
+           *disk_cache.__all__,
+           *shared_memory.__all__,
            *registry.__all__,
            *colors.__all__,
            *plots.__all__,
@@ -31,6 +35,8 @@ from .representation import *
 from .decorators import *
 from .other import *
 from .cache import *
+from .disk_cache import *
+from .shared_memory import *
 from .registry import *
 from .colors import *
 from .plots import *
\ No newline at end of file
@@ -7,8 +7,14 @@
 # for license details.
 """
 """
+import sys
+import gc
+from threading import RLock
+from types import ModuleType, FunctionType, BuiltinFunctionType
+from collections import OrderedDict
+from numbers import Integral
 
-__all__ = ('Cache', 'trim_cache') 
+__all__ = ('Cache', 'LRUCache', 'CacheStatistics', 'trim_cache', 'get_deep_size') 
 
 class Cache:
     __slots__ = ('args', 'value')
@@ -38,4 +44,241 @@ class Cache:
     
 def trim_cache(cache, size=100): # pragma: no cover
     if cache.__len__() > size: 
-        del cache[cache.__iter__().__next__()]
\ No newline at end of file
+        try: del cache[cache.__iter__().__next__()]
+        except (KeyError, RuntimeError, StopIteration): pass # Trimmed by another thread
+
+
+# %% Least recently used cache
+
+_shared_types = (type, ModuleType, FunctionType, BuiltinFunctionType)
+
+#: Default of optional arguments that are left unchanged
+unchanged = object()
+
+def get_deep_size(obj):
+    """
+    Return the approximate memory [bytes] used by an object and all objects it
+    references, excluding classes, modules, and functions (which are shared).
+    
+    """
+    isa = isinstance
+    getsizeof = sys.getsizeof
+    seen = set()
+    objs = [obj]
+    size = 0
+    while objs:
+        referents = []
+        for i in objs:
+            key = id(i)
+            if key in seen or isa(i, _shared_types): continue
+            seen.add(key)
+            size += getsizeof(i)
+            referents.append(i)
+        objs = gc.get_referents(*referents)
+    return size
+
+
+class CacheStatistics:
+    """
+    Create a CacheStatistics object that records the hits, misses, and 
+    evictions of a cache.
+    
+    """
+    __slots__ = ('hits', 'misses', 'evictions')
+    
+    def __init__(self, hits=0, misses=0, evictions=0):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+    
+    @property
+    def hit_ratio(self):
+        """[float] Fraction of lookups found in the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.
+    
+    def __repr__(self):
+        return (f"{type(self).__name__}(hits={self.hits}, misses={self.misses}, "
+                f"evictions={self.evictions})")
+
+
+def check_limit(name, limit):
+    if limit is None: return None
+    if isinstance(limit, bool) or not isinstance(limit, Integral):
+        raise TypeError(f"{name} must be an integer or None, not a '{type(limit).__name__}' object")
+    if limit < 0:
+        raise ValueError(f"{name} must be non-negative, not {limit}")
+    return int(limit)
+
+class LRUCache:
+    """
+    Create an LRUCache object that holds up to a given number of items 
+    (and optionally, up to a given memory budget) and evicts the least 
+    recently used items first.
+    
+    Parameters
+    ----------
+    capacity : int, optional
+        Maximum number of items. Defaults to 100. None removes the limit.
+    max_bytes : int, optional
+        Maximum approximate memory of all items [bytes]. Defaults to no limit.
+    sizeof : function(obj) -> int, optional
+        Returns the approximate memory of an item. Defaults to `get_deep_size`.
+    
+    Notes
+    -----
+    Only lookups through the `get` method count towards the statistics and 
+    update the recency of items. All operations hold a lock, so caches may 
+    be shared by threads. The memory of items is only computed when
+    a memory budget is given or when `nbytes` or `memory_usage` are used.
+    
+    Examples
+    --------
+    >>> from thermosteam.utils import LRUCache
+    >>> cache = LRUCache(capacity=2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3 # Evicts 'b', the least recently used item
+    >>> list(cache)
+    ['a', 'c']
+    >>> cache.get('b') # Returns None when not found
+    >>> cache.stats
+    CacheStatistics(hits=1, misses=1, evictions=1)
+    >>> cache.resize(1)
+    >>> list(cache)
+    ['c']
+    >>> cache.resize(max_bytes=1000)
+    >>> cache.resize(max_bytes=None) # Removes memory budget
+    >>> cache
+    LRUCache(capacity=1, max_bytes=None)
+    >>> cache.resize(None) # Removes item limit
+    >>> cache['d'] = 4
+    >>> list(cache)
+    ['c', 'd']
+    
+    """
+    __slots__ = ('_data', '_sizes', '_capacity', '_max_bytes', 
+                 'sizeof', 'stats', '_lock')
+    
+    def __init__(self, capacity=100, max_bytes=None, sizeof=None):
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._capacity = check_limit('capacity', capacity)
+        self._max_bytes = check_limit('max_bytes', max_bytes)
+        self.sizeof = sizeof or get_deep_size
+        self.stats = CacheStatistics()
+        self._lock = RLock()
+    
+    @property
+    def capacity(self):
+        """[int or None] Maximum number of items."""
+        return self._capacity
+    
+    @property
+    def max_bytes(self):
+        """[int or None] Maximum approximate memory of all items [bytes]."""
+        return self._max_bytes
+    
+    def _size(self, key):
+        sizes = self._sizes
+        if key in sizes: return sizes[key]
+        sizes[key] = size = self.sizeof(self._data[key])
+        return size
+    
+    @property
+    def nbytes(self):
+        """[int] Approximate memory of all items [bytes]."""
+        size = self._size
+        with self._lock: return sum([size(i) for i in self._data])
+    
+    def memory_usage(self):
+        """Return a dictionary of the approximate memory of each item [bytes]."""
+        size = self._size
+        with self._lock: return {i: size(i) for i in self._data}
+    
+    def get(self, key, default=None):
+        """Return item and mark it as recently used, or return the default 
+        if not in cache."""
+        data = self._data
+        with self._lock:
+            if key in data:
+                self.stats.hits += 1
+                data.move_to_end(key)
+                return data[key]
+            else:
+                self.stats.misses += 1
+                return default
+    
+    def __getitem__(self, key):
+        return self._data[key]
+    
+    def __setitem__(self, key, value):
+        data = self._data
+        with self._lock:
+            data[key] = value
+            data.move_to_end(key)
+            self._sizes.pop(key, None)
+            self._evict()
+    
+    def setdefault(self, key, value):
+        """Return item if in cache; otherwise, add and return the given value."""
+        data = self._data
+        with self._lock:
+            if key in data: return data[key]
+            self[key] = value
+            return value
+    
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+            self._sizes.pop(key, None)
+    
+    def __contains__(self, key):
+        return key in self._data
+    
+    def __iter__(self):
+        with self._lock: return iter(list(self._data))
+    
+    def __len__(self):
+        return len(self._data)
+    
+    def _evict(self):
+        data = self._data
+        sizes = self._sizes
+        stats = self.stats
+        capacity = self._capacity
+        if capacity is not None:
+            while len(data) > capacity:
+                key, _ = data.popitem(last=False)
+                sizes.pop(key, None)
+                stats.evictions += 1
+        max_bytes = self._max_bytes
+        if max_bytes is not None:
+            nbytes = self.nbytes
+            while data and nbytes > max_bytes:
+                key, _ = data.popitem(last=False)
+                nbytes -= sizes.pop(key)
+                stats.evictions += 1
+    
+    def resize(self, capacity=unchanged, max_bytes=unchanged):
+        """Set the maximum number of items and/or the memory budget [bytes] 
+        and evict least recently used items until both limits are met. 
+        A limit of None removes the limit."""
+        if capacity is not unchanged: capacity = check_limit('capacity', capacity)
+        if max_bytes is not unchanged: max_bytes = check_limit('max_bytes', max_bytes)
+        with self._lock:
+            if capacity is not unchanged: self._capacity = capacity
+            if max_bytes is not unchanged: self._max_bytes = max_bytes
+            self._evict()
+    
+    def clear(self, stats=True):
+        """Remove all items (and reset statistics if `stats` is True)."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            if stats: self.stats = CacheStatistics()
+    
+    def __repr__(self):
+        return f"{type(self).__name__}(capacity={self._capacity}, max_bytes={self._max_bytes})"
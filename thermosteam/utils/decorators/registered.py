@@ -7,6 +7,7 @@
 # for license details.
 """
 """
+from threading import Lock
 from ..registry import Registry
 
 __all__ = ('registered',)
@@ -29,17 +30,22 @@ def _registered(cls, ticket_name):
     cls.__str__ = __str__
     return cls
 
+# Tickets are taken by one thread at a time so that default IDs are unique
+ticket_lock = Lock()
+
 @classmethod
 def _take_ticket(cls):
-    cls.ticket_number += 1
-    return cls.ticket_name + str(cls.ticket_number)
+    with ticket_lock:
+        cls.ticket_number += 1
+        return cls.ticket_name + str(cls.ticket_number)
 @classmethod
 def _take_unregistered_ticket(cls):
-    if cls.unregistered_ticket_number > 100:
-       cls.unregistered_ticket_number = 1 
-    else:
-        cls.unregistered_ticket_number += 1
-    return cls.ticket_name + '.' + str(cls.unregistered_ticket_number)
+    with ticket_lock:
+        if cls.unregistered_ticket_number > 100:
+           cls.unregistered_ticket_number = 1 
+        else:
+            cls.unregistered_ticket_number += 1
+        return cls.ticket_name + '.' + str(cls.unregistered_ticket_number)
 
 def _unregister(self):
     try: delattr(self.registry, self._ID)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import os
+import pickle
+import hashlib
+import tempfile
+
+__all__ = ('data_version', 'load_cached', 'dump_cached')
+
+_data_version = None
+
+#: File extensions of source code and data tables that define cached data
+data_extensions = frozenset(['.py', '.tsv', '.csv', '.txt', '.json', '.gz', '.zip'])
+
+def package_files(package):
+    # Source and data files (bytecode and other generated files are excluded)
+    directory = os.path.dirname(package.__file__)
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted([i for i in dirs if i != '__pycache__'])
+        for file in sorted(files):
+            if os.path.splitext(file)[1] not in data_extensions: continue
+            path = os.path.join(root, file)
+            yield os.path.relpath(path, directory), os.stat(path)
+
+def data_version():
+    """
+    Return a hexdigest that identifies the installed versions of thermosteam
+    and the chemicals library, including the size and modification time of
+    their source code and data tables.
+
+    """
+    global _data_version
+    if _data_version is None:
+        import thermosteam
+        import chemicals
+        hasher = hashlib.sha1()
+        for package in (thermosteam, chemicals):
+            hasher.update(f"{package.__name__}:{package.__version__}\n".encode())
+            for path, stat in package_files(package):
+                hasher.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+        _data_version = hasher.hexdigest()
+    return _data_version
+
+def cache_file(directory, kind, key):
+    name = hashlib.sha1(repr(key).encode()).hexdigest()
+    return os.path.join(directory, data_version(), kind, name + '.pkl')
+
+def load_cached(directory, kind, key):
+    """
+    Return object cached on disk under given kind and key, or None if not
+    found (or if it cannot be loaded).
+
+    """
+    file = cache_file(directory, kind, key)
+    try:
+        with open(file, 'rb') as f: data = f.read()
+        return pickle.loads(data)
+    except Exception:
+        return None
+
+def dump_cached(directory, kind, key, obj):
+    """
+    Cache object on disk under given kind and key. The file is written
+    atomically so that concurrent processes may share the same directory.
+    Return whether the object was cached (objects that cannot be pickled
+    are not cached).
+
+    """
+    file = cache_file(directory, kind, key)
+    try:
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return False
+    folder = os.path.dirname(file)
+    os.makedirs(folder, exist_ok=True)
+    fd, temporary_file = tempfile.mkstemp(dir=folder, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f: f.write(data)
+        os.replace(temporary_file, file)
+    except: # pragma: no cover
+        os.remove(temporary_file)
+        raise
+    return True
@@ -9,6 +9,7 @@
 """
 __all__ = (
     'fill_like', 
+    'same_objects',
     'getfields', 
     'setfields', 
     'copy_maybe', 
@@ -20,6 +21,9 @@ def fill_like(A, B, fields):
     getfield = getattr
     for i in fields: setfield(A, i, getfield(B, i))
     
+def same_objects(A, B):
+    return len(A) == len(B) and all([i is j for i, j in zip(A, B)])
+
 def getfields(obj, fields, getfield=getattr):
     return [getfield(obj, i) for i in fields]
 
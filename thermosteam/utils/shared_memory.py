@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# BioSTEAM: The Biorefinery Simulation and Techno-Economic Analysis Modules
+# Copyright (C) 2020, Yoel Cortes-Pena <yoelcortes@gmail.com>
+#
+# This module is under the UIUC open-source license. See
+# github.com/BioSTEAMDevelopmentGroup/biosteam/blob/master/LICENSE.txt
+# for license details.
+"""
+"""
+import numpy as np
+from threading import Lock
+from multiprocessing import shared_memory, resource_tracker
+
+__all__ = ('SharedArrays',)
+
+def align(offset, alignment=64):
+    return -(-offset // alignment) * alignment
+
+_tracker_lock = Lock()
+
+def no_register(name, rtype): pass
+
+def attach_shared_memory(name):
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError: # Python < 3.13 always tracks shared memory
+        # Attaching processes must not register the block; otherwise, the 
+        # block is released when they exit (or, if they share the resource
+        # tracker of the publishing process, it is no longer tracked)
+        with _tracker_lock:
+            register = resource_tracker.register
+            resource_tracker.register = no_register
+            try: return shared_memory.SharedMemory(name)
+            finally: resource_tracker.register = register
+
+def attach_shared_arrays(name, layout):
+    return SharedArrays._attach(name, layout)
+
+
+class SharedArrays:
+    """
+    Create a SharedArrays object that publishes arrays in a single
+    shared memory block. SharedArrays objects are pickled by the name of
+    the block, so other processes attach to the same memory (without
+    copying) when unpickling. Attached arrays are read-only.
+
+    Parameters
+    ----------
+    arrays : dict[str, ndarray]
+        Arrays to publish by name.
+
+    Notes
+    -----
+    The publishing process owns the block and must keep the SharedArrays
+    object alive while other processes use it. Call `unlink` when done
+    to release the block.
+
+    Examples
+    --------
+    >>> import pickle
+    >>> import numpy as np
+    >>> from thermosteam.utils import SharedArrays
+    >>> shared = SharedArrays({'MW': np.array([18.015, 46.068])})
+    >>> attached = pickle.loads(pickle.dumps(shared)) # As in a worker process
+    >>> attached['MW']
+    array([18.015, 46.068])
+    >>> attached.close()
+    >>> shared.unlink()
+
+    """
+    __slots__ = ('name', 'layout', 'arrays', 'owner', '_shm')
+
+    def __init__(self, arrays):
+        layout = {}
+        size = 0
+        for key, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            offset = align(size)
+            layout[key] = (array.dtype.str, array.shape, offset)
+            size = offset + array.nbytes
+        self._shm = shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.name = shm.name
+        self.layout = layout
+        self.owner = True
+        self._load_arrays()
+        for key, array in arrays.items():
+            view = self.arrays[key]
+            view.setflags(write=True)
+            view[...] = array
+            view.setflags(write=False)
+
+    @classmethod
+    def _attach(cls, name, layout):
+        self = cls.__new__(cls)
+        self._shm = attach_shared_memory(name)
+        self.name = name
+        self.layout = layout
+        self.owner = False
+        self._load_arrays()
+        return self
+
+    def _load_arrays(self):
+        buffer = self._shm.buf
+        self.arrays = arrays = {}
+        for key, (dtype, shape, offset) in self.layout.items():
+            arrays[key] = array = np.ndarray(shape, dtype, buffer, offset)
+            array.setflags(write=False)
+
+    def __reduce__(self):
+        return attach_shared_arrays, (self.name, self.layout)
+
+    def __getitem__(self, key):
+        return self.arrays[key]
+
+    def __contains__(self, key):
+        return key in self.arrays
+
+    def __iter__(self):
+        return iter(self.arrays)
+
+    def close(self):
+        """Detach from the shared memory block. Arrays of this object
+        (and any views of them) must not be used afterwards."""
+        self.arrays = {}
+        self._shm.close()
+
+    def unlink(self):
+        """Detach from and release the shared memory block (only the
+        publishing process may release it)."""
+        if not self.owner: raise RuntimeError('only the publishing process may unlink shared memory')
+        self.close()
+        self._shm.unlink()
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: {', '.join(self.layout)}>"